@@ -1,3 +1,4 @@
+import hashlib
 import os
 
 files = [
@@ -22,3 +23,11 @@ for f in files:
         print(f"Updated {f}")
     else:
         print(f"File not found: {f}")
+
+# Prüfsumme für den Firmware-Cache der Integration neu schreiben
+if os.path.exists('cyd_solar_display.bin'):
+    with open('cyd_solar_display.bin', 'rb') as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    with open('cyd_solar_display.bin.sha256', 'w', encoding='utf-8') as file:
+        file.write(f"{digest}  cyd_solar_display.bin\n")
+    print("Updated cyd_solar_display.bin.sha256")
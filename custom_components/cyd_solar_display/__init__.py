@@ -1,20 +1,50 @@
+import hashlib
 import logging
+import os
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.components import frontend, panel_custom
 from homeassistant.components.http import StaticPathConfig, HomeAssistantView
 from aiohttp import web
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_BROADCAST_MODE
 from .coordinator import CYDSolarCoordinator
+from .version import async_get_version_checker
+from .fleet import async_register_services
+from .websocket_api import async_register_websocket_commands, config_snapshot, INTERNAL_OPTIONS
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = ["update", "sensor"]
+
+# Optionen, die Discovery und die Update-Entitäten betreffen -> Reload nötig
+RELOAD_OPTIONS = {CONF_BROADCAST_MODE}
+
+
+def _hash_directory(path):
+    """Return a short content hash over all panel files below path."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            digest.update(os.path.relpath(file_path, path).encode())
+            with open(file_path, "rb") as file:
+                digest.update(file.read())
+    return digest.hexdigest()[:12]
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up CYD Solar Display from a config entry."""
     
     coordinator = CYDSolarCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_load_page_state()
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # z.B. ConfigEntryNotReady: Listener und Timer freigeben, sonst stapeln sie sich mit jedem Retry
+        coordinator.async_unload()
+        raise
+    coordinator.async_start_push()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -24,26 +54,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if "api_registered" not in hass.data[DOMAIN]:
         hass.http.register_view(CYDConfigView(hass))
         hass.http.register_view(CYDCheckUpdateView(hass))
+        async_register_websocket_commands(hass)
         hass.data[DOMAIN]["api_registered"] = True
 
-    # Register static files with a FIXED path (no entry_id!)
-    # entry_id would change across restarts, breaking the panel URL
-    static_url = "/cyd_solar_display/static"
+    # Register static files under a content hash (no entry_id!)
+    # entry_id would change across restarts, breaking the panel URL. The hash
+    # changes with every file change, so browsers may cache the panel and its
+    # lazily loaded tab chunks for a long time and still see updates at once.
     if "static_registered" not in hass.data[DOMAIN]:
+        www_path = hass.config.path(f"custom_components/{DOMAIN}/www")
+        www_hash = await hass.async_add_executor_job(_hash_directory, www_path)
+        static_url = f"/cyd_solar_display/static/{www_hash}"
         await hass.http.async_register_static_paths([
-            StaticPathConfig(
-                static_url,
-                hass.config.path(f"custom_components/{DOMAIN}/www"),
-                False   # cache=False so updates are visible immediately
-            )
+            StaticPathConfig(static_url, www_path, True)  # cache headers: content-hashed URL
         ])
-        hass.data[DOMAIN]["static_registered"] = True
+        hass.data[DOMAIN]["static_registered"] = static_url
+    static_url = hass.data[DOMAIN]["static_registered"]
 
     # Stable JS URL (no entry_id dependency)
     js_url = f"{static_url}/cyd-preview.js"
     
-    # NEW: Forward setups to platforms (update)
-    await hass.config_entries.async_forward_entry_setups(entry, ["update"])
+    # Forward setups to platforms (update, diagnostic sensors)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_register_services(hass)
 
     # Register the Sidebar Panel (Robust update logic)
     frontend_panels = hass.data.get("frontend_panels", {})
@@ -75,7 +108,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["update"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
         # Wir entfernen das Panel hier NICHT, da ein Reload (z.B. durch Speichern in der UI) 
@@ -84,37 +117,36 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         if entry.entry_id in hass.data.get(DOMAIN, {}):
             coordinator = hass.data[DOMAIN].pop(entry.entry_id)
-            if hasattr(coordinator, "_unsub_dummy") and coordinator._unsub_dummy:
-                coordinator._unsub_dummy()
+            coordinator.async_unload()
 
     return unload_ok
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    # If the update only contains the last_page sync info, don't reload
-    # We use a simple comparison of other options if needed, but for now 
-    # we just accept that page-syncs might trigger a reload OR we could 
-    # use a flag.
-    
-    # Check if anything OTHER than last_page or _last_sync changed
+    # Nur Änderungen an RELOAD_OPTIONS bauen die Integration neu auf; alles
+    # andere (Labels, Entitäten, Intervalle, Dimmung, ...) übernimmt der
+    # laufende Coordinator direkt.
     old_options = hass.data.get(f"{DOMAIN}_old_options_{entry.entry_id}", {})
     new_options = dict(entry.options)
-    
-    significant_change = False
-    for k, v in new_options.items():
-        if k in ["last_page", "_last_sync"]:
-            continue
-        if old_options.get(k) != v:
-            significant_change = True
-            break
-            
     hass.data[f"{DOMAIN}_old_options_{entry.entry_id}"] = new_options
-    
-    if significant_change:
-        _LOGGER.debug("Significant config change detected, reloading...")
-        await hass.config_entries.async_reload(entry.entry_id)
-    else:
+
+    changed = {
+        k for k in set(old_options) | set(new_options)
+        if k not in INTERNAL_OPTIONS and old_options.get(k) != new_options.get(k)
+    }
+    if not changed:
         _LOGGER.debug("Internal page sync update, skipping reload.")
+        return
+
+    if changed & RELOAD_OPTIONS:
+        _LOGGER.debug("Config change %s needs a reload, reloading...", sorted(changed & RELOAD_OPTIONS))
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    _LOGGER.debug("Applying config change %s without reload", sorted(changed))
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator:
+        coordinator.async_apply_options()
 
 class CYDConfigView(HomeAssistantView):
     """API Endpoint context for panel configuration."""
@@ -131,13 +163,7 @@ class CYDConfigView(HomeAssistantView):
         if not entry:
             return self.json_message("Entry not found", 404)
         
-        coordinator = self.hass.data[DOMAIN].get(entry_id)
-        
-        return self.json({
-            "config": dict(entry.options),
-            "latest_version": coordinator.latest_version if coordinator else "0.0.0",
-            "firmware_update_entity_id": coordinator.data.get("firmware_update_entity_id", "") if coordinator else ""
-        })
+        return self.json(config_snapshot(self.hass, entry))
 
     async def post(self, request: web.Request, entry_id: str) -> web.Response:
         """Update options."""
@@ -165,12 +191,13 @@ class CYDCheckUpdateView(HomeAssistantView):
 
     async def post(self, request: web.Request, entry_id: str) -> web.Response:
         """Force a version check."""
-        coordinator = self.hass.data[DOMAIN].get(entry_id)
-        if not coordinator:
+        if not self.hass.data[DOMAIN].get(entry_id):
             return self.json_message("Coordinator not found", 404)
         
-        updated = await coordinator.async_check_version(force=True)
+        # Ergebnis ist integrationsweit geteilt, alle Coordinators sehen die neue Version
+        checker = async_get_version_checker(self.hass)
+        updated = await checker.async_check(force=True)
         return self.json({
-            "latest_version": coordinator.latest_version,
+            "latest_version": checker.latest_version,
             "updated": updated
         })
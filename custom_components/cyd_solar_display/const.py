@@ -110,6 +110,15 @@ CONF_PAGE_SWITCH_MODE = "page_switch_mode"   # "auto" | "touch" | "both"
 CONF_PAGE_ROTATION_SOURCE = "page_rotation_source" # "ha" | "display"
 CONF_THEME_COLOR = "theme_color"
 CONF_BROADCAST_MODE = "broadcast_mode"
+CONF_PUSH_MODE = "push_mode"                 # True = event-driven, False = classic polling
+CONF_PUSH_DEBOUNCE = "push_debounce"         # seconds to fold bursts of state changes
+CONF_HEARTBEAT_INTERVAL = "heartbeat_interval"  # keep-alive push in push mode (seconds)
+CONF_VERSION_CHECK_INTERVAL = "version_check_interval"  # GitHub version check (hours)
+CONF_DISPLAY_OVERRIDES = "display_overrides"  # {service: {page_interval, fixed_page, push_interval}}
+CONF_PAGE_DWELL = "page_dwell"               # {page: seconds} Anzeigedauer einzelner Seiten
+CONF_RATE_BURST = "rate_burst"               # max. Dienstaufrufe am Stück pro Display
+CONF_RATE_LIMIT = "rate_limit"               # dauerhaft erlaubte Dienstaufrufe pro Sekunde und Display
+CONF_DEADBANDS = "deadbands"                 # {<slot>_entity: {band, percent, min_hold, max_hold}}
 
 PAGE_SWITCH_AUTO  = "auto"
 PAGE_SWITCH_TOUCH = "touch"
@@ -118,4 +127,52 @@ PAGE_SWITCH_BOTH  = "both"
 DEFAULT_PORT = 80
 DEFAULT_UPDATE_INTERVAL = 5
 DEFAULT_PAGE_INTERVAL = 10
+DEFAULT_PUSH_MODE = True
+DEFAULT_PUSH_DEBOUNCE = 0.5
+DEFAULT_HEARTBEAT_INTERVAL = 60
+DEFAULT_VERSION_CHECK_INTERVAL = 6
+DEFAULT_RATE_BURST = 3
+DEFAULT_RATE_LIMIT = 1.0
 DEFAULT_THEME_COLOR = "#fdd835"  # Home Assistant Solar Yellow
+
+# Page state is kept in memory and written lazily to .storage (not to the config entry)
+PAGE_STORE_VERSION = 1
+PAGE_STORE_SAVE_DELAY = 300  # seconds
+
+# --- Slot layout (wire field on the display <-> options key) ---
+# Numeric core values: (service field, entity option key)
+CORE_SLOTS = (
+    ("solar", CONF_SOLAR_ENTITY),
+    ("grid", CONF_GRID_ENTITY),
+    ("house", CONF_HOUSE_ENTITY),
+    ("bat_w", CONF_BATTERY_ENTITY),
+    ("bat_soc", CONF_BATTERY_SOC_ENTITY),
+    ("val_yield", CONF_YIELD_TODAY_ENTITY),
+    ("val_yield_month", CONF_YIELD_MONTH_ENTITY),
+    ("val_yield_year", CONF_YIELD_YEAR_ENTITY),
+    ("val_yield_total", CONF_YIELD_TOTAL_ENTITY),
+    ("grid_in", CONF_GRID_IMPORT_ENTITY),
+    ("grid_out", CONF_GRID_EXPORT_ENTITY),
+)
+
+# Page on which each numeric core value is shown (live values on 1, statistics on 2)
+CORE_SLOT_PAGES = {
+    "solar": 1, "grid": 1, "house": 1, "bat_w": 1, "bat_soc": 1,
+    "val_yield": 2, "val_yield_month": 2, "val_yield_year": 2, "val_yield_total": 2,
+    "grid_in": 2, "grid_out": 2,
+}
+
+# Text slots: (wire index n -> cN_n/cN_v, options prefix -> <prefix>_name/_entity, default name, page)
+# c1-c8 = custom1-8 (Seite 3/4), c9-c12 = mining1-4 (Seite 5), c13-c28 = custom9-24 (Seite 6-9)
+CUSTOM_SLOTS = tuple(
+    [(i, f"custom{i}", f"Custom {i}", 3 + (i - 1) // 4) for i in range(1, 9)]
+    + [(8 + i, f"mining{i}", f"Mining {i}", 5) for i in range(1, 5)]
+    + [(12 + i, f"custom{8 + i}", f"Custom {8 + i}", 6 + (i - 1) // 4) for i in range(1, 17)]
+)
+
+# Verlaufsseite (Diagramm): nur über den Partial-Dienst, daher nicht in PAGE_DEFAULTS
+CHART_PAGE = 10
+CONF_ENABLE_CHART = f"enable_page{CHART_PAGE}"
+
+# Page -> enabled by default
+PAGE_DEFAULTS = {1: True, 2: True, 3: True, 4: True, 5: True, 6: False, 7: False, 8: False, 9: False}
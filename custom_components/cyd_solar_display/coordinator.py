@@ -1,511 +1,840 @@
 import logging
 import json
 import asyncio
-from datetime import timedelta, datetime
-import aiohttp
+import time
+from datetime import timedelta
+from functools import partial
 
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+    async_call_later,
+)
+from homeassistant.helpers.storage import Store
 
+from .discovery import CYDTargetResolver
+from .version import async_get_version_checker, SIGNAL_VERSION_UPDATED
+from .slots import compile_slots
+from .dispatch import DisplayState, TokenBucket, DISPLAY_CALL_TIMEOUT, PUSH_DEFERRED, PUSH_SENT, PUSH_SKIPPED
+from .stats import Stats
+from .history import PowerHistory, HISTORY_SAMPLE_INTERVAL
 from .const import (
     DOMAIN,
     CONF_HOST,
-    CONF_PORT,
-    CONF_SOLAR_ENTITY,
-    CONF_GRID_ENTITY,
-    CONF_HOUSE_ENTITY,
-    CONF_BATTERY_ENTITY,
-    CONF_BATTERY_SOC_ENTITY,
-    CONF_YIELD_TODAY_ENTITY,
-    CONF_YIELD_MONTH_ENTITY,
-    CONF_YIELD_YEAR_ENTITY,
-    CONF_YIELD_TOTAL_ENTITY,
-    CONF_GRID_IMPORT_ENTITY,
-    CONF_GRID_EXPORT_ENTITY,
-    CONF_CUSTOM1_NAME,
-    CONF_CUSTOM1_ENTITY,
-    CONF_CUSTOM2_NAME,
-    CONF_CUSTOM2_ENTITY,
-    CONF_ENABLE_PAGE3,
-    CONF_CUSTOM3_NAME,
-    CONF_CUSTOM3_ENTITY,
-    CONF_CUSTOM4_NAME,
-    CONF_CUSTOM4_ENTITY,
-    CONF_ENABLE_PAGE4,
-    CONF_CUSTOM5_NAME,
-    CONF_CUSTOM5_ENTITY,
-    CONF_CUSTOM6_NAME,
-    CONF_CUSTOM6_ENTITY,
-    CONF_CUSTOM7_NAME,
-    CONF_CUSTOM7_ENTITY,
-    CONF_CUSTOM8_NAME,
-    CONF_CUSTOM8_ENTITY,
-    CONF_ENABLE_PAGE1,
-    CONF_ENABLE_PAGE2,
-    CONF_ENABLE_PAGE5,
-    CONF_MINING1_NAME,
-    CONF_MINING1_ENTITY,
-    CONF_MINING2_NAME,
-    CONF_MINING2_ENTITY,
-    CONF_MINING3_NAME,
-    CONF_MINING3_ENTITY,
-    CONF_MINING4_NAME,
-    CONF_MINING4_ENTITY,
-    CONF_ENABLE_PAGE6,
-    CONF_CUSTOM9_NAME,
-    CONF_CUSTOM9_ENTITY,
-    CONF_CUSTOM10_NAME,
-    CONF_CUSTOM10_ENTITY,
-    CONF_CUSTOM11_NAME,
-    CONF_CUSTOM11_ENTITY,
-    CONF_CUSTOM12_NAME,
-    CONF_CUSTOM12_ENTITY,
-    CONF_ENABLE_PAGE7,
-    CONF_CUSTOM13_NAME,
-    CONF_CUSTOM13_ENTITY,
-    CONF_CUSTOM14_NAME,
-    CONF_CUSTOM14_ENTITY,
-    CONF_CUSTOM15_NAME,
-    CONF_CUSTOM15_ENTITY,
-    CONF_CUSTOM16_NAME,
-    CONF_CUSTOM16_ENTITY,
-    CONF_ENABLE_PAGE8,
-    CONF_CUSTOM17_NAME,
-    CONF_CUSTOM17_ENTITY,
-    CONF_CUSTOM18_NAME,
-    CONF_CUSTOM18_ENTITY,
-    CONF_CUSTOM19_NAME,
-    CONF_CUSTOM19_ENTITY,
-    CONF_CUSTOM20_NAME,
-    CONF_CUSTOM20_ENTITY,
-    CONF_ENABLE_PAGE9,
-    CONF_CUSTOM21_NAME,
-    CONF_CUSTOM21_ENTITY,
-    CONF_CUSTOM22_NAME,
-    CONF_CUSTOM22_ENTITY,
-    CONF_CUSTOM23_NAME,
-    CONF_CUSTOM23_ENTITY,
-    CONF_CUSTOM24_NAME,
-    CONF_CUSTOM24_ENTITY,
-    CONF_SHOW_KW,
-    CONF_AUTO_PAGE_SWITCH,
     CONF_PAGE_INTERVAL,
     CONF_PAGE_SWITCH_MODE,
     CONF_PAGE_ROTATION_SOURCE,
-    CONF_BROADCAST_MODE,
+    CONF_PUSH_MODE,
+    CONF_PUSH_DEBOUNCE,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_VERSION_CHECK_INTERVAL,
+    CONF_DISPLAY_OVERRIDES,
+    CONF_PAGE_DWELL,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_PAGE_INTERVAL,
+    DEFAULT_PUSH_MODE,
+    DEFAULT_PUSH_DEBOUNCE,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_VERSION_CHECK_INTERVAL,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    PAGE_STORE_VERSION,
+    PAGE_STORE_SAVE_DELAY,
     PAGE_SWITCH_AUTO,
     PAGE_SWITCH_TOUCH,
-    PAGE_SWITCH_BOTH,
+    CHART_PAGE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# So viele Sekunden vor einem Seitenwechsel gehen die Werte der nächsten Seite mit
+PREFETCH_WINDOW = 3
+
+# Wird nach jedem Tick pro Config Entry gesendet (Panel-Websocket, siehe websocket_api.py)
+SIGNAL_STATE_UPDATED = f"{DOMAIN}_state_updated_{{}}"
+
+
+def _to_int(value):
+    """Return value as int, 0 if unset or invalid."""
+    try:
+        return int(value or 0)
+    except (ValueError, TypeError):
+        return 0
+
+
 class CYDSolarCoordinator(DataUpdateCoordinator):
     """Coordinator to manage solar data and push to CYD."""
 
     def __init__(self, hass, entry):
         """Initialize."""
         self.entry = entry
-        self.last_page_switch = datetime.now()
-        self.latest_version = "0.0.0"
-        self.last_version_check = None
-        self.version_url = "https://raw.githubusercontent.com/low-streaming/cyd_solar_display/main/version.txt"
+
+        # Versionsprüfung ist integrationsweit geteilt (ein Request für alle Displays)
+        self.version_checker = async_get_version_checker(hass)
+        self.version_checker.async_set_interval(
+            entry.entry_id,
+            entry.options.get(CONF_VERSION_CHECK_INTERVAL, DEFAULT_VERSION_CHECK_INTERVAL),
+        )
+        self._unsub_version = async_dispatcher_connect(
+            hass, SIGNAL_VERSION_UPDATED, self._async_version_updated
+        )
         
-        # Restore last page from options
+        # Restore last page (legacy: from options, see async_load_page_state)
         self.current_page = entry.options.get("last_page", 1)
-        
-        update_interval = entry.options.get("update_interval", 5)
+        self._stored_pages = {}
+        self._page_store = Store(hass, PAGE_STORE_VERSION, f"{DOMAIN}.page_state.{entry.entry_id}")
+        self.async_compile_options()
+
+        # Push-Modus: Statt alle X Sekunden alles neu zu lesen, reagieren wir auf
+        # State-Changes der konfigurierten Entitäten. Der Timer läuft nur noch als
+        # Keep-Alive (Heartbeat); Seitenwechsel haben eigene Timer pro Display.
+        self.push_mode = bool(entry.options.get(CONF_PUSH_MODE, DEFAULT_PUSH_MODE))
+        self._unsub_push = None
+        self.targets = CYDTargetResolver(hass, entry)
+        self.targets.async_start()
+
+        # Eigener Zustand pro Display (Delta, Seite, Rotation, Push-Intervall, Health)
+        self.displays = {}
+        self._unsub_followup = None
+        self._followup_at = None    # monotonic, wann der geplante Folge-Tick kommt
+        self.stats = Stats()
+        # Verlauf nur mit aktivierter Diagramm-Seite (ca. 70 KB Ringpuffer)
+        self.history = None
+        self._unsub_sample = None
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=int(entry.options.get("update_interval", 5))),
+            update_interval=timedelta(seconds=self._tick_interval(entry.options)),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=self._push_debounce(entry.options), immediate=False
+            ),
         )
         
         # VERY IMPORTANT: DataUpdateCoordinator stops polling natively if there are no listeners.
         # Since this integration only PUSHES data to ESPHome and has no HA entities, we must attach
         # a dummy listener so it runs forever in the background.
         self._unsub_dummy = self.async_add_listener(self._dummy_listener)
+        self._unsub_publish = self.async_add_listener(self._async_publish)
+        self._async_setup_history()
 
     def _dummy_listener(self):
         """Dummy listener to keep DataUpdateCoordinator polling active."""
         pass
 
+    @callback
+    def _async_publish(self):
+        """Tell panel subscribers that a tick finished.
+
+        Sent per entry_id instead of per coordinator, so subscriptions survive reloads.
+        """
+        async_dispatcher_send(self.hass, SIGNAL_STATE_UPDATED.format(self.entry.entry_id))
+
+    @staticmethod
+    def _push_debounce(options):
+        """Return the debounce cooldown in seconds for state-change pushes."""
+        try:
+            return max(float(options.get(CONF_PUSH_DEBOUNCE, DEFAULT_PUSH_DEBOUNCE)), 0.0)
+        except (ValueError, TypeError):
+            return DEFAULT_PUSH_DEBOUNCE
+
+    def _tick_interval(self, options):
+        """Return the timer interval in seconds for the current mode."""
+        try:
+            poll = int(options.get("update_interval", DEFAULT_UPDATE_INTERVAL))
+        except (ValueError, TypeError):
+            poll = DEFAULT_UPDATE_INTERVAL
+        if not self.push_mode:
+            return max(poll, 1)
+
+        try:
+            heartbeat = int(options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL))
+        except (ValueError, TypeError):
+            heartbeat = DEFAULT_HEARTBEAT_INTERVAL
+        return max(heartbeat, 1)
+
+    def _tracked_entity_ids(self):
+        """Return all entity IDs configured for display slots."""
+        return sorted(self.slots.entity_ids)
+
+    @callback
+    def async_start_push(self):
+        """Subscribe to state changes of the configured entities (push mode only)."""
+        if not self.push_mode or self._unsub_push is not None:
+            return
+        entity_ids = self._tracked_entity_ids()
+        if not entity_ids:
+            return
+        _LOGGER.debug("Push-Modus aktiv für %d Entitäten", len(entity_ids))
+        self._unsub_push = async_track_state_change_event(
+            self.hass, entity_ids, self._async_state_changed
+        )
+
+    @callback
+    def _async_stop_push(self):
+        """Unsubscribe from state changes."""
+        if self._unsub_push:
+            self._unsub_push()
+            self._unsub_push = None
+
+    @callback
+    def _async_state_changed(self, event):
+        """Fold relevant state changes into one debounced push."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if old_state is not None and new_state is not None:
+            # Attribut-Rauschen (last_updated, friendly_name, ...) ignorieren
+            if (
+                old_state.state == new_state.state
+                and old_state.attributes.get("unit_of_measurement")
+                == new_state.attributes.get("unit_of_measurement")
+            ):
+                return
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_version_updated(self):
+        """Let the update entities pick up a new GitHub version."""
+        self.async_update_listeners()
+
+    @callback
+    def async_unload(self):
+        """Release all listeners held by the coordinator."""
+        self.targets.async_stop()
+        self.version_checker.async_remove(self.entry.entry_id)
+        self._unsub_version()
+        self._async_stop_push()
+        self._async_stop_history()
+        for display in self.displays.values():
+            self._async_stop_rotation(display)
+        if self._unsub_followup:
+            self._unsub_followup()
+            self._unsub_followup = None
+            self._followup_at = None
+        if self._unsub_dummy:
+            self._unsub_dummy()
+            self._unsub_dummy = None
+        if self._unsub_publish:
+            self._unsub_publish()
+            self._unsub_publish = None
+
+    async def async_load_page_state(self):
+        """Restore the last shown page from storage."""
+        stored = await self._page_store.async_load()
+        if stored and "current_page" in stored:
+            self.current_page = stored["current_page"]
+            self._stored_pages = stored.get("pages", {})
+
+    @callback
+    def _page_state(self):
+        """Return the page state to persist."""
+        return {
+            "current_page": self.current_page,
+            "pages": {srv: d.current_page for srv, d in self.displays.items()},
+        }
+
+    @callback
+    def async_compile_options(self):
+        """Compile the entry options into the slot table used by every tick."""
+        options = self.entry.options
+        self.slots = compile_slots(options)
+        self._switch_mode = options.get(CONF_PAGE_SWITCH_MODE, PAGE_SWITCH_AUTO)
+        self._rotation_source = options.get(CONF_PAGE_ROTATION_SOURCE, "ha")
+        try:
+            self._page_interval = int(options.get(CONF_PAGE_INTERVAL, DEFAULT_PAGE_INTERVAL))
+        except (ValueError, TypeError):
+            self._page_interval = DEFAULT_PAGE_INTERVAL
+        try:
+            self._resync_interval = int(options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL))
+        except (ValueError, TypeError):
+            self._resync_interval = DEFAULT_HEARTBEAT_INTERVAL
+        self._overrides = {
+            srv: {key: _to_int(override.get(key)) for key in ("page_interval", "fixed_page", "push_interval")}
+            for srv, override in (options.get(CONF_DISPLAY_OVERRIDES) or {}).items()
+            if isinstance(override, dict)
+        }
+        try:
+            self._rate_limit = max(float(options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)), 0.1)
+        except (ValueError, TypeError):
+            self._rate_limit = DEFAULT_RATE_LIMIT
+        self._rate_burst = max(_to_int(options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST)), 1)
+        self._page_dwell = {
+            _to_int(page): _to_int(seconds)
+            for page, seconds in (options.get(CONF_PAGE_DWELL) or {}).items()
+            if _to_int(seconds) > 0
+        }
+
+    @callback
+    def async_apply_options(self):
+        """Apply changed options to the running coordinator without a reload."""
+        options = self.entry.options
+        old_entity_ids = self.slots.entity_ids
+        self.async_compile_options()
+        self._async_setup_history()
+
+        push_mode = bool(options.get(CONF_PUSH_MODE, DEFAULT_PUSH_MODE))
+        if push_mode != self.push_mode or self.slots.entity_ids != old_entity_ids:
+            self._async_stop_push()
+            self.push_mode = push_mode
+            self.async_start_push()
+
+        self._debounced_refresh.cooldown = self._push_debounce(options)
+        self.update_interval = timedelta(seconds=self._tick_interval(options))
+        self.version_checker.async_set_interval(
+            self.entry.entry_id,
+            options.get(CONF_VERSION_CHECK_INTERVAL, DEFAULT_VERSION_CHECK_INTERVAL),
+        )
+        for display in self.displays.values():
+            display.bucket.configure(self._rate_limit, self._rate_burst)
+            self._async_schedule_rotation(display)
+        # Neue Werte sofort senden (plant auch den Timer mit dem neuen Intervall neu)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _display(self, srv):
+        """Return the state for a display service, creating it on first sight."""
+        display = self.displays.get(srv)
+        if display is None:
+            display = self.displays[srv] = DisplayState(
+                srv,
+                self._stored_pages.get(srv, self.current_page),
+                TokenBucket(self._rate_limit, self._rate_burst),
+            )
+            self._async_schedule_rotation(display)
+        return display
+
+    @callback
+    def _async_prune_displays(self, targets):
+        """Forget displays whose service is gone, including their rotation timer."""
+        for srv in [srv for srv in self.displays if srv not in targets.display_services]:
+            _LOGGER.debug("Display-Dienst %s nicht mehr vorhanden, Zustand verworfen", srv)
+            self._async_stop_rotation(self.displays.pop(srv))
+
     async def _async_update_data(self):
         """Fetch data from entities and push to ESP32."""
-        data = {}
-        
-        def get_value(entity_id):
-            if not entity_id:
-                return None
-            state = self.hass.states.get(entity_id)
-            if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                return None
-            try:
-                return round(float(state.state), 1)
-            except (ValueError, TypeError):
-                return None
+        self.stats.count("ticks")
+        with self.stats.measure("tick"):
+            return await self._async_tick()
 
-        # --- Discover ESPHome Entity ---
-        esphome_update_id = None
-        ota_service_name = None
+    async def _async_tick(self):
+        """Run one tick: resolve targets, build the payload and push it."""
+        # --- Discover ESPHome Entity (cached, see discovery.py) ---
+        with self.stats.measure("discovery"):
+            targets = self.targets.async_get()
+        self._async_prune_displays(targets)
+        esphome_update_id = targets.update_entity_id
         installed_ver = "1.2.9"
-        
-        target_host = self.entry.data.get(CONF_HOST)
-        _LOGGER.debug("Suche nach ESPHome-Gerät für Host %s", target_host)
+        if esphome_update_id:
+            state = self.hass.states.get(esphome_update_id)
+            if state:
+                installed_ver = state.attributes.get("installed_version", "1.2.9")
 
-        # 1. Finde den Config Entry von ESPHome für diese IP
-        esphome_entry = next((e for e in self.hass.config_entries.async_entries("esphome") if e.data.get("host") == target_host), None)
-        
-        if esphome_entry:
-            device_name = esphome_entry.title.lower().replace(" ", "_").replace("-", "_")
-            ota_service_name = f"{device_name}_trigger_ota_update"
-            _LOGGER.debug("ESPHome Eintrag gefunden: %s, Dienst: %s", esphome_entry.title, ota_service_name)
-            
-            # 2. Durchsuche alle Entitäten nach einer Update-Entität für diesen Eintrag
-            from homeassistant.helpers import entity_registry as er
-            ent_reg = er.async_get(self.hass)
-            
-            for entity in er.async_entries_for_config_entry(ent_reg, esphome_entry.entry_id):
-                if entity.domain == "update":
-                    esphome_update_id = entity.entity_id
-                    _LOGGER.info("Gefundene Ziel-Entität für Updates: %s", esphome_update_id)
-                    
-                    state = self.hass.states.get(esphome_update_id)
-                    if state:
-                        installed_ver = state.attributes.get("installed_version", "1.2.9")
-                    break
-        else:
-            _LOGGER.warning("Kein ESPHome-Gerät für Host %s gefunden. Update-Funktion eingeschränkt.", target_host)
+        # Versionsprüfung läuft als eigener Hintergrund-Timer (version.py),
+        # hier wird nur das zuletzt bekannte Ergebnis verwendet.
 
-        # --- Version Check Logic ---
-        await self.async_check_version()
-        # ---------------------------
+        # Gather data (one pass over the compiled slot table, only visible pages if possible)
+        now = time.monotonic()
+        pages = self._visible_pages(targets, now)
+        with self.stats.measure("build"):
+            service_data = self._build(pages, now)
+        if pages is not None:
+            # Nicht gelesene Werte ausgeblendeter Seiten
+            skipped = len(self.slots.bindings) + len(self.slots.static) - len(service_data)
+            self.stats.count("pruned_values", amount=skipped)
 
         data = {
             "latest_version": self.latest_version,
             "installed_version": installed_ver,
             "firmware_update_entity_id": f"update.{self.entry.entry_id}_update",
             "esphome_update_entity": esphome_update_id,
-            "ota_service": ota_service_name
-        }
-        def get_custom_val(entity_id):
-            if not entity_id:
-                return ""
-            state = self.hass.states.get(entity_id)
-            if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                return "--"
-            val = state.state
-            try:
-                fval = float(val)
-                if fval.is_integer():
-                    val = f"{int(fval)}"
-                else:
-                    val = f"{round(fval, 2)}"
-            except ValueError:
-                pass
-            unit = state.attributes.get("unit_of_measurement", "")
-            return f"{val} {unit}".strip()
-
-        # Gather data
-        payload = {
-            "solar_w": get_value(self.entry.options.get(CONF_SOLAR_ENTITY)),
-            "grid_w": get_value(self.entry.options.get(CONF_GRID_ENTITY)),
-            "house_w": get_value(self.entry.options.get(CONF_HOUSE_ENTITY)),
-            "battery_w": get_value(self.entry.options.get(CONF_BATTERY_ENTITY)),
-            "battery_soc": get_value(self.entry.options.get(CONF_BATTERY_SOC_ENTITY)),
-            "yield_today_kwh": get_value(self.entry.options.get(CONF_YIELD_TODAY_ENTITY)),
-            "yield_month_kwh": get_value(self.entry.options.get(CONF_YIELD_MONTH_ENTITY)),
-            "yield_year_kwh": get_value(self.entry.options.get(CONF_YIELD_YEAR_ENTITY)),
-            "yield_total_kwh": get_value(self.entry.options.get(CONF_YIELD_TOTAL_ENTITY)),
-            "grid_import_kwh": get_value(self.entry.options.get(CONF_GRID_IMPORT_ENTITY)),
-            "grid_export_kwh": get_value(self.entry.options.get(CONF_GRID_EXPORT_ENTITY)),
-            "timestamp": datetime.now().isoformat(),
-            
-            "c1_n": self.entry.options.get(CONF_CUSTOM1_NAME, "Custom 1"),
-            "c1_v": get_custom_val(self.entry.options.get(CONF_CUSTOM1_ENTITY)),
-            "c2_n": self.entry.options.get(CONF_CUSTOM2_NAME, "Custom 2"),
-            "c2_v": get_custom_val(self.entry.options.get(CONF_CUSTOM2_ENTITY)),
-            "c3_n": self.entry.options.get(CONF_CUSTOM3_NAME, "Custom 3"),
-            "c3_v": get_custom_val(self.entry.options.get(CONF_CUSTOM3_ENTITY)),
-            "c4_n": self.entry.options.get(CONF_CUSTOM4_NAME, "Custom 4"),
-            "c4_v": get_custom_val(self.entry.options.get(CONF_CUSTOM4_ENTITY)),
-            
-            "c5_n": self.entry.options.get(CONF_CUSTOM5_NAME, "Custom 5"),
-            "c5_v": get_custom_val(self.entry.options.get(CONF_CUSTOM5_ENTITY)),
-            "c6_n": self.entry.options.get(CONF_CUSTOM6_NAME, "Custom 6"),
-            "c6_v": get_custom_val(self.entry.options.get(CONF_CUSTOM6_ENTITY)),
-            "c7_n": self.entry.options.get(CONF_CUSTOM7_NAME, "Custom 7"),
-            "c7_v": get_custom_val(self.entry.options.get(CONF_CUSTOM7_ENTITY)),
-            "c8_n": self.entry.options.get(CONF_CUSTOM8_NAME, "Custom 8"),
-            "c8_v": get_custom_val(self.entry.options.get(CONF_CUSTOM8_ENTITY)),
-            
-            "c9_n": self.entry.options.get(CONF_MINING1_NAME, "Mining 1"),
-            "c9_v": get_custom_val(self.entry.options.get(CONF_MINING1_ENTITY)),
-            "c10_n": self.entry.options.get(CONF_MINING2_NAME, "Mining 2"),
-            "c10_v": get_custom_val(self.entry.options.get(CONF_MINING2_ENTITY)),
-            "c11_n": self.entry.options.get(CONF_MINING3_NAME, "Mining 3"),
-            "c11_v": get_custom_val(self.entry.options.get(CONF_MINING3_ENTITY)),
-            "c12_n": self.entry.options.get(CONF_MINING4_NAME, "Mining 4"),
-            "c12_v": get_custom_val(self.entry.options.get(CONF_MINING4_ENTITY)),
-
-            "c13_n": self.entry.options.get(CONF_CUSTOM9_NAME, "Custom 9"),
-            "c13_v": get_custom_val(self.entry.options.get(CONF_CUSTOM9_ENTITY)),
-            "c14_n": self.entry.options.get(CONF_CUSTOM10_NAME, "Custom 10"),
-            "c14_v": get_custom_val(self.entry.options.get(CONF_CUSTOM10_ENTITY)),
-            "c15_n": self.entry.options.get(CONF_CUSTOM11_NAME, "Custom 11"),
-            "c15_v": get_custom_val(self.entry.options.get(CONF_CUSTOM11_ENTITY)),
-            "c16_n": self.entry.options.get(CONF_CUSTOM12_NAME, "Custom 12"),
-            "c16_v": get_custom_val(self.entry.options.get(CONF_CUSTOM12_ENTITY)),
-
-            "c17_n": self.entry.options.get(CONF_CUSTOM13_NAME, "Custom 13"),
-            "c17_v": get_custom_val(self.entry.options.get(CONF_CUSTOM13_ENTITY)),
-            "c18_n": self.entry.options.get(CONF_CUSTOM14_NAME, "Custom 14"),
-            "c18_v": get_custom_val(self.entry.options.get(CONF_CUSTOM14_ENTITY)),
-            "c19_n": self.entry.options.get(CONF_CUSTOM15_NAME, "Custom 15"),
-            "c19_v": get_custom_val(self.entry.options.get(CONF_CUSTOM15_ENTITY)),
-            "c20_n": self.entry.options.get(CONF_CUSTOM16_NAME, "Custom 16"),
-            "c20_v": get_custom_val(self.entry.options.get(CONF_CUSTOM16_ENTITY)),
-
-            "c21_n": self.entry.options.get(CONF_CUSTOM17_NAME, "Custom 17"),
-            "c21_v": get_custom_val(self.entry.options.get(CONF_CUSTOM17_ENTITY)),
-            "c22_n": self.entry.options.get(CONF_CUSTOM18_NAME, "Custom 18"),
-            "c22_v": get_custom_val(self.entry.options.get(CONF_CUSTOM18_ENTITY)),
-            "c23_n": self.entry.options.get(CONF_CUSTOM19_NAME, "Custom 19"),
-            "c23_v": get_custom_val(self.entry.options.get(CONF_CUSTOM19_ENTITY)),
-            "c24_n": self.entry.options.get(CONF_CUSTOM20_NAME, "Custom 20"),
-            "c24_v": get_custom_val(self.entry.options.get(CONF_CUSTOM20_ENTITY)),
-
-            "c25_n": self.entry.options.get(CONF_CUSTOM21_NAME, "Custom 21"),
-            "c25_v": get_custom_val(self.entry.options.get(CONF_CUSTOM21_ENTITY)),
-            "c26_n": self.entry.options.get(CONF_CUSTOM22_NAME, "Custom 22"),
-            "c26_v": get_custom_val(self.entry.options.get(CONF_CUSTOM22_ENTITY)),
-            "c27_n": self.entry.options.get(CONF_CUSTOM23_NAME, "Custom 23"),
-            "c27_v": get_custom_val(self.entry.options.get(CONF_CUSTOM23_ENTITY)),
-            "c28_n": self.entry.options.get(CONF_CUSTOM24_NAME, "Custom 24"),
-            "c28_v": get_custom_val(self.entry.options.get(CONF_CUSTOM24_ENTITY)),
+            "ota_service": targets.ota_service,
+            "payload": service_data,
         }
 
-        # Handle Page Switching
-        enable_p1 = self.entry.options.get(CONF_ENABLE_PAGE1, True)
-        enable_p2 = self.entry.options.get(CONF_ENABLE_PAGE2, True)
-        enable_p3 = self.entry.options.get(CONF_ENABLE_PAGE3, True)
-        enable_p4 = self.entry.options.get(CONF_ENABLE_PAGE4, True)
-        enable_p5 = self.entry.options.get(CONF_ENABLE_PAGE5, True)
-        enable_p6 = self.entry.options.get(CONF_ENABLE_PAGE6, False)
-        enable_p7 = self.entry.options.get(CONF_ENABLE_PAGE7, False)
-        enable_p8 = self.entry.options.get(CONF_ENABLE_PAGE8, False)
-        enable_p9 = self.entry.options.get(CONF_ENABLE_PAGE9, False)
-        
-        enabled_pages = []
-        if enable_p1: enabled_pages.append(1)
-        if enable_p2: enabled_pages.append(2)
-        if enable_p3: enabled_pages.append(3)
-        if enable_p4: enabled_pages.append(4)
-        if enable_p5: enabled_pages.append(5)
-        if enable_p6: enabled_pages.append(6)
-        if enable_p7: enabled_pages.append(7)
-        if enable_p8: enabled_pages.append(8)
-        if enable_p9: enabled_pages.append(9)
-        
-        if not enabled_pages: enabled_pages = [1]
-        
-        # Seitenwechsel-Modus auslesen
-        switch_mode = self.entry.options.get(CONF_PAGE_SWITCH_MODE, PAGE_SWITCH_AUTO)
-        rotation_source = self.entry.options.get(CONF_PAGE_ROTATION_SOURCE, "ha")
-        
-        try:
-            interval = int(self.entry.options.get("page_interval", 10))
-        except (ValueError, TypeError):
-            interval = 10
-        
-        # Ensure our current page is valid
-        # Ensure our current page is valid, and handle first-boot injection
-        if self.current_page not in enabled_pages:
-            self.current_page = enabled_pages[0]
-            
-        if switch_mode == PAGE_SWITCH_TOUCH:
-            # Nur Touch-Modus: HA rotiert nicht automatisch.
-            # Wenn die Seite noch nicht gesetzt wurde, nimm die erste.
-            if self.current_page is None:
-                self.current_page = enabled_pages[0]
-            self.last_page_switch = datetime.now()  # Intervall-Timer zuruecksetzen
-        elif rotation_source == "ha":
-            # Auto oder Both, und HA ist Master: HA rotiert Seiten nach Intervall
-            # Check if first launch OR time has passed
-            time_since = (datetime.now() - self.last_page_switch).total_seconds()
-            
-            if time_since >= interval:
-                idx = enabled_pages.index(self.current_page)
-                self.current_page = enabled_pages[(idx + 1) % len(enabled_pages)]
-                self.last_page_switch = datetime.now()
-                
-                # Persist page in options
-                if self.entry.options.get("last_page") != self.current_page:
-                    new_options = dict(self.entry.options)
-                    new_options["last_page"] = self.current_page
-                    new_options["_last_sync"] = datetime.now().timestamp() # Trigger update
-                    self.hass.config_entries.async_update_entry(self.entry, options=new_options)
-            
-        page_idx = enabled_pages.index(self.current_page) + 1
-        page_total = len(enabled_pages)
-        
-        # Data for Service Call
-        service_data = {
-            "solar": float(payload["solar_w"] or 0.0),
-            "grid": float(payload["grid_w"] or 0.0),
-            "house": float(payload["house_w"] or 0.0),
-            "bat_w": float(payload["battery_w"] or 0.0),
-            "bat_soc": float(payload["battery_soc"] or 0.0),
-            "val_yield": float(payload["yield_today_kwh"] or 0.0),
-            "val_yield_month": float(payload["yield_month_kwh"] or 0.0),
-            "val_yield_year": float(payload["yield_year_kwh"] or 0.0),
-            "val_yield_total": float(payload["yield_total_kwh"] or 0.0),
-            "grid_in": float(payload["grid_import_kwh"] or 0.0),
-            "grid_out": float(payload["grid_export_kwh"] or 0.0),
-            "page_num": int(self.current_page),
-            "auto_rotate": bool(rotation_source == "display" and switch_mode != PAGE_SWITCH_TOUCH),
-            "page_idx": int(page_idx),
-            "page_total": int(page_total),
-            "show_kw": bool(self.entry.options.get(CONF_SHOW_KW, False)),
-            "c1_n": str(payload["c1_n"] or " "),
-            "c1_v": str(payload["c1_v"] or " "),
-            "c2_n": str(payload["c2_n"] or " "),
-            "c2_v": str(payload["c2_v"] or " "),
-            "c3_n": str(payload["c3_n"] or " "),
-            "c3_v": str(payload["c3_v"] or " "),
-            "c4_n": str(payload["c4_n"] or " "),
-            "c4_v": str(payload["c4_v"] or " "),
-            "c5_n": str(payload["c5_n"] or " "),
-            "c5_v": str(payload["c5_v"] or " "),
-            "c6_n": str(payload["c6_n"] or " "),
-            "c6_v": str(payload["c6_v"] or " "),
-            "c7_n": str(payload["c7_n"] or " "),
-            "c7_v": str(payload["c7_v"] or " "),
-            "c8_n": str(payload["c8_n"] or " "),
-            "c8_v": str(payload["c8_v"] or " "),
-            "c9_n": str(payload["c9_n"] or " "),
-            "c9_v": str(payload["c9_v"] or " "),
-            "c10_n": str(payload["c10_n"] or " "),
-            "c10_v": str(payload["c10_v"] or " "),
-            "c11_n": str(payload["c11_n"] or " "),
-            "c11_v": str(payload["c11_v"] or " "),
-            "c12_n": str(payload["c12_n"] or " "),
-            "c12_v": str(payload["c12_v"] or " "),
-            "c13_n": str(payload["c13_n"] or " "),
-            "c13_v": str(payload["c13_v"] or " "),
-            "c14_n": str(payload["c14_n"] or " "),
-            "c14_v": str(payload["c14_v"] or " "),
-            "c15_n": str(payload["c15_n"] or " "),
-            "c15_v": str(payload["c15_v"] or " "),
-            "c16_n": str(payload["c16_n"] or " "),
-            "c16_v": str(payload["c16_v"] or " "),
-            "c17_n": str(payload["c17_n"] or " "),
-            "c17_v": str(payload["c17_v"] or " "),
-            "c18_n": str(payload["c18_n"] or " "),
-            "c18_v": str(payload["c18_v"] or " "),
-            "c19_n": str(payload["c19_n"] or " "),
-            "c19_v": str(payload["c19_v"] or " "),
-            "c20_n": str(payload["c20_n"] or " "),
-            "c20_v": str(payload["c20_v"] or " "),
-            "c21_n": str(payload["c21_n"] or " "),
-            "c21_v": str(payload["c21_v"] or " "),
-            "c22_n": str(payload["c22_n"] or " "),
-            "c22_v": str(payload["c22_v"] or " "),
-            "c23_n": str(payload["c23_n"] or " "),
-            "c23_v": str(payload["c23_v"] or " "),
-            "c24_n": str(payload["c24_n"] or " "),
-            "c24_v": str(payload["c24_v"] or " "),
-            "c25_n": str(payload["c25_n"] or " "),
-            "c25_v": str(payload["c25_v"] or " "),
-            "c26_n": str(payload["c26_n"] or " "),
-            "c26_v": str(payload["c26_v"] or " "),
-            "c27_n": str(payload["c27_n"] or " "),
-            "c27_v": str(payload["c27_v"] or " "),
-            "c28_n": str(payload["c28_n"] or " "),
-            "c28_v": str(payload["c28_v"] or " "),
-            "dim_start": int(self.entry.options.get("dim_start_time", 22)),
-            "dim_end": int(self.entry.options.get("dim_end_time", 6)),
-            "dim_brt": float(self.entry.options.get("dim_brightness", 20.0)),
-            "p1_en": bool(enable_p1),
-            "p2_en": bool(enable_p2),
-            "p3_en": bool(enable_p3),
-            "p4_en": bool(enable_p4),
-            "p5_en": bool(enable_p5),
-            "p6_en": bool(enable_p6),
-            "p7_en": bool(enable_p7),
-            "p8_en": bool(enable_p8),
-            "p9_en": bool(enable_p9),
-        }
-        
         # Call the ESPHome Service(s)
-        all_services = self.hass.services.async_services()
-        esphome_services = all_services.get("esphome", {})
-        
-        target_services = []
-        broadcast = self.entry.options.get(CONF_BROADCAST_MODE, False)
-        
-        # 1. Collect all potential services
-        all_solar_services = [s for s in esphome_services if s.startswith("cyd_solar_display_") and s.endswith("_update_display")]
-        if "cyd_solar_display_update_display" in esphome_services and "cyd_solar_display_update_display" not in all_solar_services:
-            all_solar_services.append("cyd_solar_display_update_display")
-
-        if broadcast:
-            target_services = all_solar_services
-        else:
-            # Specific Mode: Target only the display matching the configured IP (host)
-            target_host = self.entry.data.get(CONF_HOST)
-            for entry in self.hass.config_entries.async_entries("esphome"):
-                if entry.data.get("host") == target_host:
-                    name_data = entry.data.get("name", "")
-                    title_data = entry.title
-                    
-                    possible_names = [name_data, title_data]
-                    for d_name in possible_names:
-                        if d_name:
-                            srv = f"{str(d_name).lower().replace('-', '_').replace(' ', '_')}_update_display"
-                            if srv in esphome_services:
-                                target_services = [srv]
-                                break
-                if target_services:
-                    break
-        
-        # Fallback: If specific targeting fails but only one generic service exists, use it!
-        if not target_services and len(all_solar_services) == 1:
-            target_services = all_solar_services
-            _LOGGER.debug(f"Calling only service {target_services[0]} as specific match failed but 1 display exists")
-        elif not target_services and len(all_solar_services) > 1:
-            _LOGGER.error("MEHRERE DISPLAYS gefunden, aber IP/Host '%s' passt zu keinem ESPHome-Gerät! Aus Sicherheitsgründen wird nichts gesendet.", target_host)
-            return payload
+        target_services = targets.display_services
+        if targets.ambiguous:
+            _LOGGER.error("MEHRERE DISPLAYS gefunden, aber IP/Host '%s' passt zu keinem ESPHome-Gerät! Aus Sicherheitsgründen wird nichts gesendet.", self.entry.data.get(CONF_HOST))
+            return data
 
         if not target_services:
             _LOGGER.warning(
                 "Kein CYD Solar Display in ESPHome gefunden (oder noch 'entdeckt' aber nicht hinzugefügt). "
                 "Bitte klicke in der ESPHome Integration bei den Displays auf 'Hinzufügen'."
             )
-            return payload
+            return data
                 
-        for srv in target_services:
+        with self.stats.measure("dispatch"):
+            await self._async_dispatch(targets, service_data, pages, now)
+
+        primary = self.displays.get(target_services[0])
+        if primary is not None and primary.last_sent is not None:
+            data["payload"] = primary.last_sent
+        data["displays"] = {srv: self.displays[srv].as_dict() for srv in target_services if srv in self.displays}
+        return data
+
+    @callback
+    def _async_setup_history(self):
+        """Create or drop the chart history and its sample timer to match the options."""
+        if CHART_PAGE not in self.slots.enabled_pages:
+            self._async_stop_history()
+            self.history = None
+            return
+        if self.history is None:
+            self.history = PowerHistory()
+        if self._unsub_sample is None:
+            self._unsub_sample = async_track_time_interval(
+                self.hass, self._async_sample_history, timedelta(seconds=HISTORY_SAMPLE_INTERVAL)
+            )
+
+    @callback
+    def _async_stop_history(self):
+        """Stop sampling the chart history."""
+        if self._unsub_sample:
+            self._unsub_sample()
+            self._unsub_sample = None
+
+    @callback
+    def _async_sample_history(self, _now=None):
+        """Feed the current power values into the chart history."""
+        if self.history is None:
+            return
+        get_state = self.hass.states.get
+        values = []
+        for entity_id in self.slots.history_entities:
+            state = get_state(entity_id) if entity_id else None
             try:
-                await self.hass.services.async_call("esphome", srv, service_data)
-            except Exception as err:
-                _LOGGER.error("Could not call ESPHome service '%s': %s", srv, err)
+                values.append(float(state.state))
+            except (AttributeError, ValueError, TypeError):
+                values.append(None)
+        self.history.add(time.time(), values)
+
+    def _chart_update(self, display, now):
+        """Return the chart fields if display shows the chart page and lacks the latest bucket."""
+        if CHART_PAGE not in self._pages(display) or display.chart_version == self.history.version:
+            return {}
+        if self._knows_page(display) and CHART_PAGE not in self._display_pages(display, now):
+            return {}
+        return self.history.packed()
+
+    def _build(self, pages, now):
+        """Build the payload for pages (None = all) and hold back insignificant changes."""
+        get_state = self.hass.states.get
+        data = self.slots.build(get_state, pages)
+        if self.slots.deadbands:
+            held, due = self.slots.filter(data, get_state, now)
+            if held:
+                self.stats.count("deadband_held", amount=held)
+            if due is not None:
+                # Nach max_hold/min_hold den echten Wert nachliefern, auch ohne neue State-Changes
+                self._async_schedule_followup(max(due - now, 0))
+        return data
+
+    def _pages(self, display):
+        """Return the enabled pages display can show.
+
+        The chart page needs the partial service; older firmware never gets page 10.
+        """
+        enabled_pages = self.slots.enabled_pages
+        if CHART_PAGE in enabled_pages and not self.targets.async_get().partial_services.get(display.service):
+            return [page for page in enabled_pages if page != CHART_PAGE]
+        return enabled_pages
+
+    @callback
+    def _async_check_page(self, display):
+        """Make sure the page of one display is valid (fixed page, disabled pages)."""
+        enabled_pages = self._pages(display)
+
+        # Fest eingestellte Seite für dieses Display (z.B. Schreibtisch-Display hält Seite 1)
+        fixed_page = self._overrides.get(display.service, {}).get("fixed_page")
+        if fixed_page in enabled_pages:
+            display.current_page = fixed_page
+            return
+
+        # Ensure the page is valid, and handle first-boot injection
+        if display.current_page not in enabled_pages:
+            display.current_page = enabled_pages[0]
+
+    def _knows_page(self, display):
+        """Return True if HA knows which page display shows right now.
+
+        Not the case if the display rotates itself or can be switched by touch.
+        """
+        enabled_pages = self._pages(display)
+        return (
+            len(enabled_pages) == 1
+            or self._overrides.get(display.service, {}).get("fixed_page") in enabled_pages
+            or (self._switch_mode == PAGE_SWITCH_AUTO and self._rotation_source == "ha")
+        )
+
+    def _resync_due(self, display, now):
+        """Return True if display needs the complete payload."""
+        return display.last_sent is None or now - display.last_full_push >= self._resync_interval
+
+    def _display_pages(self, display, now):
+        """Return the pages whose values display needs now (visible + upcoming)."""
+        pages = {display.current_page}
+        if self._rotates(display) and display.last_page_switch + self._dwell(display) - now <= PREFETCH_WINDOW:
+            pages.add(self._next_page(display))
+        return pages
+
+    def _visible_pages(self, targets, now):
+        """Return the pages to build values for, None for all pages.
+
+        Only the visible (and soon visible) page is sent at tick rate. Hidden
+        pages are refreshed by the periodic full resync and when they rotate in.
+        """
+        if targets.ambiguous or not targets.display_services:
+            return None
+        pages = set()
+        for srv in targets.display_services:
+            display = self.displays.get(srv)
+            if (
+                display is None
+                or not targets.partial_services.get(srv)
+                or self._resync_due(display, now)
+                or not self._knows_page(display)
+            ):
+                return None
+            self._async_check_page(display)
+            pages |= self._display_pages(display, now)
+        return pages
+
+    def _next_page(self, display):
+        """Return the page display rotates to next."""
+        enabled_pages = self._pages(display)
+        idx = enabled_pages.index(display.current_page) if display.current_page in enabled_pages else -1
+        return enabled_pages[(idx + 1) % len(enabled_pages)]
+
+    def _rotates(self, display):
+        """Return True if HA rotates the pages of display."""
+        enabled_pages = self._pages(display)
+        return (
+            self._switch_mode != PAGE_SWITCH_TOUCH
+            and self._rotation_source == "ha"
+            and len(enabled_pages) > 1
+            and self._overrides.get(display.service, {}).get("fixed_page") not in enabled_pages
+        )
+
+    def _dwell(self, display):
+        """Return how long (seconds) the current page of display stays visible.
+
+        A dwell time set for the page wins over the per-display interval, which
+        in turn replaces the global page interval.
+        """
+        return (
+            self._page_dwell.get(display.current_page)
+            or self._overrides.get(display.service, {}).get("page_interval")
+            or self._page_interval
+        )
+
+    @callback
+    def _async_stop_rotation(self, display):
+        """Cancel the rotation timer of one display."""
+        if display.unsub_rotate is not None:
+            display.unsub_rotate()
+            display.unsub_rotate = None
+
+    @callback
+    def _async_schedule_rotation(self, display):
+        """(Re)arm the rotation timer of one display for its current page.
+
+        Every display has its own timer, so pages switch exactly after their
+        dwell time instead of on the next data tick.
+        """
+        self._async_stop_rotation(display)
+        if not self._rotates(display):
+            return
+        delay = max(display.last_page_switch + max(self._dwell(display), 1) - time.monotonic(), 0)
+        display.unsub_rotate = async_call_later(self.hass, delay, partial(self._async_rotation_due, display))
+
+    @callback
+    def _async_rotation_due(self, display, _now):
+        """Switch one display to its next enabled page."""
+        display.unsub_rotate = None
+        if self.displays.get(display.service) is not display:
+            return
+        display.current_page = self._next_page(display)
+        display.last_page_switch = time.monotonic()
+
+        # Seite nur im Speicher halten, verzögert in .storage sichern
+        self._page_store.async_delay_save(self._page_state, PAGE_STORE_SAVE_DELAY)
+        self._async_schedule_rotation(display)
+        self.hass.async_create_task(self._async_push_page(display))
+
+    async def _async_push_page(self, display):
+        """Tell one display about its new page without rebuilding the payload."""
+        targets = self.targets.async_get()
+        srv = display.service
+        if targets.ambiguous or srv not in targets.display_services:
+            return
+
+        async with display.lock:
+            await self._async_send_page(display, targets)
+        if srv == targets.display_services[0]:
+            # Erst nach dem Senden melden, damit das Panel den Stand des Displays zeigt
+            self.current_page = display.current_page
+            self._async_publish()
 
-        return payload
+    async def _async_send_page(self, display, targets):
+        """Send the page fields (plus changed values of the new page); display.lock is held."""
+        srv = display.service
+        now = time.monotonic()
+        if not display.health.ready(now):
+            self.stats.count("skipped_degraded", srv)
+            return
+        if display.last_sent is None:
+            # Noch kein voller Datensatz: der nächste Tick sendet alles inkl. Seite
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        # Werte der neuen Seite mitschicken, falls sie sich seit dem letzten Senden geändert haben
+        last = display.last_sent
+        page_fields = self._page_fields(display)
+        fresh = self._build((display.current_page,), time.monotonic())
+        partial_srv = targets.partial_services.get(srv)
+        chart = {}
+        if partial_srv:
+            message = {k: v for k, v in fresh.items() if last.get(k) != v}
+            for key in ("page_num", "page_idx"):
+                if last.get(key) != page_fields[key]:
+                    message[key] = page_fields[key]
+            chart = self._chart_update(display, now)
+            if not message and not chart:
+                # Ein Daten-Push hat die neue Seite schon übertragen
+                return
+            payload = {**last, **message}
+            packed = json.dumps({**message, **chart}, separators=(",", ":"))
+            service, call_data = partial_srv, {"data": packed}
+        else:
+            # Ältere Firmware ohne Partial-Dienst: letzten Datensatz mit neuer Seite senden
+            payload = {**last, **fresh, **page_fields}
+            if payload == last:
+                return
+            packed = json.dumps(payload, separators=(",", ":"))
+            service, call_data = srv, payload
+
+        if not self._async_take_token(display):
+            # Seite kommt mit dem nächsten Push als Delta (page_num/page_idx)
+            return
+        try:
+            with self.stats.measure("page_call"):
+                await asyncio.wait_for(
+                    self.hass.services.async_call("esphome", service, call_data, blocking=True),
+                    DISPLAY_CALL_TIMEOUT,
+                )
+        except Exception as err:
+            if isinstance(err, asyncio.TimeoutError):
+                err = f"Timeout nach {DISPLAY_CALL_TIMEOUT}s"
+            _LOGGER.error("Could not send page to ESPHome service '%s': %s", srv, err)
+            display.health.record_failure(time.monotonic(), err)
+            self.stats.count("failures", srv)
+            return
+
+        self.stats.count("page_pushes", srv)
+        self.stats.payload_bytes.append(len(packed))
+        if partial_srv and chart:
+            display.chart_version = self.history.version
+        if display.health.record_success(time.monotonic()):
+            display.last_sent = None
+        else:
+            display.last_sent = payload
+
+    def _page_fields(self, display):
+        """Return the page related service fields for one display."""
+        enabled_pages = self._pages(display)
+        return {
+            "page_num": int(display.current_page),
+            "auto_rotate": bool(self._rotation_source == "display" and self._switch_mode != PAGE_SWITCH_TOUCH),
+            "page_idx": enabled_pages.index(display.current_page) + 1,
+            "page_total": len(enabled_pages),
+        }
+
+    @callback
+    def _async_take_token(self, display):
+        """Take a rate limit token for a call that is about to be made.
+
+        Token-Bucket: schützt die ESP32-API vor Salven von Dienstaufrufen. Ohne
+        Token wird der Aufruf zurückgestellt (False); zurückgestellte Pushes
+        stauen sich nicht, der Folge-Tick sendet den neuesten Stand.
+        """
+        now = time.monotonic()
+        wait = display.bucket.wait(now)
+        if wait > 0:
+            display.deferred += 1
+            self.stats.count("rate_dropped", display.service)
+            self._async_schedule_followup(wait)
+            return False
+        display.bucket.take(now)
+        if display.deferred:
+            self.stats.count("rate_merged", display.service, display.deferred)
+            display.deferred = 0
+        return True
+
+    @callback
+    def _async_schedule_followup(self, delay):
+        """Refresh again after delay seconds; the earliest requested follow-up wins.
+
+        Used by throttled and rate limited displays and by held deadband values.
+        """
+        due = time.monotonic() + delay
+        if self._unsub_followup is not None:
+            if self._followup_at <= due:
+                return
+            self._unsub_followup()
+
+        @callback
+        def _followup(_now):
+            self._unsub_followup = None
+            self._followup_at = None
+            self.hass.async_create_task(self.async_request_refresh())
+
+        self._followup_at = due
+        self._unsub_followup = async_call_later(self.hass, delay, _followup)
+
+    async def _async_dispatch(self, targets, service_data, pages, now):
+        """Push to all target displays concurrently, each with its own timeout.
+
+        If pages is set, service_data only holds the values of those pages and
+        every display gets the values of its own pages.
+        """
+        jobs = []
+        followup = None
+        for srv in targets.display_services:
+            display = self._display(srv)
+            if not display.health.ready(now):
+                self.stats.count("skipped_degraded", srv)
+                continue
+
+            # Eigenes Push-Intervall pro Display (0 = jede Änderung sofort)
+            push_interval = self._overrides.get(srv, {}).get("push_interval") or 0
+            wait = display.last_push + push_interval - now
+            if wait > 0:
+                followup = wait if followup is None else min(followup, wait)
+                self.stats.count("skipped_throttled", srv)
+                continue
+
+            self._async_check_page(display)
+            payload = dict(service_data)
+            payload.update(self._page_fields(display))
+            if pages is not None:
+                self.slots.prune(payload, self._display_pages(display, now))
+            jobs.append((display, payload))
+
+        if followup is not None:
+            self._async_schedule_followup(followup)
+        if not jobs:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self._async_push_display(display, payload, now, targets.partial_services.get(display.service))
+                for display, payload in jobs
+            ),
+            return_exceptions=True,
+        )
+
+        now = time.monotonic()
+        for (display, _payload), result in zip(jobs, results):
+            health = display.health
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.TimeoutError):
+                    result = f"Timeout nach {DISPLAY_CALL_TIMEOUT}s"
+                _LOGGER.error("Could not call ESPHome service '%s': %s", display.service, result)
+                health.record_failure(now, result)
+                self.stats.count("failures", display.service)
+            elif result == PUSH_SENT and health.record_success(now):
+                # Nur ein echter Aufruf zählt als Erfolg (nicht übersprungen/zurückgestellt).
+                # Nach Ausfall evtl. neu gestartet: nächstes Mal vollen Datensatz senden
+                display.last_sent = None
+
+        # Seite des ersten Displays (wie im Payload), unabhängig davon, welche Displays gesendet haben
+        self.current_page = self.displays[targets.display_services[0]].current_page
+
+    async def _async_push_display(self, display, service_data, now, partial_srv=None):
+        """Push service_data to one display, sending only what changed since the last push.
+
+        Runs under display.lock like the page pushes, so last_sent always
+        matches what the display received. Returns PUSH_SENT, PUSH_SKIPPED
+        (nothing changed) or PUSH_DEFERRED (rate limited).
+        """
+        async with display.lock:
+            # Seite kann inzwischen per Seitenwechsel-Push weitergeschaltet worden sein
+            service_data.update(self._page_fields(display))
+            return await self._async_send_data(display, service_data, now, partial_srv)
+
+    async def _async_send_data(self, display, service_data, now, partial_srv):
+        """Send the full payload or the delta; display.lock is held."""
+        srv = display.service
+        last = display.last_sent
+
+        # Voller Datensatz beim ersten Mal und periodisch als Resync (z.B. nach Display-Neustart)
+        if self._resync_due(display, now):
+            if not self._async_take_token(display):
+                return PUSH_DEFERRED
+            await self._async_call(srv, service_data)
+            self._count_push(srv, "full_pushes", service_data)
+            display.last_full_push = now
+            display.last_push = now
+            display.last_sent = service_data
+            return PUSH_SENT
+
+        delta = {k: v for k, v in service_data.items() if last.get(k) != v}
+        # Verlauf nur über den Partial-Dienst (der volle Dienst kennt die Felder nicht)
+        chart = self._chart_update(display, now) if partial_srv else {}
+        if not delta and not chart:
+            _LOGGER.debug("Keine Änderungen für %s, Dienstaufruf übersprungen", srv)
+            self.stats.count("skipped_unchanged", srv)
+            return PUSH_SKIPPED
+
+        if not self._async_take_token(display):
+            return PUSH_DEFERRED
+        if partial_srv:
+            packed = json.dumps({**delta, **chart}, separators=(",", ":"))
+            await self._async_call(partial_srv, {"data": packed})
+            self.stats.count("delta_pushes", srv)
+            self.stats.payload_bytes.append(len(packed))
+            # Display behält alle nicht gesendeten Werte (auch die ausgeblendeter Seiten)
+            display.last_push = now
+            display.last_sent = {**last, **delta}
+            if chart:
+                display.chart_version = self.history.version
+            return PUSH_SENT
+
+        # Ältere Firmware ohne Partial-Dienst: kompletten Datensatz senden
+        await self._async_call(srv, service_data)
+        self._count_push(srv, "full_pushes", service_data)
+        display.last_push = now
+        display.last_sent = service_data
+        return PUSH_SENT
+
+    async def _async_call(self, service, service_data):
+        """Call an ESPHome service, giving up after DISPLAY_CALL_TIMEOUT.
+
+        Only the call itself is timed, not the wait for display.lock.
+        """
+        with self.stats.measure("service_call"):
+            await asyncio.wait_for(
+                self.hass.services.async_call("esphome", service, service_data, blocking=True),
+                DISPLAY_CALL_TIMEOUT,
+            )
+
+    def _count_push(self, srv, name, service_data):
+        """Count a push and record its serialized size."""
+        self.stats.count(name, srv)
+        self.stats.payload_bytes.append(len(json.dumps(service_data, separators=(",", ":"))))
+
+    @property
+    def latest_version(self):
+        """Latest firmware version published on GitHub."""
+        return self.version_checker.latest_version
 
     async def async_check_version(self, force=False):
-        """Fetch latest version from GitHub."""
-        now = datetime.now()
-        if force or self.latest_version == "0.0.0" or self.last_version_check is None or (now - self.last_version_check).total_seconds() > 60:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.version_url, timeout=5) as response:
-                        if response.status == 200:
-                            self.latest_version = (await response.text()).strip()
-                            self.last_version_check = now
-                            _LOGGER.debug("Latest GitHub version: %s", self.latest_version)
-                            return True
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch version from GitHub: %s", e)
-        return False
+        """Fetch latest version from GitHub (shared, rate-limited)."""
+        return await self.version_checker.async_check(force=force)
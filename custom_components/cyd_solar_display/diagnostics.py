@@ -0,0 +1,40 @@
+"""Diagnostics support for CYD Solar Display."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_HOST
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    targets = coordinator.targets.async_get()
+    checker = coordinator.version_checker
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "push_mode": coordinator.push_mode,
+        "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+        "current_page": coordinator.current_page,
+        "targets": {
+            "display_services": targets.display_services,
+            "all_display_services": targets.all_display_services,
+            "partial_services": targets.partial_services,
+            "ambiguous": targets.ambiguous,
+        },
+        "displays": {srv: display.as_dict() for srv, display in coordinator.displays.items()},
+        "stats": coordinator.stats.as_dict(),
+        "history": coordinator.history.as_dict() if coordinator.history is not None else None,
+        "version_check": {
+            "latest_version": checker.latest_version,
+            "last_check": checker.last_check.isoformat() if checker.last_check else None,
+            "interval": checker.interval,
+            **checker.stats.as_dict(),
+        },
+    }
@@ -0,0 +1,164 @@
+"""Cached ESPHome target discovery for CYD Solar Display."""
+import logging
+
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
+from homeassistant.const import EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import CONF_HOST, CONF_BROADCAST_MODE
+
+_LOGGER = logging.getLogger(__name__)
+
+DISPLAY_SERVICE_PREFIX = "cyd_solar_display_"
+DISPLAY_SERVICE_SUFFIX = "_update_display"
+PARTIAL_SERVICE_SUFFIX = "_update_partial"
+GENERIC_DISPLAY_SERVICE = "cyd_solar_display_update_display"
+
+
+def _slug(name):
+    """Mirror the ESPHome device -> service name conversion."""
+    return str(name).lower().replace("-", "_").replace(" ", "_")
+
+
+class DisplayTargets:
+    """Resolved ESPHome targets for one config entry."""
+
+    def __init__(self):
+        self.esphome_entry = None
+        self.update_entity_id = None
+        self.ota_service = None
+        self.display_services = []      # Dienste, an die gesendet wird
+        self.all_display_services = []  # alle gefundenen CYD-Dienste
+        self.partial_services = {}      # update_display -> update_partial (falls vorhanden)
+        self.ambiguous = False          # mehrere Displays, aber keines passt zum Host
+
+
+class CYDTargetResolver:
+    """Resolve and cache the ESPHome entry, update entity and services of a display.
+
+    The lookup walks all ESPHome config entries, the entity registry and the
+    service registry, so it is only redone after one of those changed.
+    """
+
+    def __init__(self, hass, entry):
+        """Initialize."""
+        self.hass = hass
+        self.entry = entry
+        self._targets = None
+        self._unsubs = []
+
+    @callback
+    def async_start(self):
+        """Listen for changes that invalidate the cache."""
+        if self._unsubs:
+            return
+        self._unsubs = [
+            self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_invalidate),
+            self.hass.bus.async_listen(EVENT_SERVICE_REGISTERED, self._async_service_changed),
+            self.hass.bus.async_listen(EVENT_SERVICE_REMOVED, self._async_service_changed),
+            async_dispatcher_connect(self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_entry_changed),
+        ]
+
+    @callback
+    def async_stop(self):
+        """Stop listening and drop the cache."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        self._targets = None
+
+    @callback
+    def _async_invalidate(self, *_):
+        """Drop the cached targets."""
+        self._targets = None
+
+    @callback
+    def _async_service_changed(self, event):
+        """Invalidate on ESPHome service (un)registration only."""
+        if event.data.get("domain") == "esphome":
+            self._targets = None
+
+    @callback
+    def _async_entry_changed(self, change, entry):
+        """Invalidate when an ESPHome entry or our own entry changes."""
+        if entry.domain == "esphome" or entry.entry_id == self.entry.entry_id:
+            self._targets = None
+
+    @callback
+    def async_get(self):
+        """Return the cached targets, resolving them if needed."""
+        if self._targets is None:
+            self._targets = self._resolve()
+        return self._targets
+
+    def _resolve(self):
+        """Walk config entries, entity registry and services once."""
+        targets = DisplayTargets()
+        target_host = self.entry.data.get(CONF_HOST)
+        _LOGGER.debug("Suche nach ESPHome-Gerät für Host %s", target_host)
+
+        # 1. Finde den Config Entry von ESPHome für diese IP
+        esphome_entry = next(
+            (e for e in self.hass.config_entries.async_entries("esphome") if e.data.get("host") == target_host),
+            None,
+        )
+        targets.esphome_entry = esphome_entry
+
+        if esphome_entry:
+            device_name = _slug(esphome_entry.title)
+            targets.ota_service = f"{device_name}_trigger_ota_update"
+            _LOGGER.debug("ESPHome Eintrag gefunden: %s, Dienst: %s", esphome_entry.title, targets.ota_service)
+
+            # 2. Update-Entität für diesen Eintrag suchen
+            ent_reg = er.async_get(self.hass)
+            for entity in er.async_entries_for_config_entry(ent_reg, esphome_entry.entry_id):
+                if entity.domain == "update":
+                    targets.update_entity_id = entity.entity_id
+                    _LOGGER.info("Gefundene Ziel-Entität für Updates: %s", entity.entity_id)
+                    break
+        else:
+            _LOGGER.warning("Kein ESPHome-Gerät für Host %s gefunden. Update-Funktion eingeschränkt.", target_host)
+
+        # 3. Display-Dienste einsammeln
+        esphome_services = self.hass.services.async_services().get("esphome", {})
+        all_solar_services = [
+            s for s in esphome_services
+            if s.startswith(DISPLAY_SERVICE_PREFIX) and s.endswith(DISPLAY_SERVICE_SUFFIX)
+        ]
+        if GENERIC_DISPLAY_SERVICE in esphome_services and GENERIC_DISPLAY_SERVICE not in all_solar_services:
+            all_solar_services.append(GENERIC_DISPLAY_SERVICE)
+        targets.all_display_services = all_solar_services
+
+        target_services = []
+        if self.entry.options.get(CONF_BROADCAST_MODE, False):
+            target_services = list(all_solar_services)
+        else:
+            # Specific Mode: Target only the display matching the configured IP (host)
+            for e in self.hass.config_entries.async_entries("esphome"):
+                if e.data.get("host") != target_host:
+                    continue
+                for d_name in (e.data.get("name", ""), e.title):
+                    if d_name:
+                        srv = f"{_slug(d_name)}{DISPLAY_SERVICE_SUFFIX}"
+                        if srv in esphome_services:
+                            target_services = [srv]
+                            break
+                if target_services:
+                    break
+
+        # Fallback: If specific targeting fails but only one generic service exists, use it!
+        if not target_services and len(all_solar_services) == 1:
+            target_services = list(all_solar_services)
+            _LOGGER.debug("Calling only service %s as specific match failed but 1 display exists", target_services[0])
+        elif not target_services and len(all_solar_services) > 1:
+            targets.ambiguous = True
+
+        targets.display_services = target_services
+
+        for srv in set(all_solar_services) | set(target_services):
+            partial = srv[: -len(DISPLAY_SERVICE_SUFFIX)] + PARTIAL_SERVICE_SUFFIX
+            targets.partial_services[srv] = partial if partial in esphome_services else None
+
+        return targets
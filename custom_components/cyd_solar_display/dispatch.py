@@ -0,0 +1,143 @@
+"""Per-display state and health tracking for pushes to CYD Solar Displays."""
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timeout für einen einzelnen Dienstaufruf (Sekunden)
+DISPLAY_CALL_TIMEOUT = 5
+# Nach so vielen Fehlern in Folge gilt ein Display als "degraded"
+DEGRADED_AFTER = 3
+# Backoff für degradierte Displays: 10 s, 20 s, 40 s, ... max. 5 min
+BACKOFF_BASE = 10
+BACKOFF_MAX = 300
+
+# Ergebnis eines Daten-Pushes an ein Display
+PUSH_SENT = "sent"            # Dienst wurde aufgerufen
+PUSH_SKIPPED = "skipped"      # nichts geändert, kein Aufruf nötig
+PUSH_DEFERRED = "deferred"    # Rate-Limit, der Folge-Tick sendet den neuesten Stand
+
+
+class TokenBucket:
+    """Burst and sustained rate limit for service calls to one display."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate, burst):
+        """Initialize with a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def configure(self, rate, burst):
+        """Change the limits, keeping the tokens collected so far."""
+        # Bisher verdiente Tokens noch mit der alten Rate gutschreiben
+        self._refill(time.monotonic())
+        self.rate = rate
+        self.burst = burst
+        self.tokens = min(self.tokens, float(burst))
+
+    def _refill(self, now):
+        """Add the tokens earned since the last call."""
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait(self, now):
+        """Return the seconds until a call is allowed (0 = now)."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now):
+        """Spend one token for a call."""
+        self._refill(now)
+        self.tokens -= 1
+
+
+class DisplayHealth:
+    """Failure counter and retry backoff for one display service."""
+
+    __slots__ = ("service", "failures", "degraded", "next_attempt", "last_error", "last_success")
+
+    def __init__(self, service):
+        """Initialize."""
+        self.service = service
+        self.failures = 0
+        self.degraded = False
+        self.next_attempt = 0.0
+        self.last_error = None
+        self.last_success = None
+
+    def ready(self, now):
+        """Return True if the display may be contacted at monotonic time now."""
+        return not self.degraded or now >= self.next_attempt
+
+    def record_success(self, now):
+        """Reset the failure state. Returns True if the display just recovered."""
+        recovered = self.degraded
+        if recovered:
+            _LOGGER.info("Display-Dienst %s antwortet wieder", self.service)
+        self.failures = 0
+        self.degraded = False
+        self.next_attempt = 0.0
+        self.last_error = None
+        self.last_success = now
+        return recovered
+
+    def record_failure(self, now, err):
+        """Count a failure and schedule the next retry once degraded."""
+        self.failures += 1
+        self.last_error = str(err) or type(err).__name__
+        if self.failures < DEGRADED_AFTER:
+            return
+        if not self.degraded:
+            _LOGGER.warning(
+                "Display-Dienst %s nach %d Fehlern als gestört markiert: %s",
+                self.service, self.failures, self.last_error,
+            )
+        self.degraded = True
+        delay = min(BACKOFF_BASE * 2 ** (self.failures - DEGRADED_AFTER), BACKOFF_MAX)
+        self.next_attempt = now + delay
+
+    def as_dict(self):
+        """Return a diagnostics friendly snapshot."""
+        return {
+            "failures": self.failures,
+            "degraded": self.degraded,
+            "last_error": self.last_error,
+        }
+
+
+class DisplayState:
+    """Everything the coordinator tracks for one display service."""
+
+    __slots__ = (
+        "service", "health", "last_sent", "last_full_push", "last_push",
+        "current_page", "last_page_switch", "unsub_rotate", "bucket", "deferred", "chart_version", "lock",
+    )
+
+    def __init__(self, service, page=None, bucket=None):
+        """Initialize."""
+        self.service = service
+        self.health = DisplayHealth(service)
+        self.last_sent = None        # zuletzt gesendeter Datensatz (für Deltas)
+        self.last_full_push = 0.0    # monotonic, letzter voller Datensatz
+        self.last_push = 0.0         # monotonic, letzter erfolgreicher Push
+        self.current_page = page
+        self.last_page_switch = time.monotonic()
+        self.unsub_rotate = None     # Timer für den nächsten Seitenwechsel
+        self.bucket = bucket         # TokenBucket oder None (kein Limit)
+        self.deferred = 0            # wegen Rate-Limit zurückgestellte Pushes seit dem letzten
+        self.chart_version = None    # zuletzt gesendeter Stand des Verlaufs
+        # Daten- und Seiten-Pushes nacheinander, damit last_sent dem Display-Stand entspricht
+        self.lock = asyncio.Lock()
+
+    def as_dict(self):
+        """Return a diagnostics friendly snapshot."""
+        return {
+            "page": self.current_page,
+            "tokens": round(self.bucket.tokens, 2) if self.bucket else None,
+            **self.health.as_dict(),
+        }
@@ -0,0 +1,204 @@
+"""Content-addressed local cache for CYD firmware images."""
+import asyncio
+import hashlib
+import logging
+import os
+
+import aiohttp
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+FIRMWARE_URL = "https://raw.githubusercontent.com/low-streaming/cyd_solar_display/main/cyd_solar_display.bin"
+CHECKSUM_URL = f"{FIRMWARE_URL}.sha256"
+
+CACHE_STORE_VERSION = 1
+# So viele Versionen bleiben auf der Platte liegen (für Rollback/Offline)
+KEEP_VERSIONS = 2
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+CHECKSUM_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+class FirmwareError(Exception):
+    """Firmware could not be provided."""
+
+
+class ChecksumError(FirmwareError):
+    """Downloaded firmware does not match the published checksum."""
+
+
+class FirmwareArtifact:
+    """A verified firmware image on disk."""
+
+    __slots__ = ("path", "sha256", "size", "version", "source")
+
+    def __init__(self, path, sha256, size, version, source):
+        """Initialize."""
+        self.path = path
+        self.sha256 = sha256
+        self.size = size
+        self.version = version
+        self.source = source    # "cache" oder "download"
+
+
+@callback
+def async_get_firmware_cache(hass):
+    """Return the integration-wide firmware cache, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "firmware_cache" not in domain_data:
+        domain_data["firmware_cache"] = FirmwareCache(hass)
+    return domain_data["firmware_cache"]
+
+
+class FirmwareCache:
+    """Download each firmware version once and reuse it for every display.
+
+    Images are stored as <sha256>.bin below <config>/cyd_solar_display/firmware,
+    the version -> hash index lives in .storage. A download is only accepted if
+    it matches the .sha256 file published next to the image; without a
+    checksum nothing is downloaded. Without network (or checksum) the newest
+    cached image is served instead; the artifact then carries the version
+    actually served.
+    """
+
+    def __init__(self, hass, url=FIRMWARE_URL, checksum_url=CHECKSUM_URL):
+        """Initialize."""
+        self.hass = hass
+        self.url = url
+        self.checksum_url = checksum_url
+        self.directory = hass.config.path(DOMAIN, "firmware")
+        self._store = Store(hass, CACHE_STORE_VERSION, f"{DOMAIN}.firmware_cache")
+        self._index = None      # {"versions": {version: sha256}, "order": [version, ...]}
+        self._lock = asyncio.Lock()
+
+    def _path(self, sha256):
+        """Return the cache path of an image."""
+        return os.path.join(self.directory, f"{sha256}.bin")
+
+    async def _async_load_index(self):
+        """Load the version index once."""
+        if self._index is None:
+            self._index = await self._store.async_load() or {"versions": {}, "order": []}
+        return self._index
+
+    async def async_get(self, version):
+        """Return a verified firmware artifact for version.
+
+        Concurrent installs wait for the same download instead of starting their own.
+        """
+        async with self._lock:
+            index = await self._async_load_index()
+            session = async_get_clientsession(self.hass)
+            expected = await self._async_fetch_checksum(session)
+
+            sha256 = expected or index["versions"].get(version)
+            if sha256 and await self.hass.async_add_executor_job(os.path.isfile, self._path(sha256)):
+                _LOGGER.debug("Firmware %s aus dem Cache (%s)", version, sha256[:12])
+                size = await self.hass.async_add_executor_job(os.path.getsize, self._path(sha256))
+                await self._async_remember(version, sha256)
+                return FirmwareArtifact(self._path(sha256), sha256, size, version, "cache")
+
+            try:
+                if expected is None:
+                    # Ungeprüfte Images werden weder gecacht noch geflasht
+                    raise FirmwareError("Prüfsumme nicht verfügbar")
+                sha256, size = await self._async_download(session, expected)
+            except ChecksumError:
+                raise
+            except (FirmwareError, aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.warning("Firmware-Download fehlgeschlagen (%s), nutze gecachte Firmware", err)
+                return await self._async_offline()
+
+            await self._async_remember(version, sha256)
+            return FirmwareArtifact(self._path(sha256), sha256, size, version, "download")
+
+    async def _async_fetch_checksum(self, session):
+        """Return the published SHA-256 or None if it is not available."""
+        try:
+            async with session.get(self.checksum_url, timeout=CHECKSUM_TIMEOUT) as resp:
+                if resp.status != 200:
+                    return None
+                # Format wie sha256sum: "<hash>  cyd_solar_display.bin"
+                text = (await resp.text()).strip()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Prüfsumme nicht abrufbar: %s", err)
+            return None
+        sha256 = text.split()[0].lower() if text else ""
+        if len(sha256) != 64:
+            _LOGGER.warning("Ungültige Prüfsumme unter %s", self.checksum_url)
+            return None
+        return sha256
+
+    async def _async_download(self, session, expected):
+        """Stream the image to disk while hashing it, return (sha256, size)."""
+        await self.hass.async_add_executor_job(os.makedirs, self.directory, 0o755, True)
+        tmp_path = os.path.join(self.directory, "download.tmp")
+        digest = hashlib.sha256()
+        size = 0
+
+        _LOGGER.info("Lade Firmware von GitHub herunter: %s", self.url)
+        file = await self.hass.async_add_executor_job(open, tmp_path, "wb")
+        try:
+            async with session.get(self.url, timeout=DOWNLOAD_TIMEOUT) as resp:
+                if resp.status != 200:
+                    raise FirmwareError(f"Download fehlgeschlagen (Status {resp.status})")
+                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await self.hass.async_add_executor_job(file.write, chunk)
+        except BaseException:
+            await self.hass.async_add_executor_job(file.close)
+            await self.hass.async_add_executor_job(os.remove, tmp_path)
+            raise
+        await self.hass.async_add_executor_job(file.close)
+
+        sha256 = digest.hexdigest()
+        if sha256 != expected:
+            await self.hass.async_add_executor_job(os.remove, tmp_path)
+            raise ChecksumError(f"Prüfsumme stimmt nicht (erwartet {expected[:12]}, erhalten {sha256[:12]})")
+
+        await self.hass.async_add_executor_job(os.replace, tmp_path, self._path(sha256))
+        return sha256, size
+
+    async def _async_remember(self, version, sha256):
+        """Index version -> image and drop images of old versions."""
+        index = self._index
+        if index["versions"].get(version) == sha256 and index["order"][-1:] == [version]:
+            return
+        index["versions"][version] = sha256
+        index["order"] = [v for v in index["order"] if v != version] + [version]
+
+        stale = index["order"][:-KEEP_VERSIONS]
+        index["order"] = index["order"][-KEEP_VERSIONS:]
+        keep = {index["versions"][v] for v in index["order"]}
+        for old in stale:
+            old_sha = index["versions"].pop(old, None)
+            if old_sha and old_sha not in keep:
+                await self.hass.async_add_executor_job(self._remove, self._path(old_sha))
+        await self._store.async_save(index)
+
+    @staticmethod
+    def _remove(path):
+        """Delete a cached image, ignoring already missing files."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    async def _async_offline(self):
+        """Return the newest cached image."""
+        index = self._index
+        for version in reversed(index["order"]):
+            sha256 = index["versions"][version]
+            path = self._path(sha256)
+            if await self.hass.async_add_executor_job(os.path.isfile, path):
+                size = await self.hass.async_add_executor_job(os.path.getsize, path)
+                _LOGGER.info("Offline: nutze gecachte Firmware %s", version)
+                return FirmwareArtifact(path, sha256, size, version, "cache")
+
+        raise FirmwareError("Keine Firmware verfügbar (offline und kein Cache)")
@@ -0,0 +1,180 @@
+"""Fleet-wide firmware rollout for all CYD Solar Displays."""
+import asyncio
+import logging
+import time
+
+import voluptuous as vol
+from homeassistant.core import callback, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+from .firmware import async_get_firmware_cache, FirmwareError
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_UPDATE_ALL = "update_all"
+
+ATTR_CONCURRENCY = "concurrency"
+ATTR_CANARY = "canary"
+ATTR_ABORT_ON_FAILURE = "abort_on_failure"
+ATTR_FORCE = "force"
+
+DEFAULT_CONCURRENCY = 2
+MAX_CONCURRENCY = 10
+
+UPDATE_ALL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONCURRENCY, default=DEFAULT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENCY)
+        ),
+        vol.Optional(ATTR_CANARY): cv.entity_id,
+        vol.Optional(ATTR_ABORT_ON_FAILURE, default=True): cv.boolean,
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+    }
+)
+
+RESULT_SUCCESS = "success"
+RESULT_FAILED = "failed"
+RESULT_SKIPPED = "skipped"
+RESULT_UP_TO_DATE = "up_to_date"
+
+
+@callback
+def async_register_services(hass):
+    """Register cyd_solar_display.update_all (once for all entries)."""
+    if hass.services.has_service(DOMAIN, SERVICE_UPDATE_ALL):
+        return
+
+    async def _async_handle_update_all(call):
+        return await FleetUpdate(hass, **call.data).async_run()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UPDATE_ALL,
+        _async_handle_update_all,
+        schema=UPDATE_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+class FleetUpdate:
+    """One rollout over all registered CYD update entities.
+
+    The canary display is updated alone first; the others follow with at most
+    `concurrency` uploads at a time. With abort_on_failure the first failure
+    stops all uploads that have not started yet.
+    """
+
+    def __init__(self, hass, concurrency=DEFAULT_CONCURRENCY, canary=None, abort_on_failure=True, force=False):
+        """Initialize."""
+        self.hass = hass
+        self.concurrency = concurrency
+        self.canary = canary
+        self.abort_on_failure = abort_on_failure
+        self.force = force
+        self._abort = asyncio.Event()
+        self.results = {}
+
+    def _entities(self):
+        """Return the update entities in rollout order, one per display host."""
+        by_host = {}
+        for entity in self.hass.data.get(DOMAIN, {}).get("update_entities", {}).values():
+            if entity.target_host and entity.target_host not in by_host:
+                by_host[entity.target_host] = entity
+        entities = sorted(by_host.values(), key=lambda e: e.entity_id or "")
+        if self.canary:
+            canary = next((e for e in entities if e.entity_id == self.canary), None)
+            if canary is None:
+                raise HomeAssistantError(f"Canary {self.canary} ist kein CYD Update-Entity")
+            entities.remove(canary)
+            entities.insert(0, canary)
+        return entities
+
+    def _result(self, entity, result, error=None, duration=None, installed=None):
+        """Record the outcome for one display (installed = version actually flashed)."""
+        self.results[entity.entity_id] = {
+            "host": entity.target_host,
+            "result": result,
+            "error": error,
+            "duration": round(duration, 1) if duration is not None else None,
+            "installed_version": installed,
+        }
+
+    async def _async_update_one(self, entity, version, semaphore=None):
+        """Update one display unless the rollout was aborted."""
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            if self._abort.is_set():
+                self._result(entity, RESULT_SKIPPED, "Abgebrochen nach Fehler")
+                return False
+            start = time.monotonic()
+            try:
+                artifact = await entity.async_push_update(version)
+            except Exception as err:
+                _LOGGER.error("Fleet-Update: %s (%s) fehlgeschlagen: %s", entity.entity_id, entity.target_host, err)
+                self._result(entity, RESULT_FAILED, str(err) or type(err).__name__, time.monotonic() - start)
+                if self.abort_on_failure:
+                    self._abort.set()
+                return False
+            _LOGGER.info(
+                "Fleet-Update: %s (%s) erfolgreich, Firmware %s",
+                entity.entity_id, entity.target_host, artifact.version,
+            )
+            self._result(entity, RESULT_SUCCESS, duration=time.monotonic() - start, installed=artifact.version)
+            return True
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    async def async_run(self):
+        """Run the rollout and return a per-display summary."""
+        entities = self._entities()
+        if not entities:
+            raise HomeAssistantError("Keine CYD Displays für ein Update gefunden")
+
+        version = entities[0].latest_version
+        pending = []
+        for entity in entities:
+            if not self.force and entity.installed_version == version:
+                self._result(entity, RESULT_UP_TO_DATE)
+            else:
+                pending.append(entity)
+
+        if pending:
+            # Firmware einmal vorab laden, alle Displays teilen sich das Image im Cache
+            try:
+                artifact = await async_get_firmware_cache(self.hass).async_get(version)
+            except FirmwareError as err:
+                raise HomeAssistantError(f"Firmware nicht verfügbar: {err}") from err
+            if artifact.version != version:
+                # Offline: ältere Version aus dem Cache, nicht als Update auf die angefragte melden
+                _LOGGER.warning(
+                    "Fleet-Update: Version %s nicht verfügbar, verteile gecachte Firmware %s",
+                    version, artifact.version,
+                )
+
+            _LOGGER.info(
+                "Fleet-Update auf %s für %d Displays (max. %d parallel)", version, len(pending), self.concurrency
+            )
+            canary, rest = pending[0], pending[1:]
+            if await self._async_update_one(canary, version) or not self.abort_on_failure:
+                semaphore = asyncio.Semaphore(self.concurrency)
+                await asyncio.gather(*(self._async_update_one(e, version, semaphore) for e in rest))
+            else:
+                for entity in rest:
+                    self._result(entity, RESULT_SKIPPED, "Canary fehlgeschlagen")
+
+        summary = {
+            result: sum(1 for r in self.results.values() if r["result"] == result)
+            for result in (RESULT_SUCCESS, RESULT_FAILED, RESULT_SKIPPED, RESULT_UP_TO_DATE)
+        }
+        _LOGGER.info("Fleet-Update abgeschlossen: %s", summary)
+        installed = {r["installed_version"] for r in self.results.values() if r["result"] == RESULT_SUCCESS}
+        return {
+            "version": version,
+            "installed_versions": sorted(installed),
+            "summary": summary,
+            "displays": self.results,
+        }
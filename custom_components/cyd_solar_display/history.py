@@ -0,0 +1,134 @@
+"""Fixed-size power history for the chart page of the CYD Solar Display."""
+import base64
+import math
+from array import array
+
+# 24 h in 1-Minuten-Buckets, ein Satz Arrays pro Wert
+HISTORY_FIELDS = ("solar", "grid", "house", "bat_w")
+HISTORY_BUCKET = 60
+HISTORY_SIZE = 1440
+# Abtastung mit festem Takt, damit jeder Bucket gleich gewichtet ist (unabhängig von Ticks)
+HISTORY_SAMPLE_INTERVAL = 10
+# Punkte pro Verlauf auf dem Display (24 h -> 15 min pro Punkt)
+CHART_POINTS = 96
+# Quantisierung: 0..254 über die gemeinsame Skala, 255 = keine Daten
+CHART_LEVELS = 254
+CHART_MISSING = 255
+
+_NAN = float("nan")
+
+
+class PowerHistory:
+    """Min/max/mean per time bucket in float32 ring buffers.
+
+    Memory is allocated once (fields x 3 x size floats) and stays the same
+    however long Home Assistant runs. Samples are folded into the running
+    bucket; a bucket is written to the ring when the next one starts.
+    """
+
+    __slots__ = (
+        "fields", "size", "bucket_seconds", "_mins", "_maxs", "_means",
+        "_head", "_bucket", "_acc", "_packed", "version",
+    )
+
+    def __init__(self, fields=HISTORY_FIELDS, size=HISTORY_SIZE, bucket_seconds=HISTORY_BUCKET):
+        """Initialize."""
+        self.fields = fields
+        self.size = size
+        self.bucket_seconds = bucket_seconds
+        self._mins = [array("f", [_NAN]) * size for _ in fields]
+        self._maxs = [array("f", [_NAN]) * size for _ in fields]
+        self._means = [array("f", [_NAN]) * size for _ in fields]
+        self._head = 0          # nächster Schreibindex im Ring
+        self._bucket = None     # Nummer des laufenden Buckets (Sekunden seit Epoche // bucket_seconds)
+        self._acc = [[0.0, 0, math.inf, -math.inf] for _ in fields]  # Summe, Anzahl, Min, Max
+        self._packed = None     # (version, points, Felder) – alle Displays teilen sich das Ergebnis
+        self.version = 0        # zählt abgeschlossene Buckets (für "neue Daten?")
+
+    def add(self, now, values):
+        """Add one sample per field (None = unavailable) at wall clock time now."""
+        bucket = int(now // self.bucket_seconds)
+        if self._bucket is None:
+            self._bucket = bucket
+        elif bucket > self._bucket:
+            self._close()
+            # Lücken (z.B. HA war gestoppt) als "keine Daten" eintragen
+            for _ in range(min(bucket - self._bucket - 1, self.size)):
+                self._close()
+            self._bucket = bucket
+
+        for acc, value in zip(self._acc, values):
+            if value is None:
+                continue
+            acc[0] += value
+            acc[1] += 1
+            if value < acc[2]:
+                acc[2] = value
+            if value > acc[3]:
+                acc[3] = value
+
+    def _close(self):
+        """Write the running bucket to the ring and start an empty one."""
+        head = self._head
+        for i, acc in enumerate(self._acc):
+            if acc[1]:
+                self._mins[i][head] = acc[2]
+                self._maxs[i][head] = acc[3]
+                self._means[i][head] = acc[0] / acc[1]
+            else:
+                self._mins[i][head] = self._maxs[i][head] = self._means[i][head] = _NAN
+            acc[0], acc[1], acc[2], acc[3] = 0.0, 0, math.inf, -math.inf
+        self._head = (head + 1) % self.size
+        self.version += 1
+
+    def series(self, points=CHART_POINTS):
+        """Return (mins, means, maxs) per field, oldest first, downsampled to points."""
+        group = max(self.size // points, 1)
+        order = [(self._head + i) % self.size for i in range(self.size)]
+        result = []
+        for mins, means, maxs in zip(self._mins, self._means, self._maxs):
+            lows, avgs, highs = [], [], []
+            for start in range(0, self.size - group + 1, group):
+                idxs = [idx for idx in order[start:start + group] if not math.isnan(means[idx])]
+                if not idxs:
+                    lows.append(None)
+                    avgs.append(None)
+                    highs.append(None)
+                    continue
+                lows.append(min(mins[idx] for idx in idxs))
+                avgs.append(sum(means[idx] for idx in idxs) / len(idxs))
+                highs.append(max(maxs[idx] for idx in idxs))
+            result.append((lows, avgs, highs))
+        return result
+
+    def packed(self, points=CHART_POINTS):
+        """Return the chart fields: shared scale plus one base64 string per field.
+
+        Every point is three bytes (min, mean, max), quantized to 0..254 over
+        ch_lo..ch_hi; 255 marks a point without data.
+        """
+        if self._packed is not None and self._packed[:2] == (self.version, points):
+            return self._packed[2]
+        series = self.series(points)
+        values = [v for lows, _avgs, highs in series for v in lows + highs if v is not None]
+        lo = min(values) if values else 0.0
+        hi = max(values) if values else 0.0
+        span = (hi - lo) or 1.0
+
+        fields = {"ch_lo": round(lo, 1), "ch_hi": round(hi, 1), "ch_points": points}
+        for name, (lows, avgs, highs) in zip(self.fields, series):
+            raw = bytearray()
+            for triple in zip(lows, avgs, highs):
+                for v in triple:
+                    raw.append(CHART_MISSING if v is None else round((v - lo) / span * CHART_LEVELS))
+            fields[f"ch_{name}"] = base64.b64encode(bytes(raw)).decode("ascii")
+        self._packed = (self.version, points, fields)
+        return fields
+
+    def as_dict(self):
+        """Return a diagnostics friendly snapshot."""
+        return {
+            "buckets": min(self.version, self.size),
+            "bucket_seconds": self.bucket_seconds,
+            "bytes": sum(a.itemsize * len(a) for arrays in (self._mins, self._maxs, self._means) for a in arrays),
+        }
@@ -0,0 +1,95 @@
+"""Streaming firmware upload to the ESPHome web server of a CYD display."""
+import logging
+import uuid
+
+import aiohttp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .firmware import async_get_firmware_cache, FirmwareError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Firmware wird in kleinen Stücken durchgereicht statt komplett im RAM gehalten
+CHUNK_SIZE = 16 * 1024
+UPLOAD_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_connect=10)
+
+
+class OTAError(Exception):
+    """Firmware could not be downloaded or pushed to the display."""
+
+
+def _multipart_frame(boundary, filename):
+    """Return the multipart head and tail around the firmware bytes."""
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="update"; filename="{filename}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    return head, tail
+
+
+async def async_upload_firmware(hass, host, chunks, size, progress=None):
+    """Stream firmware chunks as multipart upload to http://<host>/update.
+
+    The ESPHome web server needs a Content-Length, so the multipart frame is
+    built by hand around the streamed body instead of using aiohttp.FormData.
+    progress(percent) is called whenever the integer percentage changes.
+    """
+    boundary = uuid.uuid4().hex
+    head, tail = _multipart_frame(boundary, "firmware.bin")
+    state = {"sent": 0, "percent": -1}
+
+    async def _body():
+        yield head
+        async for chunk in chunks:
+            state["sent"] += len(chunk)
+            if state["sent"] > size:
+                raise OTAError(f"Firmware größer als angekündigt ({size} Bytes)")
+            yield chunk
+            percent = state["sent"] * 100 // size
+            if progress is not None and percent != state["percent"]:
+                state["percent"] = percent
+                progress(percent)
+        if state["sent"] != size:
+            raise OTAError(f"Firmware unvollständig ({state['sent']} von {size} Bytes)")
+        yield tail
+
+    upload_url = f"http://{host}/update"
+    _LOGGER.info("Pushing Firmware zu Display unter: %s (%d Bytes)", upload_url, size)
+    session = async_get_clientsession(hass)
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        "Content-Length": str(len(head) + size + len(tail)),
+    }
+    try:
+        async with session.post(upload_url, data=_body(), headers=headers, timeout=UPLOAD_TIMEOUT) as resp:
+            if resp.status != 200:
+                raise OTAError(f"Push fehlgeschlagen! Status: {resp.status}. Ist der WebServer aktiv?")
+    except aiohttp.ClientError as err:
+        raise OTAError(f"Display {host} nicht erreichbar: {err}") from err
+
+
+async def _async_read_file(hass, path):
+    """Yield a file in chunks without blocking the event loop."""
+    file = await hass.async_add_executor_job(open, path, "rb")
+    try:
+        while chunk := await hass.async_add_executor_job(file.read, CHUNK_SIZE):
+            yield chunk
+    finally:
+        await hass.async_add_executor_job(file.close)
+
+
+async def async_push_firmware(hass, host, version=None, progress=None):
+    """Push the firmware for version from the local cache to the display.
+
+    The image is downloaded at most once per version (see firmware.py) and
+    streamed from disk, so neither the download nor the upload is held in RAM.
+    Returns the FirmwareArtifact that was installed.
+    """
+    try:
+        artifact = await async_get_firmware_cache(hass).async_get(version or "latest")
+    except FirmwareError as err:
+        raise OTAError(str(err)) from err
+    await async_upload_firmware(hass, host, _async_read_file(hass, artifact.path), artifact.size, progress)
+    return artifact
@@ -0,0 +1,53 @@
+"""Diagnostic sensors for the CYD Solar Display push pipeline."""
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+# (Schlüssel, Name, Stufe oder Zähler, Einheit, State-Class)
+STAT_SENSORS = (
+    ("tick_p95", "Tick duration p95", ("stage", "tick"), UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT),
+    ("push_p95", "Push latency p95", ("stage", "service_call"), UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT),
+    ("skipped_unchanged", "Pushes skipped (unchanged)", ("counter", "skipped_unchanged"), None, SensorStateClass.TOTAL_INCREASING),
+    ("failures", "Push failures", ("counter", "failures"), None, SensorStateClass.TOTAL_INCREASING),
+    ("rate_dropped", "Pushes deferred (rate limit)", ("counter", "rate_dropped"), None, SensorStateClass.TOTAL_INCREASING),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
+    """Set up the diagnostic sensors (disabled by default)."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(CYDStatSensor(coordinator, entry, *description) for description in STAT_SENSORS)
+
+
+class CYDStatSensor(CoordinatorEntity, SensorEntity):
+    """One figure from the coordinator instrumentation."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, entry, key, name, source, unit, state_class):
+        """Initialize."""
+        super().__init__(coordinator)
+        self._source = source
+        self._attr_unique_id = f"{entry.entry_id}_stat_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
+
+    @property
+    def native_value(self):
+        """Return the current figure."""
+        kind, name = self._source
+        stats = self.coordinator.stats
+        if kind == "stage":
+            stage = stats.stage(name)
+            return stage["p95"] if stage else None
+        # Summe über alle Displays
+        return sum(counters.get(name, 0) for counters in stats.per_display.values())
@@ -0,0 +1,224 @@
+"""Compiled display slot table for CYD Solar Display."""
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+
+from .const import (
+    CORE_SLOTS,
+    CORE_SLOT_PAGES,
+    CUSTOM_SLOTS,
+    PAGE_DEFAULTS,
+    CONF_SHOW_KW,
+    CONF_DEADBANDS,
+    CHART_PAGE,
+    CONF_ENABLE_CHART,
+)
+from .history import HISTORY_FIELDS
+
+
+def format_number(state):
+    """Format a state for a numeric display field (0.0 if unavailable)."""
+    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return 0.0
+    try:
+        return round(float(state.state), 1)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def format_custom(state):
+    """Format a state as display text including its unit."""
+    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return "--"
+    val = state.state
+    try:
+        fval = float(val)
+        if fval.is_integer():
+            val = f"{int(fval)}"
+        else:
+            val = f"{round(fval, 2)}"
+    except ValueError:
+        pass
+    unit = state.attributes.get("unit_of_measurement", "")
+    return f"{val} {unit}".strip() or " "
+
+
+def _to_float(value):
+    """Return value as float, 0.0 if unset or invalid."""
+    try:
+        return max(float(value or 0), 0.0)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+class Deadband:
+    """Hold back insignificant changes of one slot value.
+
+    A new value is only shown if it leaves the band around the shown value
+    (absolute, or in percent of the shown value) and the shown value is at
+    least min_hold seconds old. Changes inside the band are shown anyway once
+    the shown value is max_hold seconds old (0 = never).
+    """
+
+    __slots__ = (
+        "key", "entity_id", "band", "percent", "min_hold", "max_hold",
+        "number", "shown", "since", "due",
+    )
+
+    def __init__(self, key, entity_id, band, percent, min_hold, max_hold):
+        """Initialize."""
+        self.key = key
+        self.entity_id = entity_id
+        self.band = band
+        self.percent = percent
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self.number = None      # Zahlenwert des angezeigten Werts
+        self.shown = None       # angezeigter (formatierter) Wert
+        self.since = 0.0        # monotonic, seit wann er angezeigt wird
+        self.due = None         # monotonic, wann ein zurückgehaltener Wert spätestens kommt
+
+    def apply(self, data, get_state, now):
+        """Replace data[key] by the shown value if the change is insignificant.
+
+        Returns True if the value was held back; due is then the monotonic
+        time at which it will be shown (None if it waits for a bigger change).
+        """
+        value = data[self.key]
+        self.due = None
+        state = get_state(self.entity_id)
+        try:
+            number = float(state.state)
+        except (AttributeError, ValueError, TypeError):
+            # unavailable/unknown/Text immer sofort durchreichen
+            self.number, self.shown, self.since = None, value, now
+            return False
+
+        if self.number is None:
+            self.number, self.shown, self.since = number, value, now
+            return False
+        if value == self.shown:
+            self.number = number
+            return False
+
+        limit = abs(self.number) * self.band / 100 if self.percent else self.band
+        if abs(number - self.number) > limit:
+            due = self.since + self.min_hold
+        elif self.max_hold:
+            due = self.since + self.max_hold
+        else:
+            due = None
+
+        if due is not None and now >= due:
+            self.number, self.shown, self.since = number, value, now
+            return False
+        data[self.key] = self.shown
+        self.due = due
+        return True
+
+
+class SlotTable:
+    """Options compiled into everything a tick needs to build the wire payload."""
+
+    __slots__ = ("static", "bindings", "entity_ids", "enabled_pages", "page_bindings", "deadbands", "history_entities")
+
+    def __init__(self, static, bindings, enabled_pages, binding_pages, deadbands=()):
+        """Initialize."""
+        self.static = static                # Felder, die sich nur mit den Optionen ändern
+        self.bindings = bindings            # (Feld, entity_id, Formatter, Default)
+        self.entity_ids = frozenset(b[1] for b in bindings if b[1])
+        self.enabled_pages = enabled_pages
+        self.page_bindings = {}             # Seite -> Bindings der dort angezeigten Werte
+        for binding, page in zip(bindings, binding_pages):
+            self.page_bindings.setdefault(page, []).append(binding)
+        self.deadbands = deadbands
+        entity_by_key = {b[0]: b[1] for b in bindings}
+        self.history_entities = tuple(entity_by_key.get(key) for key in HISTORY_FIELDS)
+
+    def filter(self, data, get_state, now):
+        """Apply the slot deadbands to a built payload.
+
+        Returns (number of held values, monotonic time the next one is due or None).
+        """
+        held = 0
+        next_due = None
+        for deadband in self.deadbands:
+            if deadband.key not in data:
+                continue
+            if deadband.apply(data, get_state, now):
+                held += 1
+                if deadband.due is not None:
+                    next_due = deadband.due if next_due is None else min(next_due, deadband.due)
+        return held, next_due
+
+    def build(self, get_state, pages=None):
+        """Build the service payload in a single pass.
+
+        With pages only the values shown on those pages are read; the static
+        fields are always included.
+        """
+        data = dict(self.static)
+        if pages is None:
+            bindings = self.bindings
+        else:
+            bindings = [b for page in pages for b in self.page_bindings.get(page, ())]
+        for key, entity_id, formatter, default in bindings:
+            data[key] = formatter(get_state(entity_id)) if entity_id else default
+        return data
+
+    def prune(self, data, pages):
+        """Drop the values of all pages except pages from data (in place)."""
+        for page, bindings in self.page_bindings.items():
+            if page in pages:
+                continue
+            for binding in bindings:
+                data.pop(binding[0], None)
+        return data
+
+
+def compile_slots(options):
+    """Compile config entry options into a SlotTable."""
+    bindings = []
+    binding_pages = []
+    conf_keys = []
+    static = {}
+
+    for key, conf_key in CORE_SLOTS:
+        bindings.append((key, options.get(conf_key) or None, format_number, 0.0))
+        binding_pages.append(CORE_SLOT_PAGES[key])
+        conf_keys.append(conf_key)
+
+    for idx, prefix, default_name, page in CUSTOM_SLOTS:
+        static[f"c{idx}_n"] = str(options.get(f"{prefix}_name", default_name) or " ")
+        bindings.append((f"c{idx}_v", options.get(f"{prefix}_entity") or None, format_custom, " "))
+        binding_pages.append(page)
+        conf_keys.append(f"{prefix}_entity")
+
+    # Totband pro Slot, konfiguriert über den Options-Schlüssel der Entität
+    deadbands = []
+    configured = options.get(CONF_DEADBANDS) or {}
+    for (key, entity_id, _formatter, _default), conf_key in zip(bindings, conf_keys):
+        conf = configured.get(conf_key)
+        if not entity_id or not isinstance(conf, dict):
+            continue
+        band = _to_float(conf.get("band"))
+        min_hold = _to_float(conf.get("min_hold"))
+        if band or min_hold:
+            deadbands.append(Deadband(
+                key, entity_id, band, bool(conf.get("percent")), min_hold, _to_float(conf.get("max_hold"))
+            ))
+
+    enabled_pages = []
+    for page, default in PAGE_DEFAULTS.items():
+        enabled = bool(options.get(f"enable_page{page}", default))
+        static[f"p{page}_en"] = enabled
+        if enabled:
+            enabled_pages.append(page)
+    # Kein p10_en: ältere Firmware kennt das Feld im vollen Dienst nicht
+    if options.get(CONF_ENABLE_CHART):
+        enabled_pages.append(CHART_PAGE)
+
+    static["show_kw"] = bool(options.get(CONF_SHOW_KW, False))
+    static["dim_start"] = int(options.get("dim_start_time", 22))
+    static["dim_end"] = int(options.get("dim_end_time", 6))
+    static["dim_brt"] = float(options.get("dim_brightness", 20.0))
+
+    return SlotTable(static, tuple(bindings), enabled_pages or [1], binding_pages, tuple(deadbands))
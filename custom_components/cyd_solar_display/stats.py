@@ -0,0 +1,73 @@
+"""Lightweight timing and counter instrumentation for the coordinator."""
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# So viele Messwerte pro Stufe fließen in p50/p95/max ein
+STATS_WINDOW = 200
+
+
+class Stats:
+    """Rolling per-stage durations plus plain counters.
+
+    Durations are kept in fixed-size windows, so memory stays constant and
+    percentiles reflect recent behaviour only.
+    """
+
+    __slots__ = ("_samples", "counters", "per_display", "payload_bytes")
+
+    def __init__(self):
+        """Initialize."""
+        self._samples = {}
+        self.counters = {}
+        self.per_display = {}       # Dienst -> {Zähler: Wert}
+        self.payload_bytes = deque(maxlen=STATS_WINDOW)
+
+    def record(self, stage, seconds):
+        """Record one duration for stage."""
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=STATS_WINDOW)
+        samples.append(seconds)
+
+    @contextmanager
+    def measure(self, stage):
+        """Time the enclosed block (may contain awaits) as stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def count(self, name, display=None, amount=1):
+        """Increase a counter, optionally per display service."""
+        counters = self.counters if display is None else self.per_display.setdefault(display, {})
+        counters[name] = counters.get(name, 0) + amount
+
+    def stage(self, stage):
+        """Return p50/p95/max in milliseconds for stage (None if not measured yet)."""
+        samples = self._samples.get(stage)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            "p50": round(ordered[last * 50 // 100] * 1000, 2),
+            "p95": round(ordered[last * 95 // 100] * 1000, 2),
+            "max": round(ordered[last] * 1000, 2),
+            "count": len(ordered),
+        }
+
+    def as_dict(self):
+        """Return a diagnostics friendly snapshot."""
+        sizes = sorted(self.payload_bytes)
+        return {
+            "stages_ms": {stage: self.stage(stage) for stage in self._samples},
+            "counters": dict(self.counters),
+            "displays": {srv: dict(c) for srv, c in self.per_display.items()},
+            "payload_bytes": {
+                "last": self.payload_bytes[-1] if self.payload_bytes else None,
+                "p50": sizes[(len(sizes) - 1) // 2] if sizes else None,
+                "max": sizes[-1] if sizes else None,
+            },
+        }
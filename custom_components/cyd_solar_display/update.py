@@ -1,5 +1,6 @@
-import aiohttp
 import logging
+import re
+
 from homeassistant.components.update import (
     UpdateEntity,
     UpdateEntityFeature,
@@ -7,14 +8,25 @@ from homeassistant.components.update import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .ota import async_push_firmware, OTAError
 
 _LOGGER = logging.getLogger(__name__)
 
+_NON_VERSION_CHARS = re.compile(r"[^\d\.]")
+
+
+def _clean_version(value):
+    """Strip everything but digits and dots from a version string."""
+    return _NON_VERSION_CHARS.sub("", str(value))
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the CYD Solar update entity."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -62,7 +74,7 @@ class CYDSolarUpdateEntity(CoordinatorEntity, UpdateEntity):
 
     _attr_has_entity_name = True
     _attr_device_class = UpdateDeviceClass.FIRMWARE
-    _attr_supported_features = UpdateEntityFeature.INSTALL
+    _attr_supported_features = UpdateEntityFeature.INSTALL | UpdateEntityFeature.PROGRESS
 
     def __init__(self, coordinator, entry, target_host: str, unique_id: str, title: str, device_id: str):
         """Initialize."""
@@ -71,6 +83,10 @@ class CYDSolarUpdateEntity(CoordinatorEntity, UpdateEntity):
         self._target_host = target_host
         self._attr_unique_id = unique_id
         self._attr_title = title
+        self._esphome_entry_id = None
+        self._source_entity_ids = []
+        self._unsub_source = None
+        self._installed_version = None
         
         # We try to keep it under separate devices (or all in one? Separate is cleaner)
         self._attr_device_info = DeviceInfo(
@@ -80,6 +96,24 @@ class CYDSolarUpdateEntity(CoordinatorEntity, UpdateEntity):
             model="ESP32-2432S028",
         )
 
+    async def async_added_to_hass(self):
+        """Register the entity for fleet updates (see fleet.py)."""
+        await super().async_added_to_hass()
+        fleet = self.hass.data[DOMAIN].setdefault("update_entities", {})
+        fleet[self.unique_id] = self
+        self.async_on_remove(lambda: fleet.pop(self.unique_id, None))
+
+        self._async_resolve_source()
+        self.async_on_remove(self._async_stop_source)
+        self.async_on_remove(
+            self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated)
+        )
+
+    @property
+    def target_host(self):
+        """IP/host of the display this entity updates."""
+        return self._target_host
+
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
@@ -87,39 +121,90 @@ class CYDSolarUpdateEntity(CoordinatorEntity, UpdateEntity):
             "display_ip": self._target_host,
         }
 
+    @callback
+    def _async_resolve_source(self):
+        """Find the entities that report the installed firmware and subscribe to them.
+
+        Only redone after entity registry changes, so reading installed_version
+        is a plain attribute access.
+        """
+        if self._unsub_source:
+            self._unsub_source()
+            self._unsub_source = None
+        self._source_entity_ids = []
+
+        # 1. Finde den passenden ESPHome Config Entry für dieses Display (Target Host)
+        esphome_entries = self.hass.config_entries.async_entries("esphome")
+        target_esphome = next((e for e in esphome_entries if e.data.get("host") == self._target_host), None)
+        self._esphome_entry_id = target_esphome.entry_id if target_esphome else None
+
+        if target_esphome:
+            ent_reg = er.async_get(self.hass)
+            entities = er.async_entries_for_config_entry(ent_reg, target_esphome.entry_id)
+            # 2. ESPHome Update-Entität, 3. Fallback: Firmware-Version Sensor
+            self._source_entity_ids = [
+                e.entity_id for e in entities if e.domain == "update" and e.platform == "esphome"
+            ] + [
+                e.entity_id for e in entities if e.domain == "sensor" and "firmware" in e.entity_id
+            ]
+
+        if self._source_entity_ids:
+            self._unsub_source = async_track_state_change_event(
+                self.hass, self._source_entity_ids, self._async_source_changed
+            )
+        self._async_update_installed()
+
+    @callback
+    def _async_update_installed(self):
+        """Read the installed version from the resolved source entities."""
+        self._installed_version = None
+        for entity_id in self._source_entity_ids:
+            state = self.hass.states.get(entity_id)
+            if state is None:
+                continue
+            if entity_id.startswith("update."):
+                v = state.attributes.get("installed_version")
+                if v and v != "unknown":
+                    self._installed_version = _clean_version(v)
+                    return
+            elif state.state not in ["unknown", "unavailable"]:
+                self._installed_version = _clean_version(state.state)
+                return
+
+    @callback
+    def _async_source_changed(self, event):
+        """Pick up a new installed version."""
+        self._async_update_installed()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_registry_updated(self, event):
+        """Re-resolve if an entity of our ESPHome device was added, removed or renamed."""
+        entity_id = event.data.get("entity_id")
+        if entity_id in self._source_entity_ids or event.data.get("old_entity_id") in self._source_entity_ids:
+            self._async_resolve_source()
+            return
+        entry = er.async_get(self.hass).async_get(entity_id)
+        if entry is None:
+            return
+        if entry.config_entry_id == self._esphome_entry_id or (
+            self._esphome_entry_id is None and entry.platform == "esphome"
+        ):
+            self._async_resolve_source()
+
+    @callback
+    def _async_stop_source(self):
+        """Unsubscribe from the source entities."""
+        if self._unsub_source:
+            self._unsub_source()
+            self._unsub_source = None
+
     @property
     def installed_version(self):
         """Version currently in use."""
-        try:
-            from homeassistant.helpers import entity_registry as er
-            ent_reg = er.async_get(self.coordinator.hass)
-            
-            # 1. Finde den passenden ESPHome Config Entry für dieses Display (Target Host)
-            esphome_entries = self.coordinator.hass.config_entries.async_entries("esphome")
-            target_esphome = next((e for e in esphome_entries if e.data.get("host") == self._target_host), None)
-            
-            if target_esphome:
-                for entity in er.async_entries_for_config_entry(ent_reg, target_esphome.entry_id):
-                    if entity.domain == "update" and entity.platform == "esphome":
-                        state = self.coordinator.hass.states.get(entity.entity_id)
-                        if state and "installed_version" in state.attributes:
-                            v = state.attributes["installed_version"]
-                            if v and v != "unknown":
-                                import re
-                                return re.sub(r'[^\d\.]', '', str(v))
-                                
-                # 3. Fallback: Suche nach einem Firmware-Version Sensor (falls kein Update-Entity vorhanden)
-                for entity in er.async_entries_for_config_entry(ent_reg, target_esphome.entry_id):
-                    if entity.domain == "sensor" and "firmware" in entity.entity_id:
-                        state = self.coordinator.hass.states.get(entity.entity_id)
-                        if state and state.state not in ["unknown", "unavailable"]:
-                            import re
-                            return re.sub(r'[^\d\.]', '', str(state.state))
-                            
-        except Exception as e:
-            _LOGGER.debug("Fehler beim Ermitteln der Firmware für %s: %s", self._target_host, e)
-
-        # 4. Letztes Fallback: Coordinator-Daten (nur als Fallback-Wert 1.2.7)
+        if self._installed_version:
+            return self._installed_version
+        # Letztes Fallback: Coordinator-Daten
         return str(self.coordinator.data.get("installed_version", "1.2.9")).strip().lstrip("vV")
 
     @property
@@ -127,8 +212,7 @@ class CYDSolarUpdateEntity(CoordinatorEntity, UpdateEntity):
         """Latest version available for install."""
         v = self.coordinator.latest_version
         if v:
-            import re
-            return re.sub(r'[^\d\.]', '', str(v))
+            return _clean_version(v)
         return v
 
     @property
@@ -141,49 +225,49 @@ class CYDSolarUpdateEntity(CoordinatorEntity, UpdateEntity):
         if i_ver != l_ver:
             return "on"
         return "off"
-    @property
-    def in_progress(self):
-        """Update installation in progress."""
-        return self.coordinator.data.get("update_in_progress", False)
+    @callback
+    def _async_progress(self, percent):
+        """Publish upload progress of a running install."""
+        self._attr_update_percentage = percent
+        self.async_write_ha_state()
+
+    async def async_push_update(self, version=None):
+        """Push the firmware to the display, raising OTAError on failure.
+
+        Returns the FirmwareArtifact that was flashed. Its version can differ
+        from the requested one if an older cached image was used offline.
+        """
+        if not self._target_host:
+            raise OTAError("Keine Host-IP für das Display gefunden!")
+
+        self._attr_in_progress = True
+        self._attr_update_percentage = 0
+        self.async_write_ha_state()
+        try:
+            # Firmware kommt aus dem lokalen Cache (einmal pro Version von GitHub geladen)
+            version = version or self.latest_version
+            artifact = await async_push_firmware(
+                self.hass, self._target_host, version, progress=self._async_progress
+            )
+            if artifact.version != version:
+                _LOGGER.warning(
+                    "Version %s nicht verfügbar, %s hat gecachte Firmware %s erhalten",
+                    version, self._target_host, artifact.version,
+                )
+            return artifact
+        finally:
+            self._attr_in_progress = False
+            self._attr_update_percentage = None
+            self.async_write_ha_state()
 
     async def async_install(self, version: str, backup: bool, **kwargs):
         """Install an update using the ESPHome web server via Direct Push."""
         _LOGGER.info("USER-ACTION: Direct-Push Update gestartet für Version %s (Host: %s)", version, self._target_host)
-        
-        if not self._target_host:
-            _LOGGER.error("FEHLER: Keine Host-IP für das Display gefunden!")
-            return
 
-        # 1. URL zur Datei auf GitHub
-        update_url = "https://raw.githubusercontent.com/low-streaming/cyd_solar_display/main/cyd_solar_display.bin"
-        
         try:
-            # 2. Download der Binary von GitHub
-            _LOGGER.info("Lade Firmware von GitHub herunter: %s", update_url)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(update_url) as resp:
-                    if resp.status != 200:
-                        _LOGGER.error("Download fehlgeschlagen (Status %s)", resp.status)
-                        return
-                    binary_data = await resp.read()
-            
-            # 3. Upload zum Display (ESPHome WebServer /update endpoint)
-            upload_url = f"http://{self._target_host}/update"
-            _LOGGER.info("Pushing Firmware zu Display unter: %s", upload_url)
-            
-            data = aiohttp.FormData()
-            data.add_field('update', 
-                           binary_data,
-                           filename='firmware.bin',
-                           content_type='application/octet-stream')
-                           
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(upload_url, data=data) as resp:
-                    if resp.status == 200:
-                        _LOGGER.info("Update erfolgreich gesendet! Display startet neu.")
-                    else:
-                        _LOGGER.error("Push fehlgeschlagen! Status: %s. Ist der WebServer aktiv?", resp.status)
-
+            artifact = await self.async_push_update(version)
+            _LOGGER.info("Update (Firmware %s) erfolgreich gesendet! Display startet neu.", artifact.version)
+        except OTAError as err:
+            _LOGGER.error("Update für %s fehlgeschlagen: %s", self._target_host, err)
         except Exception as err:
             _LOGGER.error("Kritischer Fehler beim Update-Push: %s", err)
@@ -0,0 +1,144 @@
+"""Shared firmware version check for CYD Solar Display."""
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+import aiohttp
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, DEFAULT_VERSION_CHECK_INTERVAL
+from .stats import Stats
+
+_LOGGER = logging.getLogger(__name__)
+
+VERSION_URL = "https://raw.githubusercontent.com/low-streaming/cyd_solar_display/main/version.txt"
+
+# Backoff nach Fehlern: 1 min, 2 min, 4 min, ... (gedeckelt durch das reguläre Intervall)
+BACKOFF_BASE = 60
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+SIGNAL_VERSION_UPDATED = f"{DOMAIN}_version_updated"
+
+
+@callback
+def async_get_version_checker(hass):
+    """Return the integration-wide version checker, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "version_checker" not in domain_data:
+        domain_data["version_checker"] = CYDVersionChecker(hass)
+    return domain_data["version_checker"]
+
+
+class CYDVersionChecker:
+    """Fetch version.txt from GitHub once for all config entries.
+
+    Uses Home Assistant's shared client session, conditional requests
+    (ETag / If-None-Match) and exponential backoff after failures. Checks run
+    on their own timer, so the display push path never waits for GitHub.
+    """
+
+    def __init__(self, hass, url=VERSION_URL, session=None):
+        """Initialize."""
+        self.hass = hass
+        self.url = url
+        self._session = session
+        self.latest_version = "0.0.0"
+        self.last_check = None
+        self._checked_at = None     # monotonic, letzte erfolgreiche Prüfung
+        self._etag = None
+        self._failures = 0
+        self._next_check = 0.0
+        self._intervals = {}
+        self._lock = asyncio.Lock()
+        self._unsub_timer = None
+        self.stats = Stats()
+
+    @property
+    def interval(self):
+        """Return the check interval in seconds (shortest requested by any entry)."""
+        hours = min(self._intervals.values(), default=DEFAULT_VERSION_CHECK_INTERVAL)
+        return max(hours, 0.25) * 3600
+
+    @callback
+    def async_set_interval(self, entry_id, hours):
+        """Register the check interval (hours) requested by a config entry."""
+        try:
+            self._intervals[entry_id] = float(hours)
+        except (ValueError, TypeError):
+            self._intervals[entry_id] = DEFAULT_VERSION_CHECK_INTERVAL
+        # Neues Intervall gilt sofort, gerechnet ab der letzten erfolgreichen Prüfung
+        # (ein laufender Backoff nach Fehlern bleibt bestehen)
+        if self._failures == 0 and self._checked_at is not None:
+            self._next_check = self._checked_at + self.interval
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._async_schedule(max(self._next_check - time.monotonic(), 0))
+
+    @callback
+    def async_remove(self, entry_id):
+        """Forget an unloaded config entry, stop the timer after the last one."""
+        self._intervals.pop(entry_id, None)
+        if not self._intervals and self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_schedule(self, delay):
+        """Schedule the next background check unless one is already pending."""
+        if self._unsub_timer is not None:
+            return
+        self._unsub_timer = async_call_later(self.hass, delay, self._async_scheduled_check)
+
+    async def _async_scheduled_check(self, _now):
+        """Run a background check and schedule the next one."""
+        self._unsub_timer = None
+        try:
+            await self.async_check()
+        finally:
+            if self._intervals:
+                self._async_schedule(max(self._next_check - time.monotonic(), 1))
+
+    async def async_check(self, force=False):
+        """Check GitHub for a new version if due. Returns True if a check succeeded."""
+        async with self._lock:
+            now = time.monotonic()
+            if not force and now < self._next_check:
+                return False
+
+            session = self._session or async_get_clientsession(self.hass)
+            headers = {"If-None-Match": self._etag} if self._etag else {}
+            changed = False
+            try:
+                with self.stats.measure("version_check"):
+                    async with session.get(self.url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+                        if response.status == 304:
+                            _LOGGER.debug("GitHub version unchanged (ETag %s)", self._etag)
+                        elif response.status == 200:
+                            version = (await response.text()).strip()
+                            changed = version != self.latest_version
+                            self.latest_version = version
+                            self._etag = response.headers.get("ETag")
+                            _LOGGER.debug("Latest GitHub version: %s", self.latest_version)
+                        else:
+                            raise RuntimeError(f"HTTP {response.status}")
+            except Exception as e:
+                self._failures += 1
+                self.stats.count("version_check_failures")
+                delay = min(BACKOFF_BASE * 2 ** (self._failures - 1), self.interval)
+                self._next_check = now + delay
+                _LOGGER.warning("Failed to fetch version from GitHub: %s (next try in %ds)", e, delay)
+                return False
+
+            self._failures = 0
+            self.last_check = datetime.now()
+            self._checked_at = now
+            self._next_check = now + self.interval
+
+        if changed:
+            async_dispatcher_send(self.hass, SIGNAL_VERSION_UPDATED)
+        return True
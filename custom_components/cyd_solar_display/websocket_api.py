@@ -0,0 +1,160 @@
+"""Websocket API for the CYD Solar Display panel."""
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN
+from .coordinator import SIGNAL_STATE_UPDATED
+
+# Interne Sync-Felder, die das Panel nicht überschreiben darf
+INTERNAL_OPTIONS = ("last_page", "_last_sync")
+
+
+@callback
+def async_register_websocket_commands(hass):
+    """Register the panel websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_payload)
+    websocket_api.async_register_command(hass, ws_subscribe_state)
+    websocket_api.async_register_command(hass, ws_config_get)
+    websocket_api.async_register_command(hass, ws_config_patch)
+
+
+@callback
+def config_snapshot(hass, entry):
+    """Return the options and firmware info the panel edits."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    return {
+        "config": dict(entry.options),
+        "latest_version": coordinator.latest_version if coordinator else "0.0.0",
+        "firmware_update_entity_id": coordinator.data.get("firmware_update_entity_id", "") if coordinator else "",
+        "displays": coordinator.targets.async_get().all_display_services if coordinator else [],
+    }
+
+
+@callback
+def state_snapshot(coordinator):
+    """Return the live coordinator state shown by the panel."""
+    data = coordinator.data or {}
+    return {
+        "current_page": coordinator.current_page,
+        "displays": data.get("displays", {}),
+        "latest_version": coordinator.latest_version,
+        "installed_version": data.get("installed_version"),
+        "push_mode": coordinator.push_mode,
+        "last_update_success": coordinator.last_update_success,
+    }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/config/get",
+        vol.Required("entry_id"): str,
+    }
+)
+@websocket_api.require_admin
+@callback
+def ws_config_get(hass, connection, msg):
+    """Return the current options of an entry."""
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if entry is None or entry.domain != DOMAIN:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Entry not found")
+        return
+    connection.send_result(msg["id"], config_snapshot(hass, entry))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/config/patch",
+        vol.Required("entry_id"): str,
+        vol.Required("changes"): dict,
+    }
+)
+@websocket_api.require_admin
+@callback
+def ws_config_patch(hass, connection, msg):
+    """Merge changed options into the entry (only the keys that were sent)."""
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if entry is None or entry.domain != DOMAIN:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Entry not found")
+        return
+    changes = {k: v for k, v in msg["changes"].items() if k not in INTERNAL_OPTIONS}
+    changed = any(entry.options.get(k) != v for k, v in changes.items())
+    if changed:
+        hass.config_entries.async_update_entry(entry, options={**entry.options, **changes})
+    connection.send_result(msg["id"], {"changed": changed})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_state",
+        vol.Required("entry_id"): str,
+    }
+)
+@websocket_api.require_admin
+@callback
+def ws_subscribe_state(hass, connection, msg):
+    """Stream current page, display health and versions whenever they change."""
+    entry_id = msg["entry_id"]
+    if hass.data.get(DOMAIN, {}).get(entry_id) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Entry not found")
+        return
+
+    last = {"state": None}
+
+    @callback
+    def _async_forward():
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None:
+            return
+        state = state_snapshot(coordinator)
+        if state == last["state"]:
+            return
+        last["state"] = state
+        connection.send_message(websocket_api.event_message(msg["id"], state))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_STATE_UPDATED.format(entry_id), _async_forward
+    )
+    connection.send_result(msg["id"])
+    _async_forward()
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_payload",
+        vol.Required("entry_id"): str,
+    }
+)
+@websocket_api.require_admin
+@callback
+def ws_subscribe_payload(hass, connection, msg):
+    """Stream the payload last sent to the display.
+
+    The values are exactly what the coordinator formatted for the hardware, so
+    the panel preview does not have to parse hass.states itself.
+    """
+    entry_id = msg["entry_id"]
+    if hass.data.get(DOMAIN, {}).get(entry_id) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Entry not found")
+        return
+
+    last = {"payload": None}
+
+    @callback
+    def _async_forward():
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None or not coordinator.data:
+            return
+        payload = coordinator.data.get("payload")
+        # Nur bei geändertem Inhalt senden (ohne Display ist der Datensatz jedes Mal neu gebaut)
+        if payload is None or payload is last["payload"] or payload == last["payload"]:
+            return
+        last["payload"] = payload
+        connection.send_message(websocket_api.event_message(msg["id"], {"payload": payload}))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_STATE_UPDATED.format(entry_id), _async_forward
+    )
+    connection.send_result(msg["id"])
+    _async_forward()
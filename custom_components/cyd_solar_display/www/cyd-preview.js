@@ -5,6 +5,27 @@ import {
 } from "https://unpkg.com/lit-element@2.4.0/lit-element.js?module";
 import { unsafeHTML } from "https://unpkg.com/lit-html@1.4.1/directives/unsafe-html.js?module";
 
+// Tabs werden erst beim Öffnen nachgeladen (eigene Module unter ./tabs)
+const TAB_MODULES = {
+  overview: () => import('./tabs/overview.js'),
+  settings: () => import('./tabs/settings.js'),
+  updates: () => import('./tabs/updates.js'),
+  info: () => import('./tabs/info.js'),
+};
+const TAB_RENDERERS = {
+  overview: 'renderOverview',
+  settings: 'renderSettings',
+  updates: 'renderUpdates',
+  info: 'renderInfo',
+};
+const loadedTabs = new Map();
+
+// Änderungen im Panel werden gesammelt und verzögert als Patch gespeichert.
+// Optionen, die einen Reload der Integration auslösen, nur per Speichern-Button.
+const SAVE_DEBOUNCE_MS = 1500;
+const RELOAD_KEYS = ['broadcast_mode'];
+const INTERNAL_KEYS = ['last_page', '_last_sync'];
+
 class CYDPreview extends LitElement {
   static get properties() {
     return {
@@ -15,7 +36,11 @@ class CYDPreview extends LitElement {
       editConfig: { type: Object },
       latestVersion: { type: String },
       firmwareUpdateEntityId: { type: String },
+      displays: { type: Array },
+      livePayload: { type: Object },
+      liveState: { type: Object },
       _checkingUpdate: { type: Boolean },
+      _saveState: { type: String },
       _pickerSearch: { type: Object }
     };
   }
@@ -27,27 +52,75 @@ class CYDPreview extends LitElement {
     this.editConfig = {};
     this.latestVersion = "0.0.0";
     this.firmwareUpdateEntityId = "";
+    this.displays = [];
+    this.livePayload = null;
+    this.liveState = null;
+    this.savedConfig = {};
+    this._subscriptions = [];
     this._checkingUpdate = false;
+    this._saveTimer = null;
+    this._saveChain = Promise.resolve();
+    this._saveState = '';
     this._pickerSearch = {};
+    this._pickerScroll = {};
+    this._entityIndex = null;
   }
 
   firstUpdated() {
     this.loadConfig();
+    this.subscribeLive();
+  }
+
+  connectedCallback() {
+    super.connectedCallback();
+    if (this.hasUpdated) this.subscribeLive();
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    this.unsubscribeLive();
+  }
+
+  subscribeLive() {
+    // Push statt Polling: Payload (exakt wie an das Display gesendet) und Coordinator-Status
+    if (this._subscriptions.length || !this.hass || !this.panel || !this.panel.config || !this.panel.config.entry_id) return;
+    const entryId = this.panel.config.entry_id;
+    const subscribe = (type, callback) => {
+      const sub = this.hass.connection.subscribeMessage(callback, { type, entry_id: entryId });
+      sub.catch((e) => console.error(`Subscription ${type} failed`, e));
+      return sub;
+    };
+    this._subscriptions = [
+      subscribe('cyd_solar_display/subscribe_payload', (msg) => { this.livePayload = msg.payload; }),
+      subscribe('cyd_solar_display/subscribe_state', (msg) => {
+        this.liveState = msg;
+        if (msg.latest_version) this.latestVersion = msg.latest_version;
+      }),
+    ];
+  }
+
+  unsubscribeLive() {
+    this._subscriptions.forEach((sub) => sub.then((unsub) => unsub()).catch(() => {}));
+    this._subscriptions = [];
   }
 
   async loadConfig() {
     if (!this.panel || !this.panel.config || !this.panel.config.entry_id) return;
     const entryId = this.panel.config.entry_id;
     try {
-      const data = await this.hass.callApi('GET', `cyd_solar_display/config/${entryId}`);
+      const data = await this.hass.callWS({ type: 'cyd_solar_display/config/get', entry_id: entryId });
       this.editConfig = JSON.parse(JSON.stringify(data.config));
+      this.savedConfig = JSON.parse(JSON.stringify(data.config));
       this.latestVersion = data.latest_version || "0.0.0";
       this.firmwareUpdateEntityId = data.firmware_update_entity_id || "";
+      this.displays = data.displays || [];
       this.requestUpdate();
     } catch (e) { console.error("Failed to load config", e); }
   }
 
-  updated() {
+  updated(changedProps) {
+    if (changedProps.has('editConfig')) this.scheduleSave();
+
     // Attach change listeners to selects rendered via unsafeHTML (they lose Lit event bindings)
     const root = this.shadowRoot;
     if (!root) return;
@@ -56,25 +129,68 @@ class CYDPreview extends LitElement {
         sel._listenerAttached = true;
         sel.addEventListener('change', (e) => {
           const key = e.target.getAttribute('data-key');
-          if (key) this.handleSelectChange(e, key);
+          if (key && this.handleSelectChange) this.handleSelectChange(e, key);
         });
       }
     });
   }
 
+  configChanges(hotOnly) {
+    // Nur geänderte Optionen senden (Patch statt kompletter Konfiguration)
+    const changes = {};
+    Object.keys(this.editConfig).forEach((key) => {
+      if (INTERNAL_KEYS.includes(key) || (hotOnly && RELOAD_KEYS.includes(key))) return;
+      if (JSON.stringify(this.editConfig[key]) !== JSON.stringify(this.savedConfig[key])) {
+        changes[key] = this.editConfig[key];
+      }
+    });
+    return changes;
+  }
+
+  reloadPending() {
+    return RELOAD_KEYS.some((key) => JSON.stringify(this.editConfig[key]) !== JSON.stringify(this.savedConfig[key]));
+  }
+
+  scheduleSave() {
+    // Tippen/Klicken sammeln, erst nach einer Pause einen Patch senden
+    clearTimeout(this._saveTimer);
+    if (!this.panel || !this.panel.config || !this.panel.config.entry_id) return;
+    if (!Object.keys(this.configChanges(true)).length) return;
+    this._saveState = 'pending';
+    this._saveTimer = setTimeout(() => {
+      this.sendPatch(true).catch((e) => console.error("Auto-save failed", e));
+    }, SAVE_DEBOUNCE_MS);
+  }
+
+  sendPatch(hotOnly) {
+    // Patches nacheinander senden, damit kein älterer Stand einen neueren überholt
+    this._saveChain = this._saveChain.catch(() => {}).then(async () => {
+      const changes = this.configChanges(hotOnly);
+      if (!Object.keys(changes).length) return;
+      this._saveState = 'saving';
+      try {
+        await this.hass.callWS({ type: 'cyd_solar_display/config/patch', entry_id: this.panel.config.entry_id, changes });
+      } catch (e) {
+        this._saveState = 'error';
+        throw e;
+      }
+      const saved = { ...this.savedConfig };
+      Object.keys(changes).forEach((key) => { saved[key] = JSON.parse(JSON.stringify(changes[key])); });
+      this.savedConfig = saved;
+      this._saveState = 'saved';
+    });
+    return this._saveChain;
+  }
+
   async saveConfig() {
     if (!this.panel || !this.panel.config || !this.panel.config.entry_id) {
       console.error("Save failed: No panel config or entry_id found", this.panel);
       alert("❌ Fehler: Keine gültige Geräte-ID gefunden. Bitte Home Assistant neu starten.");
       return;
     }
-    const entryId = this.panel.config.entry_id;
+    clearTimeout(this._saveTimer);
     try {
-      const payload = { ...this.editConfig };
-      delete payload.last_page;
-      delete payload._last_sync;
-      
-      const response = await this.hass.callApi('POST', `cyd_solar_display/config/${entryId}`, payload);
+      await this.sendPatch(false);
       alert("✅ Einstellungen wurden erfolgreich gespeichert!");
     } catch (e) {
       console.error("Save Config Error:", e);
@@ -83,134 +199,27 @@ class CYDPreview extends LitElement {
     }
   }
 
-  async checkUpdate() {
-    if (!this.panel || !this.panel.config || !this.panel.config.entry_id) return;
-    const entryId = this.panel.config.entry_id;
-    this._checkingUpdate = true;
-    this.requestUpdate();
-
-    try {
-      const data = await this.hass.callApi('POST', `cyd_solar_display/check_update/${entryId}`);
-      this.latestVersion = data.latest_version || "0.0.0";
-      
-      if (data.updated) {
-        // Version changed
-      } else {
-        alert("ℹ️ Du bist bereits auf dem neuesten Stand!");
-      }
-    } catch (e) {
-      console.error("Manual update check failed", e);
-      alert("❌ Fehler beim Abrufen der Version.");
-    } finally {
-      this._checkingUpdate = false;
-      this.requestUpdate();
-    }
-  }
-
-  getEntitiesByDomain(domainPrefix) {
-    if (!this.hass) return [];
-    const prefixes = Array.isArray(domainPrefix) ? domainPrefix : [domainPrefix];
-    return Object.keys(this.hass.states)
-      .filter(entityId => prefixes.some(prefix => entityId.startsWith(prefix + '.')))
-      .sort()
-      .map(entityId => {
-        const stateObj = this.hass.states[entityId];
-        return {
-          id: entityId,
-          name: stateObj.attributes.friendly_name ? `${stateObj.attributes.friendly_name} (${entityId})` : entityId
-        };
+  loadTab(tab) {
+    // Jeder Tab wird nur einmal geladen; Hover über den Reiter lädt ihn schon vor
+    if (!loadedTabs.has(tab)) {
+      const loading = TAB_MODULES[tab]().then((mod) => { Object.assign(CYDPreview.prototype, mod.methods); });
+      loading.catch((e) => {
+        console.error(`Failed to load tab ${tab}`, e);
+        loadedTabs.delete(tab);
       });
+      loadedTabs.set(tab, loading);
+    }
+    return loadedTabs.get(tab);
   }
 
-  handlePickerInput(e, name) {
-    this.editConfig = { ...this.editConfig, [name]: e.detail.value };
-    this.requestUpdate();
-  }
-
-  handleSelectChange(e, name) {
-    this.editConfig = { ...this.editConfig, [name]: e.target.value };
-    this.requestUpdate();
-  }
-
-  renderEntitySelect(configKey, domains) {
-    if (!this.hass) return html`<span style="color:#888;font-size:12px">Lade...</span>`;
-    const domainList = Array.isArray(domains) ? domains : [domains];
-    const entities = this.getEntitiesByDomain(domainList);
-    const currentVal = (this.editConfig && this.editConfig[configKey]) ? this.editConfig[configKey] : '';
-    const currentEnt = entities.find(e => e.id === currentVal);
-    const displayName = currentEnt ? currentEnt.name : currentVal;
-    const searchTerm = (this._pickerSearch[configKey] !== undefined) ? this._pickerSearch[configKey] : null;
-    const isOpen = searchTerm !== null;
-
-    const filtered = isOpen
-      ? entities.filter(e =>
-        e.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        e.id.toLowerCase().includes(searchTerm.toLowerCase())
-      ).slice(0, 50)
-      : [];
-
-    return html`
-      <div class="entity-picker" style="position:relative;">
-        <input
-          type="text"
-          class="picker-input"
-          placeholder="${displayName || '-- Sensor wählen --'}"
-          .value=${isOpen ? searchTerm : ''}
-          @focus=${() => { this._pickerSearch = { ...this._pickerSearch, [configKey]: '' }; this.requestUpdate(); }}
-          @input=${(e) => { this._pickerSearch = { ...this._pickerSearch, [configKey]: e.target.value }; this.requestUpdate(); }}
-          @blur=${() => setTimeout(() => { const s = { ...this._pickerSearch }; delete s[configKey]; this._pickerSearch = s; this.requestUpdate(); }, 200)}
-          style="background:#111;color:#fff;border:1px solid ${currentVal ? '#fdd835' : '#444'};padding:10px;border-radius:6px;font-size:0.9em;width:100%;box-sizing:border-box;cursor:text;"
-        />
-        ${isOpen ? html`
-          <div class="picker-dropdown" style="position:absolute;z-index:100;background:#1a1a1a;border:1px solid #555;border-radius:6px;width:100%;max-height:220px;overflow-y:auto;box-shadow:0 4px 20px rgba(0,0,0,0.6);">
-            ${filtered.length === 0 ? html`
-              <div style="padding:10px;color:#888;font-size:0.85em;">Kein Sensor gefunden</div>
-            ` : filtered.map(ent => html`
-              <div
-                class="picker-item"
-                style="padding:10px 12px;cursor:pointer;border-bottom:1px solid #333;font-size:0.85em;color:${ent.id === currentVal ? '#fdd835' : '#eee'};"
-                @mousedown=${(e) => {
-        e.preventDefault();
-        this.editConfig = { ...this.editConfig, [configKey]: ent.id };
-        const s = { ...this._pickerSearch }; delete s[configKey]; this._pickerSearch = s;
-        this.requestUpdate();
-      }}
-              >
-                <div style="font-weight:500">${ent.name.replace(/ \(.*\)$/, '')}</div>
-                <div style="color:#888;font-size:0.8em;">${ent.id}</div>
-              </div>
-            `)}
-          </div>
-        ` : ''}
-        ${currentVal ? html`
-          <div style="margin-top:8px;background:linear-gradient(135deg,rgba(253,216,53,0.12) 0%,rgba(253,216,53,0.05) 100%);border:1px solid rgba(253,216,53,0.4);border-radius:8px;padding:8px 12px;display:flex;align-items:center;justify-content:space-between;gap:8px;">
-            <div style="display:flex;align-items:center;gap:10px;min-width:0;">
-              <div style="width:10px;height:10px;border-radius:50%;background:#4caf50;box-shadow:0 0 6px #4caf50;flex-shrink:0;"></div>
-              <div style="min-width:0;">
-                <div style="font-size:0.9em;font-weight:600;color:#fdd835;white-space:nowrap;overflow:hidden;text-overflow:ellipsis;">${currentEnt ? currentEnt.name.replace(/ \(.*\)$/, '') : currentVal}</div>
-                <div style="font-size:0.72em;color:#888;white-space:nowrap;overflow:hidden;text-overflow:ellipsis;margin-top:1px;">${currentVal}</div>
-              </div>
-            </div>
-            <div title="Auswahl entfernen" style="cursor:pointer;color:#888;font-size:1.1em;flex-shrink:0;padding:2px 6px;border-radius:4px;" @click=${() => { this.editConfig = { ...this.editConfig, [configKey]: '' }; this.requestUpdate(); }}>✕</div>
-          </div>
-        ` : ''}
-      </div>
-    `;
-  }
-
-  handleFormInput(e) {
-    const { name, value, type, checked } = e.target;
-    this.editConfig = { ...this.editConfig, [name]: type === 'checkbox' ? checked : (type === 'number' ? Number(value) : value) };
-    this.requestUpdate();
-  }
-
-  getLiveValue(entityId, defaultVal) {
-    if (!this.hass || !entityId || !this.hass.states[entityId]) return defaultVal;
-    const state = this.hass.states[entityId].state;
-    if (state === 'unavailable' || state === 'unknown') return defaultVal;
-    const parsed = parseFloat(state);
-    if (isNaN(parsed)) return defaultVal;
-    return parseFloat(parsed.toFixed(2));
+  renderTab(tab) {
+    const renderer = TAB_RENDERERS[tab];
+    if (!renderer) return '';
+    if (!this[renderer]) {
+      this.loadTab(tab).then(() => this.requestUpdate(), () => {});
+      return html`<div class="card" style="text-align: center; color: #888;">Lade...</div>`;
+    }
+    return this[renderer]();
   }
 
   render() {
@@ -222,17 +231,13 @@ class CYDPreview extends LitElement {
           </div>
 
           <div class="tabs">
-            <div class="tab ${this.activeTab === 'overview' ? 'active' : ''}" @click="${() => this.activeTab = 'overview'}">Dashboard</div>
-            <div class="tab ${this.activeTab === 'settings' ? 'active' : ''}" @click="${() => this.activeTab = 'settings'}">Einstellungen</div>
-            <div class="tab ${this.activeTab === 'updates' ? 'active' : ''}" @click="${() => this.activeTab = 'updates'}">Display Update</div>
-            <div class="tab ${this.activeTab === 'info' ? 'active' : ''}" @click="${() => this.activeTab = 'info'}">Hilfe & Info</div>
+            ${[['overview', 'Dashboard'], ['settings', 'Einstellungen'], ['updates', 'Display Update'], ['info', 'Hilfe & Info']].map(([tab, label]) => html`
+              <div class="tab ${this.activeTab === tab ? 'active' : ''}" @click="${() => this.activeTab = tab}" @mouseenter="${() => this.loadTab(tab)}">${label}</div>
+            `)}
           </div>
 
           <div class="content">
-            ${this.activeTab === 'overview' ? this.renderOverview() : ''}
-            ${this.activeTab === 'settings' ? this.renderSettings() : ''}
-            ${this.activeTab === 'updates' ? this.renderUpdates() : ''}
-            ${this.activeTab === 'info' ? this.renderInfo() : ''}
+            ${this.renderTab(this.activeTab)}
           </div>
           
           <div style="text-align: center; margin-top: 40px; margin-bottom: 20px;">
@@ -245,964 +250,6 @@ class CYDPreview extends LitElement {
     `;
   }
 
-  renderOverview() {
-    const solar_w = this.getLiveValue(this.editConfig.solar_entity, 4500);
-    const grid_w = this.getLiveValue(this.editConfig.grid_entity, -1200);
-    const house_w = this.getLiveValue(this.editConfig.house_entity, 2800);
-    const battery_w = this.getLiveValue(this.editConfig.battery_entity, 500);
-    const battery_soc = this.getLiveValue(this.editConfig.battery_soc_entity, 85);
-
-    const yield_today = this.getLiveValue(this.editConfig.yield_today_entity, 12.4);
-    const yield_month = this.getLiveValue(this.editConfig.yield_month_entity, 114.2);
-    const yield_year = Math.round(this.getLiveValue(this.editConfig.yield_year_entity, 1054.8));
-    const yield_total = Math.round(this.getLiveValue(this.editConfig.yield_total_entity, 3450.5));
-
-    const c1_n = this.editConfig.custom1_name || "Custom 1";
-    const c1_v = this.getLiveValue(this.editConfig.custom1_entity, 21.5) + " °C";
-    const c2_n = this.editConfig.custom2_name || "Custom 2";
-    const c2_v = this.getLiveValue(this.editConfig.custom2_entity, 48.0) + " %";
-    const c3_n = this.editConfig.custom3_name || "Custom 3";
-    const c3_v = this.getLiveValue(this.editConfig.custom3_entity, 1120.0) + " kWh";
-    const c4_n = this.editConfig.custom4_name || "Custom 4";
-    const c4_v = this.getLiveValue(this.editConfig.custom4_entity, 1.0) + " bar";
-
-    const c5_n = this.editConfig.custom5_name || "Custom 5";
-    const c5_v = this.getLiveValue(this.editConfig.custom5_entity, 21.5) + " °C";
-    const c6_n = this.editConfig.custom6_name || "Custom 6";
-    const c6_v = this.getLiveValue(this.editConfig.custom6_entity, 48.0) + " %";
-    const c7_n = this.editConfig.custom7_name || "Custom 7";
-    const c7_v = this.getLiveValue(this.editConfig.custom7_entity, 1120.0) + " kWh";
-    const c8_n = this.editConfig.custom8_name || "Custom 8";
-    const c8_v = this.getLiveValue(this.editConfig.custom8_entity, 1.0) + " bar";
-
-    const m1_n = this.editConfig.mining1_name || "Mining 1";
-    const m1_v = this.getLiveValue(this.editConfig.mining1_entity, 120.0) + " TH/s";
-    const m2_n = this.editConfig.mining2_name || "Mining 2";
-    const m2_v = this.getLiveValue(this.editConfig.mining2_entity, 65.0) + " °C";
-    const m3_n = this.editConfig.mining3_name || "Mining 3";
-    const m3_v = this.getLiveValue(this.editConfig.mining3_entity, 3500.0) + " W";
-    const m4_n = this.editConfig.mining4_name || "Mining 4";
-    const m4_v = this.getLiveValue(this.editConfig.mining4_entity, 1.0) + " BTC";
-
-    const hasPage1 = this.editConfig.enable_page1 !== false;
-    const hasPage2 = this.editConfig.enable_page2 !== false;
-    const hasPage3 = this.editConfig.enable_page3 !== false;
-    const hasPage4 = this.editConfig.enable_page4 !== false;
-    const hasPage5 = this.editConfig.enable_page5 !== false;
-    const hasPage6 = !!this.editConfig.enable_page6;
-    const hasPage7 = !!this.editConfig.enable_page7;
-    const hasPage8 = !!this.editConfig.enable_page8;
-    const hasPage9 = !!this.editConfig.enable_page9;
-
-    const isNegative = grid_w < 0;
-    const pVal = (w) => this.editConfig.show_kw ? (w / 1000).toFixed(2) : Math.round(w);
-    const pUnit = this.editConfig.show_kw ? "kW" : "W";
-
-    return html`
-      <div class="card">
-          <div class="cyd-info">
-            <h3>CYD Display Live Preview</h3>
-            <p>1:1 Simulation mit den Livedaten deines Home Assistants.</p>
-          </div>
-          
-          <div class="cyd-container">
-            <div class="cyd-frame">
-              <div class="cyd-screen">
-                <div class="header">
-                  <span class="title">Solar Monitor</span>
-                  <span class="time">${new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}</span>
-                </div>
-                
-                ${this.page === 1 ? html`
-                  <div class="page page1">
-                    <div class="quad-grid">
-                      <div class="quad-box q-solar">
-                        <div class="q-label">SOLAR</div>
-                        <div class="q-value">${pVal(solar_w)}<span>${pUnit}</span></div>
-                      </div>
-                      <div class="quad-box q-house">
-                        <div class="q-label">HAUSVERBRAUCH</div>
-                        <div class="q-value">${pVal(house_w)}<span>${pUnit}</span></div>
-                      </div>
-                      <div class="quad-box q-batt">
-                        <div class="q-label">BATTERIE</div>
-                        <div class="q-batt-val">${battery_soc}%</div>
-                        <div class="q-batt-bar">
-                          <div style="width: ${battery_soc}%; background: ${battery_soc <= 20 ? '#ef5350' : (battery_soc <= 50 ? '#ff9800' : '#4caf50')}"></div>
-                        </div>
-                        <div class="q-batt-w">${pVal(battery_w)} ${pUnit}</div>
-                      </div>
-                      <div class="quad-box q-grid ${isNegative ? 'export' : 'import'}">
-                        <div class="q-label">${isNegative ? 'EINSPEISUNG' : 'NETZBEZUG'}</div>
-                        <div class="q-value">${pVal(Math.abs(grid_w))}<span>${pUnit}</span></div>
-                      </div>
-                    </div>
-                  </div>
-                ` : this.page === 2 ? html`
-                  <div class="page page2">
-                    <div class="stats-grid">
-                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
-                          <div class="label" style="color: #fdd835;">Ertrag Tag</div>
-                          <div class="value">${yield_today} <span>kWh</span></div>
-                      </div>
-                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
-                          <div class="label" style="color: #fdd835;">Ertrag Monat</div>
-                          <div class="value">${yield_month} <span>kWh</span></div>
-                      </div>
-                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
-                          <div class="label" style="color: #fdd835;">Ertrag Jahr</div>
-                          <div class="value">${yield_year} <span>kWh</span></div>
-                      </div>
-                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
-                          <div class="label" style="color: #fdd835;">Gesamtertrag</div>
-                          <div class="value">${yield_total} <span>kWh</span></div>
-                      </div>
-                    </div>
-                  </div>
-                ` : this.page === 3 ? html`
-                  <div class="page page3">
-                    <div class="stats-grid">
-                      ${this.editConfig.custom1_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #00f3ff;">
-                          <div class="label" style="color: #00f3ff;">${c1_n}</div>
-                          <div class="value">${c1_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.custom2_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #00ff73;">
-                          <div class="label" style="color: #00ff73;">${c2_n}</div>
-                          <div class="value">${c2_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.custom3_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #b026ff;">
-                          <div class="label" style="color: #b026ff;">${c3_n}</div>
-                          <div class="value">${c3_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.custom4_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #ff003c;">
-                          <div class="label" style="color: #ff003c;">${c4_n}</div>
-                          <div class="value">${c4_v}</div>
-                      </div>` : ''}
-                    </div>
-                  </div>
-                ` : this.page === 4 ? html`
-                  <div class="page page4">
-                    <div class="stats-grid">
-                      ${this.editConfig.custom5_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #00f3ff;">
-                          <div class="label" style="color: #00f3ff;">${c5_n}</div>
-                          <div class="value">${c5_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.custom6_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #00ff73;">
-                          <div class="label" style="color: #00ff73;">${c6_n}</div>
-                          <div class="value">${c6_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.custom7_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #b026ff;">
-                          <div class="label" style="color: #b026ff;">${c7_n}</div>
-                          <div class="value">${c7_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.custom8_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #ff003c;">
-                          <div class="label" style="color: #ff003c;">${c8_n}</div>
-                          <div class="value">${c8_v}</div>
-                      </div>` : ''}
-                    </div>
-                  </div>
-                ` : this.page === 5 ? html`
-                  <div class="page page5">
-                    <div class="stats-grid">
-                      ${this.editConfig.mining1_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
-                          <div class="label" style="color: #ff9800;">${m1_n}</div>
-                          <div class="value">${m1_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.mining2_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
-                          <div class="label" style="color: #ff9800;">${m2_n}</div>
-                          <div class="value">${m2_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.mining3_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
-                          <div class="label" style="color: #ff9800;">${m3_n}</div>
-                          <div class="value">${m3_v}</div>
-                      </div>` : ''}
-                      ${this.editConfig.mining4_entity ? html`
-                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
-                          <div class="label" style="color: #ff9800;">${m4_n}</div>
-                          <div class="value">${m4_v}</div>
-                      </div>` : ''}
-                    </div>
-                  </div>
-                ` : this.page >= 6 && this.page <= 9 ? html`
-                  <div class="page page-custom">
-                    <div class="stats-grid">
-                      ${[1, 2, 3, 4].map(n => {
-                        const baseIdx = (this.page - 6) * 4 + 8 + n;
-                        const nameKey = `custom${baseIdx}_name`;
-                        const entKey = `custom${baseIdx}_entity`;
-                        const name = this.editConfig[nameKey] || `Custom ${baseIdx}`;
-                        const val = this.getLiveValue(this.editConfig[entKey], 0);
-                        const colorMap = ['#00f3ff', '#00ff73', '#b026ff', '#ff003c'];
-                        return this.editConfig[entKey] ? html`
-                          <div class="stat-item" style="border-left: 4px solid ${colorMap[n-1]};">
-                              <div class="label" style="color: ${colorMap[n-1]};">${name}</div>
-                              <div class="value">${val}</div>
-                          </div>` : '';
-                      })}
-                    </div>
-                  </div>
-                ` : html`
-                  <div class="page page-empty">
-                    <div style="text-align:center;color:#666;margin-top:40px;">Seite nicht aktiv</div>
-                  </div>
-                `}
-
-                <div class="footer">
-                  <div class="dots">
-                    ${hasPage1 ? html`<div class="dot ${this.page === 1 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage2 ? html`<div class="dot ${this.page === 2 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage3 ? html`<div class="dot ${this.page === 3 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage4 ? html`<div class="dot ${this.page === 4 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage5 ? html`<div class="dot ${this.page === 5 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage6 ? html`<div class="dot ${this.page === 6 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage7 ? html`<div class="dot ${this.page === 7 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage8 ? html`<div class="dot ${this.page === 8 ? 'active' : ''}"></div>` : ''}
-                    ${hasPage9 ? html`<div class="dot ${this.page === 9 ? 'active' : ''}"></div>` : ''}
-                  </div>
-                </div>
-              </div>
-              <div class="cyd-controls">
-                ${hasPage1 ? html`<button @click="${() => this.page = 1}">P1</button>` : ''}
-                ${hasPage2 ? html`<button @click="${() => this.page = 2}">P2</button>` : ''}
-                ${hasPage3 ? html`<button @click="${() => this.page = 3}">P3</button>` : ''}
-                ${hasPage4 ? html`<button @click="${() => this.page = 4}">P4</button>` : ''}
-                ${hasPage5 ? html`<button @click="${() => this.page = 5}">P5</button>` : ''}
-                ${hasPage6 ? html`<button @click="${() => this.page = 6}">P6</button>` : ''}
-                ${hasPage7 ? html`<button @click="${() => this.page = 7}">P7</button>` : ''}
-                ${hasPage8 ? html`<button @click="${() => this.page = 8}">P8</button>` : ''}
-                ${hasPage9 ? html`<button @click="${() => this.page = 9}">P9</button>` : ''}
-              </div>
-            </div>
-          </div>
-      </div>
-    `;
-  }
-
-  renderSettings() {
-    return html`
-  <div class="card edit-card" >
-        <h2>🛠️ Sensoren & Konfiguration</h2>
-        <p style="color:#aaa; font-size:14px; margin-bottom: 25px;">Verknüpfe hier deine Home Assistant Sensoren, die auf dem ESP32 Display angezeigt werden sollen.</p>
-        
-        <div class="tech-box">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <h3 style="color: #fdd835; margin-top: 0;">⚡ Kern-Sensoren (Live) - Seite 1</h3>
-                <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
-                    <input type="checkbox" name="enable_page1" .checked="${this.editConfig.enable_page1 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #fdd835;">
-                    Aktivieren
-                </label>
-            </div>
-            
-            <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff; margin-bottom: 15px; background: rgba(255,255,255,0.05); padding: 5px 10px; border-radius: 4px; width: fit-content;">
-                <input type="checkbox" name="show_kw" .checked="${this.editConfig.show_kw === true}" @change="${this.handleFormInput}" style="width: 16px; height: 16px; accent-color: #fdd835;">
-                Leistung in Kilowatt (kW) anzeigen anstatt in Watt (W)
-            </label>
-
-            <div class="form-row">
-                <div class="form-group flex-1">
-                  <label style="display: flex; align-items: center;">
-                    Solar Leistung (W)
-                    <span class="tooltip" data-tooltip="Dein aktueller PV-Ertrag. Das sollte ein Sensor sein, der die momentane Leistung ausgibt (in Watt).">
-                      <svg viewBox="0 0 24 24" width="14" height="14" fill="currentColor"><path d="M11 18h2v-2h-2v2zm1-16C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8zm0-14c-2.21 0-4 1.79-4 4h2c0-1.1.9-2 2-2s2 .9 2 2c0 2-3 1.75-3 5h2c0-2.25 3-2.5 3-5 0-2.21-1.79-4-4-4z"/></svg>
-                    </span>
-                  </label>
-                  ${this.renderEntitySelect('solar_entity', ['sensor', 'input_number'])}
-                </div>
-                <div class="form-group flex-1">
-                  <label style="display: flex; align-items: center;">
-                    Netz Leistung (W)
-                    <span class="tooltip" data-tooltip="Dein Momentanverbrauch vom Stromzähler (meist in Watt). Achtung: Die Einspeisung ins Netz muss als negativer Wert vom Sensor kommen!">
-                      <svg viewBox="0 0 24 24" width="14" height="14" fill="currentColor"><path d="M11 18h2v-2h-2v2zm1-16C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8zm0-14c-2.21 0-4 1.79-4 4h2c0-1.1.9-2 2-2s2 .9 2 2c0 2-3 1.75-3 5h2c0-2.25 3-2.5 3-5 0-2.21-1.79-4-4-4z"/></svg>
-                    </span>
-                  </label>
-                  ${this.renderEntitySelect('grid_entity', ['sensor', 'input_number'])}
-                </div>
-            </div>
-
-  <div class="form-row">
-    <div class="form-group flex-1">
-      <label>Hausverbrauch (W)</label>
-      ${this.renderEntitySelect('house_entity', ['sensor', 'input_number'])}
-                </div>
-  <div class="form-group flex-1">
-    <label>Batterie Leistung (W)</label>
-    ${this.renderEntitySelect('battery_entity', ['sensor', 'input_number'])}
-                </div>
-            </div>
-
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Batterie Füllstand (%)</label>
-                ${this.renderEntitySelect('battery_soc_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-        </div>
-
-        <div class="tech-box" style="margin-top: 20px; border-color: rgba(52, 152, 219, 0.4);">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <h3 style="color: #3498db; margin-top: 0;">📊 Statistik-Sensoren (kWh) - Seite 2</h3>
-                <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
-                    <input type="checkbox" name="enable_page2" .checked="${this.editConfig.enable_page2 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #3498db;">
-                    Aktivieren
-                </label>
-            </div>
-            <div class="form-row">
-                <div class="form-group flex-1">
-                  <label>Ertrag Heute (kWh)</label>
-                  ${this.renderEntitySelect('yield_today_entity', ['sensor', 'input_number'])}
-                </div>
-                <div class="form-group flex-1">
-                  <label>Ertrag Laufender Monat (kWh)</label>
-                  ${this.renderEntitySelect('yield_month_entity', ['sensor', 'input_number'])}
-                </div>
-            </div>
-  <div class="form-row">
-    <div class="form-group flex-1">
-      <label>Ertrag Laufendes Jahr (kWh)</label>
-      ${this.renderEntitySelect('yield_year_entity', ['sensor', 'input_number'])}
-                </div>
-  <div class="form-group flex-1">
-    <label>Gesamtertrag (Lifelime) (kWh)</label>
-    ${this.renderEntitySelect('yield_total_entity', ['sensor', 'input_number'])}
-                </div>
-            </div>
-        </div>
-
-  <div class="tech-box" style="margin-top: 20px; border-color: #00f3ff;">
-    <div style="display: flex; justify-content: space-between; align-items: center;">
-      <h3 style="color: #00f3ff; margin-top: 0;">🔮 Eigene Sensoren (Seite 3)</h3>
-      <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
-          <input type="checkbox" name="enable_page3" .checked="${this.editConfig.enable_page3 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #00f3ff;">
-          Aktivieren
-      </label>
-    </div>
-    
-    ${this.editConfig.enable_page3 !== false ? html`
-    <p style="color:#aaa; font-size: 12px; margin-top:-10px; margin-bottom: 15px;">Füge bis zu 4 eigene Sensoren hinzu, welche auf der dritten Seite angezeigt werden.</p>
-
-    <div class="form-row">
-      <div class="form-group flex-1">
-        <label>Name 1 (z.B. Temperatur)</label>
-        <input type="text" name="custom1_name" .value="${this.editConfig.custom1_name || ''}" @input="${this.handleFormInput}">
-      </div>
-      <div class="form-group flex-1">
-        <label>Sensor 1</label>
-        ${this.renderEntitySelect('custom1_entity', ['sensor', 'input_number'])}
-  </div>
-            </div>
-
-  <div class="form-row">
-    <div class="form-group flex-1">
-      <label>Name 2 (z.B. Luftfeuchte)</label>
-      <input type="text" name="custom2_name" .value="${this.editConfig.custom2_name || ''}" @input="${this.handleFormInput}">
-    </div>
-    <div class="form-group flex-1">
-      <label>Sensor 2</label>
-      ${this.renderEntitySelect('custom2_entity', ['sensor', 'input_number'])}
-                </div>
-            </div>
-
-  <div class="form-row">
-    <div class="form-group flex-1">
-      <label>Name 3</label>
-      <input type="text" name="custom3_name" .value="${this.editConfig.custom3_name || ''}" @input="${this.handleFormInput}">
-    </div>
-    <div class="form-group flex-1">
-      <label>Sensor 3</label>
-      ${this.renderEntitySelect('custom3_entity', ['sensor', 'input_number'])}
-                </div>
-            </div>
-
-  <div class="form-row">
-    <div class="form-group flex-1">
-      <label>Name 4</label>
-      <input type="text" name="custom4_name" .value="${this.editConfig.custom4_name || ''}" @input="${this.handleFormInput}">
-    </div>
-    <div class="form-group flex-1">
-      <label>Sensor 4</label>
-      ${this.renderEntitySelect('custom4_entity', ['sensor', 'input_number'])}
-                </div>
-            </div>
-            ` : ''}
-        </div>
-
-        <div class="tech-box" style="margin-top: 20px; border-color: #fdd835;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-              <h3 style="color: #fdd835; margin-top: 0;">🔮 Eigene Sensoren (Seite 4)</h3>
-              <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
-                  <input type="checkbox" name="enable_page4" .checked="${this.editConfig.enable_page4 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #fdd835;">
-                  Aktivieren
-              </label>
-            </div>
-            
-            ${this.editConfig.enable_page4 !== false ? html`
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 5</label>
-                <input type="text" name="custom5_name" .value="${this.editConfig.custom5_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 5</label>
-                ${this.renderEntitySelect('custom5_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 6</label>
-                <input type="text" name="custom6_name" .value="${this.editConfig.custom6_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 6</label>
-                ${this.renderEntitySelect('custom6_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 7</label>
-                <input type="text" name="custom7_name" .value="${this.editConfig.custom7_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 7</label>
-                ${this.renderEntitySelect('custom7_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 8</label>
-                <input type="text" name="custom8_name" .value="${this.editConfig.custom8_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 8</label>
-                ${this.renderEntitySelect('custom8_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-            ` : ''}
-        </div>
-
-        <div class="tech-box" style="margin-top: 20px; border-color: #ff9800;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-              <h3 style="color: #ff9800; margin-top: 0;">⛏️ Mining Sensoren (Seite 5)</h3>
-              <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
-                  <input type="checkbox" name="enable_page5" .checked="${this.editConfig.enable_page5 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #ff9800;">
-                  Aktivieren
-              </label>
-            </div>
-            
-            ${this.editConfig.enable_page5 !== false ? html`
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 1</label>
-                <input type="text" name="mining1_name" .value="${this.editConfig.mining1_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 1</label>
-                ${this.renderEntitySelect('mining1_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 2</label>
-                <input type="text" name="mining2_name" .value="${this.editConfig.mining2_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 2</label>
-                ${this.renderEntitySelect('mining2_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 3</label>
-                <input type="text" name="mining3_name" .value="${this.editConfig.mining3_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 3</label>
-                ${this.renderEntitySelect('mining3_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-
-            <div class="form-row">
-              <div class="form-group flex-1">
-                <label>Name 4</label>
-                <input type="text" name="mining4_name" .value="${this.editConfig.mining4_name || ''}" @input="${this.handleFormInput}">
-              </div>
-              <div class="form-group flex-1">
-                <label>Sensor 4</label>
-                ${this.renderEntitySelect('mining4_entity', ['sensor', 'input_number'])}
-              </div>
-            </div>
-            ` : ''}
-        </div>
-
-        ${[6, 7, 8, 9].map(pageIdx => {
-          const baseIdx = (pageIdx - 6) * 4 + 9;
-          const colorMap = { 6: '#00f3ff', 7: '#00ff73', 8: '#b026ff', 9: '#ff003c' };
-          const color = colorMap[pageIdx];
-          const enableKey = `enable_page${pageIdx}`;
-          
-          return html`
-            <div class="tech-box" style="margin-top: 20px; border-color: ${color};">
-              <div style="display: flex; justify-content: space-between; align-items: center;">
-                <h3 style="color: ${color}; margin-top: 0;">🔮 Eigene Sensoren (Seite ${pageIdx})</h3>
-                <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
-                    <input type="checkbox" name="${enableKey}" .checked="${!!this.editConfig[enableKey]}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: ${color};">
-                    Aktivieren
-                </label>
-              </div>
-              
-              ${!!this.editConfig[enableKey] ? html`
-              <p style="color:#aaa; font-size: 12px; margin-top:-10px; margin-bottom: 15px;">Füge bis zu 4 eigene Sensoren hinzu, welche auf der Seite ${pageIdx} angezeigt werden.</p>
-              ${[0, 1, 2, 3].map(i => {
-                const sensorIdx = baseIdx + i;
-                const nameKey = `custom${sensorIdx}_name`;
-                const entKey = `custom${sensorIdx}_entity`;
-                return html`
-                  <div class="form-row">
-                    <div class="form-group flex-1">
-                      <label>Name ${sensorIdx}</label>
-                      <input type="text" name="${nameKey}" .value="${this.editConfig[nameKey] || ''}" @input="${this.handleFormInput}">
-                    </div>
-                    <div class="form-group flex-1">
-                      <label>Sensor ${sensorIdx}</label>
-                      ${this.renderEntitySelect(entKey, ['sensor', 'input_number'])}
-                    </div>
-                  </div>
-                `;
-              })}
-              ` : ''}
-            </div>
-          `;
-        })}
-        
-        <div class="tech-box" style="margin-top: 20px; border-color: rgba(155, 89, 182, 0.4);">
-            <h3 style="color: #9b59b6; margin-top: 0;">⚙️ Allgemeine Eigenschaften</h3>
-            
-            <div class="form-row">
-                <div class="form-group flex-1">
-                  <label>Update Intervall (Sekunden)</label>
-                  <input type="number" name="update_interval" min="1" .value="${this.editConfig.update_interval || 5}" @input="${this.handleFormInput}">
-                  <small>Wie oft sollen Daten zum ESP32 gesendet werden?</small>
-                </div>
-                ${(this.editConfig.page_switch_mode || 'auto') !== 'touch' ? html`
-                <div class="form-group flex-1">
-                  <label>Seitenwechsel Intervall (Sekunden)</label>
-                  <input type="number" name="page_interval" min="5" .value="${this.editConfig.page_interval || 10}" @input="${this.handleFormInput}">
-                  <small>Wie lange eine Seite auf dem LCD angezeigt wird.</small>
-                </div>
-                ` : html`
-                <div class="form-group flex-1" style="opacity:0.4; pointer-events:none;">
-                  <label>Seitenwechsel Intervall (Sekunden)</label>
-                  <input type="number" value="${this.editConfig.page_interval || 10}" disabled>
-                  <small>⚠️ Nicht aktiv im Touch-Modus</small>
-                </div>
-                `}
-            </div>
-
-            <div style="margin-top: 15px; margin-bottom: 20px; padding: 15px; background: rgba(0,243,255,0.05); border: 1px solid rgba(0,243,255,0.3); border-radius: 8px;">
-              <label style="display: flex; align-items: flex-start; gap: 10px; cursor: pointer; color: #fff; margin: 0;">
-                  <input type="checkbox" name="broadcast_mode" .checked="${this.editConfig.broadcast_mode === true}" @change="${this.handleFormInput}" style="width: 20px; height: 20px; accent-color: #00f3ff; margin-top: 3px; flex-shrink: 0;">
-                  <div>
-                    <div style="font-weight: bold; color: #00f3ff; font-size: 15px;">Synchron-Modus (Broadcast / Alle Displays) aktivieren</div>
-                    <div style="color: #aaa; font-size: 13px; margin-top: 5px; line-height: 1.5;">
-                      Wenn aktiv, versorgt diese Integration <b>alle</b> deine CYD Displays gleichzeitig mit den exakt gleichen Daten und Einstellungen. <br>
-                      <strong style="color: #4caf50;">Beide Displays bleiben dabei aber völlig unabhängig per Touch-Eingabe bedienbar!</strong>
-                      <br><strong style="color: #ff5252;">WICHTIG bei 2+ Displays:</strong> Aktiviere diesen Haken hier und lösche die zweite "Geräte/Dienste" Karte in Home Assistant! Diese eine reicht nun aus.
-                    </div>
-                  </div>
-              </label>
-            </div>
-
-            <div style="margin-top: 15px; margin-bottom: 20px;">
-              <h4 style="color: #bbb; margin-bottom: 15px;">🌙 Nacht-Dimming Anzeige</h4>
-              <div class="form-row" style="margin-bottom: 0;">
-                <div class="form-group flex-1">
-                  <label>Start Stunde (0-23)</label>
-                  <input type="number" name="dim_start_time" min="0" max="23" .value="${this.editConfig.dim_start_time !== undefined ? this.editConfig.dim_start_time : 22}" @input="${this.handleFormInput}">
-                </div>
-                <div class="form-group flex-1">
-                  <label>Ende Stunde (0-23)</label>
-                  <input type="number" name="dim_end_time" min="0" max="23" .value="${this.editConfig.dim_end_time !== undefined ? this.editConfig.dim_end_time : 6}" @input="${this.handleFormInput}">
-                </div>
-                <div class="form-group flex-1">
-                  <label>Helligkeit (%)</label>
-                  <input type="number" name="dim_brightness" min="1" max="100" .value="${this.editConfig.dim_brightness !== undefined ? this.editConfig.dim_brightness : 20}" @input="${this.handleFormInput}">
-                </div>
-              </div>
-            </div>
-
-            <!-- Seitenwechsel-Modus -->
-            <div style="margin-top: 20px;">
-              <label style="display:block; margin-bottom: 10px; font-weight: 600; color: #ccc;">Seitenwechsel-Modus</label>
-              <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                ${['auto', 'touch', 'both'].map(mode => {
-      const labels = {
-        auto: { icon: '🔄', title: 'Automatisch', desc: 'HA wechselt Seiten nach Zeitintervall' },
-        touch: { icon: '👆', title: 'Nur Touch', desc: 'Manuell durch Tippen auf das Display' },
-        both: { icon: '🔄👆', title: 'Beides', desc: 'Auto + Touch-Override (empfohlen)' },
-      }[mode];
-      const isActive = (this.editConfig.page_switch_mode || 'auto') === mode;
-      return html`
-                    <div
-                      @click=${() => { this.editConfig = { ...this.editConfig, page_switch_mode: mode }; this.requestUpdate(); }}
-                      style="
-                        flex: 1; min-width: 130px; cursor: pointer; padding: 14px 12px;
-                        border-radius: 10px; border: 2px solid ${isActive ? '#9b59b6' : 'rgba(155,89,182,0.25)'};
-                        background: ${isActive ? 'rgba(155,89,182,0.18)' : 'rgba(255,255,255,0.03)'};
-                        transition: all 0.2s ease;
-                        box-shadow: ${isActive ? '0 0 15px rgba(155,89,182,0.35)' : 'none'};
-                        text-align: center;
-                      "
-                    >
-                      <div style="font-size: 1.8em; margin-bottom: 6px;">${labels.icon}</div>
-                      <div style="font-weight: 700; color: ${isActive ? '#b26ef7' : '#ddd'}; font-size: 0.95em;">${labels.title}</div>
-                      <div style="font-size: 0.72em; color: #888; margin-top: 4px; line-height: 1.4;">${labels.desc}</div>
-                    </div>
-                  `;
-    })}
-              </div>
-            </div>
-
-            <!-- Seitenwechsel-Steuerung (Rotation Source) -->
-            <div style="margin-top: 25px; background: rgba(0,0,0,0.2); padding: 15px; border-radius: 8px; border: 1px solid rgba(255,255,255,0.05);">
-              <label style="display:block; margin-bottom: 12px; font-weight: 600; color: #ccc;">Seitenwechsel-Steuerung durch</label>
-              <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                ${['ha', 'display'].map(source => {
-                  const labels = {
-                    ha: { icon: '🏠', title: 'Home Assistant', desc: 'Zentral gesteuert' },
-                    display: { icon: '📱', title: 'Display lokal', desc: 'Jedes Display rotiert selbst' },
-                  }[source];
-                  const isActive = (this.editConfig.page_rotation_source || 'ha') === source;
-                  return html`
-                    <div
-                      @click=${() => { this.editConfig = { ...this.editConfig, page_rotation_source: source }; this.requestUpdate(); }}
-                      style="
-                        flex: 1; min-width: 140px; cursor: pointer; padding: 12px 10px;
-                        border-radius: 8px; border: 2px solid ${isActive ? '#3498db' : 'rgba(52,152,219,0.1)'};
-                        background: ${isActive ? 'rgba(52,152,219,0.15)' : 'rgba(255,255,255,0.02)'};
-                        transition: all 0.2s ease;
-                        text-align: center;
-                      "
-                    >
-                      <div style="font-size: 1.4em; margin-bottom: 4px;">${labels.icon}</div>
-                      <div style="font-weight: 700; color: ${isActive ? '#3498db' : '#aaa'}; font-size: 0.9em;">${labels.title}</div>
-                      <div style="font-size: 0.65em; color: #777; margin-top: 2px;">${labels.desc}</div>
-                    </div>
-                  `;
-                })}
-              </div>
-              <p style="font-size: 0.7em; color: #666; margin-top: 10px; line-height: 1.3;">
-                💡 <b>Display lokal</b> empfohlen bei mehreren Displays mit unterschiedlichen Seiten-Speicherungen.
-              </p>
-            </div>
-        </div>
-        </div>
-
-        <div class="form-actions" style="margin-top: 30px; border-top: 1px solid rgba(255,255,255,0.1); padding-top: 20px; text-align: right;">
-            <button class="btn-save" @click="${this.saveConfig}">💾 Konfiguration Speichern & Anwenden</button>
-        </div>
-      </div>
-  `;
-  }
-
-  async triggerUpdate(entityId) {
-    if (!confirm("Firmware Update starten? Das Display wird danach neu gestartet.")) return;
-    try {
-      await this.hass.callService("update", "install", { entity_id: entityId });
-      alert("✅ Update-Befehl wurde gesendet!");
-    } catch (e) {
-      console.error(e);
-      alert("❌ Fehler beim Senden des Updates.");
-    }
-  }
-
-  renderUpdateCard(entity) {
-    const isUpdateAvailable = entity.state === 'on';
-    const inProgress = entity.attributes.in_progress === true || entity.attributes.update_action === 'installing';
-    let installed = entity.attributes.installed_version || 'Unbekannt';
-    let latest = entity.attributes.latest_version || 'Unbekannt';
-    const name = entity.attributes.friendly_name || entity.entity_id;
-    const ip = entity.attributes.display_ip || 'Unbekannt';
-
-    if (!installed.startsWith('v') && installed !== 'Unbekannt') installed = 'v' + installed;
-    if (!latest.startsWith('v') && latest !== 'Unbekannt') latest = 'v' + latest;
-
-    return html`
-      <div class="tech-box" style="margin-bottom: 15px; border-color: ${isUpdateAvailable ? '#00f3ff' : 'rgba(255,255,255,0.1)'}; background: ${isUpdateAvailable ? 'rgba(0, 243, 255, 0.05)' : 'rgba(0,0,0,0.2)'};">
-        <div style="display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap; gap: 20px;">
-          <div style="flex: 1; min-width: 250px;">
-            <h3 style="margin: 0; color: #fff; display: flex; align-items: center; gap: 12px;">
-              <span style="font-size: 1.4em; filter: drop-shadow(0 0 5px ${isUpdateAvailable ? '#00f3ff' : '#4caf50'});">${isUpdateAvailable ? '🆕' : '📱'}</span> 
-              ${name}
-              <span style="font-size: 14px; font-weight: 500; color: #aaa; background: rgba(255,255,255,0.08); padding: 2px 8px; border-radius: 4px; border: 1px solid rgba(255,255,255,0.1);">🌐 ${ip}</span>
-            </h3>
-            <div style="margin-top: 8px; font-size: 14px; color: #aaa;">
-              Installiert: <span style="color: #fff; font-weight: bold;">${installed}</span> | 
-              Aktuell verfügbar: <span style="${isUpdateAvailable ? 'color: #00f3ff; font-weight: bold;' : 'color: #aaa;'}">${latest}</span>
-            </div>
-          </div>
-          <div>
-            ${inProgress ? html`
-              <div style="color: #fdd835; font-weight: bold; background: rgba(253,216,53,0.1); padding: 10px 15px; border-radius: 6px; border: 1px solid rgba(253,216,53,0.3); display: flex; align-items: center; gap: 8px;">
-                ⏳ Update läuft...
-              </div>
-            ` : isUpdateAvailable ? html`
-              <button 
-                @click="${() => this.triggerUpdate(entity.entity_id)}"
-                style="display: inline-flex; align-items: center; justify-content: center; background: linear-gradient(135deg, #00f3ff 0%, #0084ff 100%); color: #000; padding: 12px 25px; border-radius: 8px; border:none; font-size: 14px; font-weight: 900; box-shadow: 0 4px 15px rgba(0, 243, 255, 0.4); cursor: pointer; transition: transform 0.2s, box-shadow 0.2s; text-transform: uppercase; letter-spacing: 1px;"
-                onmouseover="this.style.transform='scale(1.05)'; this.style.boxShadow='0 6px 20px rgba(0, 243, 255, 0.6)';" 
-                onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 15px rgba(0, 243, 255, 0.4)';"
-              >
-                🚀 Update Starten
-              </button>
-            ` : html`
-              <div style="background: rgba(76, 175, 80, 0.1); color: #4caf50; padding: 8px 16px; border-radius: 6px; border: 1px solid rgba(76, 175, 80, 0.3); font-size: 13px; font-weight: 700; display: flex; align-items: center; gap: 8px;">
-                 <div style="width: 8px; height: 8px; background: #4caf50; border-radius: 50%; box-shadow: 0 0 8px #4caf50;"></div>
-                 Auf dem neuesten Stand
-              </div>
-            `}
-          </div>
-        </div>
-      </div>
-    `;
-  }
-
-  renderUpdates() {
-    if (!this.hass) return html``;
-    
-    // Find all update entities that match CYD Solar Display
-    // ONLY display update entities that have a non-undefined display_ip attribute (thereby excluding ESPHome's internal updates)
-    const cydUpdates = Object.keys(this.hass.states)
-      .filter(eid => eid.startsWith('update.'))
-      .map(eid => this.hass.states[eid])
-      .filter(state => state.attributes.display_ip !== undefined);
-
-    return html`
-      <div class="card edit-card">
-        <h2>🚀 Display Firmware Updates</h2>
-        <p style="color:#aaa; font-size:14px; margin-bottom: 25px;">
-          Hier siehst du alle verbundenen CYD Solar Displays und kannst gezielt Updates anstoßen.
-        </p>
-
-        ${cydUpdates.length === 0 ? html`
-          <div style="background: rgba(255,255,255,0.05); padding: 20px; border-radius: 8px; text-align: center; color: #888;">
-            Keine Displays aus dem Custom Component gefunden (oder ein Neustart ist nach dem Integration-Update nötig).
-          </div>
-        ` : cydUpdates.map(entity => this.renderUpdateCard(entity))}
-      </div>
-    `;
-  }
-
-  renderInfo() {
-    const currentVersion = "1.2.9";
-    const latest = this.latestVersion || "0.0.0";
-    const updateAvailable = latest !== "0.0.0" && latest !== currentVersion;
-
-    return html`
-    <div class="card" style="margin-bottom: 20px; border-color: ${updateAvailable ? '#00f3ff' : 'rgba(255,255,255,0.1)'}; background: ${updateAvailable ? 'rgba(0, 243, 255, 0.05)' : 'rgba(0,0,0,0.2)'};">
-      <div style="display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap; gap: 20px;">
-        <div style="flex: 1; min-width: 250px;">
-          <h3 style="margin: 0; color: #fff; display: flex; align-items: center; gap: 12px;">
-            <span style="font-size: 1.4em; filter: drop-shadow(0 0 5px ${updateAvailable ? '#00f3ff' : '#4caf50'});">${updateAvailable ? '🚀' : '✅'}</span> 
-            System & Firmware Status
-          </h3>
-          <div style="margin-top: 8px; font-size: 14px; color: #aaa; display: flex; align-items: center; gap: 10px;">
-            <div>
-              Installiert: <span style="color: #fff; font-weight: bold;">v${currentVersion}</span>
-              ${updateAvailable ? html` | <span style="color: #00f3ff; font-weight: 500;">Neue Version v${latest} verfügbar!</span>` : html` | <span style="color: #4caf50; font-weight: 500;">System ist auf dem neuesten Stand.</span>`}
-            </div>
-            <button 
-              @click="${this.checkUpdate}" 
-              ?disabled="${this._checkingUpdate}"
-              style="background: rgba(255,255,255,0.05); color: #fff; border: 1px solid rgba(255,255,255,0.1); padding: 2px 8px; border-radius: 4px; font-size: 10px; cursor: pointer; transition: all 0.2s;"
-              onmouseover="this.style.background='rgba(255,255,255,0.1)'"
-              onmouseout="this.style.background='rgba(255,255,255,0.05)'"
-            >
-              ${this._checkingUpdate ? 'Suche...' : '🔍 Prüfen'}
-            </button>
-          </div>
-        </div>
-        <div>
-          ${updateAvailable ? html`
-            <button 
-              @click="${() => { this.activeTab = 'updates'; }}"
-              style="display: inline-flex; align-items: center; justify-content: center; background: linear-gradient(135deg, #00f3ff 0%, #0084ff 100%); color: #000; padding: 12px 25px; border-radius: 8px; border:none; font-size: 14px; font-weight: 900; box-shadow: 0 4px 15px rgba(0, 243, 255, 0.4); cursor: pointer; transition: transform 0.2s, box-shadow 0.2s; text-transform: uppercase; letter-spacing: 1px;"
-              onmouseover="this.style.transform='scale(1.05)'; this.style.boxShadow='0 6px 20px rgba(0, 243, 255, 0.6)';" 
-              onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 15px rgba(0, 243, 255, 0.4)';"
-            >
-              🚀 Zu den Updates
-            </button>
-          ` : html`
-            <div style="background: rgba(76, 175, 80, 0.1); color: #4caf50; padding: 8px 16px; border-radius: 6px; border: 1px solid rgba(76, 175, 80, 0.3); font-size: 13px; font-weight: 700; display: flex; align-items: center; gap: 8px;">
-               <div style="width: 8px; height: 8px; background: #4caf50; border-radius: 50%; box-shadow: 0 0 8px #4caf50;"></div>
-               Aktuell
-            </div>
-          `}
-        </div>
-      </div>
-    </div>
-
-    <div class="card" >
-      <h2>ℹ️ Informationen & Ersteinrichtung</h2>
-      <p>Willkommen beim <strong>CYD Solar Display</strong> Panel.</p>
-        
-        <div class="tech-box">
-          <h3 style="margin-top:0; color:#F7931A;">☀️ Was ist das CYD Solar Display?</h3>
-          <p style="color:#bbb; line-height:1.6; margin-top: 5px;">Dieses Projekt verbindet deinen Home Assistant mit einem <strong>ESP32 Cheap Yellow Display (CYD) 2432S028</strong>, um deine Solar-, Batterie- und Netzwerte hochauflösend und in Echtzeit in deinem Wohnraum zu visualisieren.</p>
-        </div>
-
-        <div class="tech-box" style="margin-top: 15px;">
-          <h3 style="margin-top:0; color:#4fc3f7;">🚀 Einrichtung</h3>
-          <ul style="color:#bbb; line-height:1.6; padding-left:20px;">
-            <li><strong style="color:#ddd;">1. Hardware:</strong> Du benötigst das fertig geflashte ESP32 CYD (Modell 2432S028).
-              <div style="margin: 12px 0 15px 0;">
-                <a href="https://solarmodule-gladbeck.de/produkt/ok_display/" target="_blank" style="display: inline-flex; align-items: center; justify-content: center; background: linear-gradient(135deg, #00f3ff 0%, #0084ff 100%); color: #000; padding: 12px 22px; border-radius: 8px; text-decoration: none; font-size: 15px; font-weight: 900; box-shadow: 0 4px 20px rgba(0, 243, 255, 0.4); transition: transform 0.2s, box-shadow 0.2s; text-transform: uppercase; letter-spacing: 0.5px;" onmouseover="this.style.transform='scale(1.03)'; this.style.boxShadow='0 6px 25px rgba(0, 243, 255, 0.6)';" onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 20px rgba(0, 243, 255, 0.4)';">
-                  <svg viewBox="0 0 24 24" width="22" height="22" style="margin-right: 10px; fill: #000;"><path d="M7 18c-1.1 0-1.99.9-1.99 2S5.9 22 7 22s2-.9 2-2-.9-2-2-2zM1 2v2h2l3.6 7.59-1.35 2.45c-.16.28-.25.61-.25.96 0 1.1.9 2 2 2h12v-2H7.42c-.14 0-.25-.11-.25-.25l.03-.12.9-1.63h7.45c.75 0 1.41-.41 1.75-1.03l3.58-6.49c.08-.14.12-.31.12-.48 0-.55-.45-1-1-1H5.21l-.94-2H1zm16 16c-1.1 0-1.99.9-1.99 2s.89 2 1.99 2 2-.9 2-2-.9-2-2-2z"/></svg>
-                  Hardware fertig geflasht kaufen (Plug & Play)
-                </a>
-              </div>
-            </li>
-            <li><strong style="color:#ddd;">2. WLAN & mDNS:</strong> Das Display verbindet sich mit deinem Netzwerk. Home Assistant sollte es automatisch über mDNS finden.</li>
-            <li><strong style="color:#ddd;">3. Konfiguration:</strong> Sobald der ESP32 in HA als Gerät "cyd_solar_display" registriert ist, verknüpfe unter "Einstellungen" (in diesem Panel) deine Sensoren.</li>
-            <li><strong style="color:#ddd;">4. Optionen:</strong> Aktiviere oder deaktiviere einzelne Seiten (z.B. Mining Sensoren) oder die kW-Anzeige ganz nach deinem Geschmack.</li>
-            <li><strong style="color:#ddd;">5. Automatisierung:</strong> Das System arbeitet passiv. Die ausgewählten Sensordaten werden nun vom Panel aus im Intervall (z.B. 5s) intelligent an das Display gepusht! Viel Spaß.</li>
-          </ul>
-        </div>
-
-        <div class="tech-box faq-box" style="margin-top: 15px; border-color: rgba(255, 152, 0, 0.3);">
-          <h3 style="margin-top:0; color:#ff9800;">❓ Häufige Fragen (FAQ)</h3>
-          
-          <details class="faq-item">
-            <summary>Mein Display wird nicht von Home Assistant (mDNS) gefunden, was tun?</summary>
-            <div class="faq-content">
-              Prüfe, ob du beim Setup im WLAN-Portal des Displays dein richtiges 2,4 GHz WLAN und Passwort eingegeben hast. Manchmal blockieren Router mDNS (Bonjour). In diesem Fall kannst du die IP-Adresse des Displays in deinem Router auslesen und manuell über "Integration hinzufügen -> ESPHome" in Home Assistant eintragen.
-            </div>
-          </details>
-          
-          <details class="faq-item" open>
-            <summary>Meine Sensoren auf dem Display zeigen nur 0 an</summary>
-            <div class="faq-content">
-              Stelle sicher, dass du unter "Einstellungen" (in diesem Panel) Sensoren ausgewählt und gespeichert hast. Es dauert nach dem Speichern bis zu 10 Sekunden (je nach eingestelltem Update Intervall), bis der ESP32 die ersten neuen Werte empfängt.
-            </div>
-          </details>
-
-          <details class="faq-item">
-            <summary>Was ist der Unterschied zwischen Watt (W) und Kilowatt (kW)?</summary>
-            <div class="faq-content">
-              Wähle als Sensoren nach Möglichkeit immer die <strong>Watt-Werte</strong> aus deinem System. Wenn dir die angezeigten Zahlen auf dem Display zu groß sind, setze den Haken bei "Leistung in Kilowatt (kW) anzeigen". Das Display konvertiert die originalen Watt-Werte dann für dich automatisch auf dem Bildschirm in kW (z.B. 2400W -> 2.4kW).
-            </div>
-          </details>
-
-          <details class="faq-item">
-            <summary>Wie funktioniert der Touch-Seitenwechsel?</summary>
-            <div class="faq-content">
-              Das CYD-Display hat einen eingebauten Touchscreen. Tippe <strong>irgendwo auf das Display</strong>, um zur nächsten Seite zu wechseln. Der Wechsel erfolgt sofort – du musst nicht auf eine bestimmte Stelle tippen. Im Footer des Displays erscheint kurz ein <strong style="color:#fdd835;">[&gt;</strong> Symbol in Gelb, das bestätigt, dass dein Touch erkannt wurde.
-            </div>
-          </details>
-
-          <details class="faq-item">
-            <summary>Was ist der Seitenwechsel-Modus "Beides" – und warum ist er empfohlen?</summary>
-            <div class="faq-content">
-              Im Modus <strong>"Beides"</strong> läuft der automatische Seitenwechsel wie gewohnt. Wenn du aber den Bildschirm antippst, übernimmt der ESP32 für ca. <strong>30 Sekunden</strong> die Kontrolle – HA pausiert in dieser Zeit die Rotation. Danach kehrt der automatische Wechsel zurück.<br><br>
-              Das ist ideal, wenn du zwischendurch schnell eine bestimmte Seite prüfen möchtest, ohne den Automodus dauerhaft zu deaktivieren.
-            </div>
-          </details>
-        </div>
-
-        <!-- SEITENWECHSEL-MODUS ERKLAERUNG -->
-        <div class="tech-box" style="margin-top: 15px; border-color: rgba(155, 89, 182, 0.4);">
-          <h3 style="margin-top:0; color:#9b59b6;">🔄👆 Seitenwechsel-Modi im Überblick</h3>
-          <p style="color:#bbb; font-size:14px; margin-bottom: 18px; line-height:1.6;">
-            Du kannst unter <strong>Einstellungen → Allgemeine Eigenschaften</strong> wählen, wie das Display zwischen den Seiten wechselt.
-          </p>
-
-          <!-- Modus-Karten -->
-          <div style="display: flex; gap: 12px; flex-wrap: wrap; margin-bottom: 20px;">
-            <div style="flex:1; min-width:160px; background:rgba(255,255,255,0.04); border:1px solid rgba(155,89,182,0.3); border-radius:10px; padding:16px;">
-              <div style="font-size:2em; text-align:center; margin-bottom:8px;">🔄</div>
-              <div style="font-weight:700; color:#b26ef7; text-align:center; margin-bottom:8px;">Automatisch</div>
-              <ul style="color:#bbb; font-size:0.82em; line-height:1.7; padding-left:16px; margin:0;">
-                <li>Home Assistant wechselt Seiten nach dem eingestellten Zeitintervall</li>
-                <li>Touch am Display hat <strong style="color:#fff;">keinen Effekt</strong></li>
-                <li>Ideal für reine Schau-Displays</li>
-              </ul>
-            </div>
-            <div style="flex:1; min-width:160px; background:rgba(255,255,255,0.04); border:1px solid rgba(155,89,182,0.3); border-radius:10px; padding:16px;">
-              <div style="font-size:2em; text-align:center; margin-bottom:8px;">👆</div>
-              <div style="font-weight:700; color:#b26ef7; text-align:center; margin-bottom:8px;">Nur Touch</div>
-              <ul style="color:#bbb; font-size:0.82em; line-height:1.7; padding-left:16px; margin:0;">
-                <li>Seiten wechseln <strong style="color:#fff;">nur</strong> durch Tippen auf das Display</li>
-                <li>Kein automatischer Wechsel</li>
-                <li>Das Intervall-Feld wird ignoriert</li>
-                <li>Ideal wenn du selbst bestimmst, was angezeigt wird</li>
-              </ul>
-            </div>
-            <div style="flex:1; min-width:160px; background:rgba(155,89,182,0.12); border:2px solid rgba(155,89,182,0.5); border-radius:10px; padding:16px; position:relative;">
-              <div style="position:absolute; top:-10px; right:12px; background:#9b59b6; color:#fff; font-size:0.65em; font-weight:700; padding:2px 8px; border-radius:10px; letter-spacing:1px;">EMPFOHLEN</div>
-              <div style="font-size:2em; text-align:center; margin-bottom:8px;">🔄👆</div>
-              <div style="font-weight:700; color:#b26ef7; text-align:center; margin-bottom:8px;">Beides</div>
-              <ul style="color:#bbb; font-size:0.82em; line-height:1.7; padding-left:16px; margin:0;">
-                <li>Auto-Rotation läuft wie normal</li>
-                <li>Tippen stoppt Auto für <strong style="color:#fff;">~30 Sek.</strong></li>
-                <li>Danach kehrt Auto automatisch zurück</li>
-                <li>Bestes aus beiden Welten ✨</li>
-              </ul>
-            </div>
-          </div>
-
-          <!-- Visueller Footer-Indikator -->
-          <div style="background:rgba(0,0,0,0.3); border-radius:8px; padding:14px 16px; border:1px solid rgba(255,255,255,0.08);">
-            <div style="font-size:0.85em; font-weight:600; color:#ccc; margin-bottom:10px;">📺 Anzeige auf dem Display (Footer)</div>
-            <div style="display:flex; gap:16px; flex-wrap:wrap;">
-              <div style="display:flex; align-items:center; gap:10px;">
-                <div style="background:#111; border:1px solid #333; border-radius:6px; padding:4px 10px; font-family:monospace; font-size:0.9em; color:#fdd835;">[&gt;</div>
-                <span style="color:#888; font-size:0.82em;">Gelb = Touch-Override aktiv (du hast gerade getippt)</span>
-              </div>
-              <div style="display:flex; align-items:center; gap:10px;">
-                <div style="background:#111; border:1px solid #333; border-radius:6px; padding:4px 10px; font-family:monospace; font-size:0.9em; color:#aaa;">[&gt;</div>
-                <span style="color:#888; font-size:0.82em;">Weiß/Grau = HA steuert automatisch</span>
-              </div>
-              <div style="display:flex; align-items:center; gap:10px;">
-                <div style="background:#111; border:1px solid #333; border-radius:6px; padding:4px 10px; font-family:monospace; font-size:0.9em; color:#fdd835;">&lt; &gt;</div>
-                <span style="color:#888; font-size:0.82em;">Blinkt kurz auf bei jedem Touch</span>
-              </div>
-            </div>
-          </div>
-        </div>
-
-        <div class="tech-box" style="margin-top: 15px; border-color: rgba(0, 168, 255, 0.3); background: rgba(0, 69, 124, 0.1);">
-          <div style="display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap; gap: 15px;">
-            <div style="flex: 1; min-width: 300px;">
-              <h3 style="margin-top:0; color:#00a8ff;">☕ Support & Spenden</h3>
-              <p style="color:#bbb; line-height:1.6; margin-top: 5px;">Dir gefällt das Projekt und du möchtest die Weiterentwicklung unterstützen? Ich freue mich riesig über jeden noch so kleinen Betrag für die nächste Tasse Kaffee!</p>
-              <p style="color:#888; font-size: 12px; margin-top: 5px;">📧 info@low-streaming.de</p>
-            </div>
-            <div>
-              <a href="https://www.paypal.com/cgi-bin/webscr?cmd=_donations&business=info@low-streaming.de&currency_code=EUR" target="_blank" style="display: inline-flex; align-items: center; justify-content: center; background: #00457C; color: white; padding: 12px 24px; border-radius: 8px; text-decoration: none; font-size: 16px; font-weight: bold; border: 1px solid #00569c; box-shadow: 0 4px 15px rgba(0, 69, 124, 0.4); transition: transform 0.2s, background 0.2s;">
-                <svg viewBox="0 0 24 24" width="22" height="22" style="margin-right: 10px; fill: white;"><path d="M7.076 21.337H2.47a.641.641 0 0 1-.633-.74L4.944.901C5.026.382 5.474 0 5.998 0h7.46c2.57 0 4.578.543 5.69 1.81 1.01 1.15 1.304 2.42 1.012 4.287-.023.143-.047.288-.077.437-.983 5.05-4.349 6.797-8.647 6.797h-2.19c-.524 0-.968.382-1.05.9l-1.12 7.106zm14.146-14.42a3.35 3.35 0 0 0-.607-.541c-.013.076-.026.175-.041.254-.93 4.778-4.005 7.201-9.138 7.201h-2.19a2.058 2.058 0 0 0-2.029 1.737l-1.36 8.617h3.336c.451 0 .835-.333.905-.78l.412-2.613a1.144 1.144 0 0 1 1.128-.964h.473c4.14 0 7.37-1.554 8.24-6.024.34-1.748.156-3.136-.5-4.102-.271-.4-.68-.847-1.164-1.298l.535-1.487z"/></svg>
-                Spenden via PayPal
-              </a>
-            </div>
-          </div>
-        </div>
-      </div>
-  `;
-  }
-
   static get styles() {
     return css`
       :host {
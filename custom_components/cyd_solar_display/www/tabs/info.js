@@ -0,0 +1,201 @@
+// Help & info tab.
+// Wird erst beim Öffnen des Tabs geladen, die Methoden landen auf CYDPreview.prototype.
+import { html } from "https://unpkg.com/lit-element@2.4.0/lit-element.js?module";
+
+export const methods = {
+  renderInfo() {
+    const currentVersion = "1.2.9";
+    const latest = this.latestVersion || "0.0.0";
+    const updateAvailable = latest !== "0.0.0" && latest !== currentVersion;
+
+    return html`
+    <div class="card" style="margin-bottom: 20px; border-color: ${updateAvailable ? '#00f3ff' : 'rgba(255,255,255,0.1)'}; background: ${updateAvailable ? 'rgba(0, 243, 255, 0.05)' : 'rgba(0,0,0,0.2)'};">
+      <div style="display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap; gap: 20px;">
+        <div style="flex: 1; min-width: 250px;">
+          <h3 style="margin: 0; color: #fff; display: flex; align-items: center; gap: 12px;">
+            <span style="font-size: 1.4em; filter: drop-shadow(0 0 5px ${updateAvailable ? '#00f3ff' : '#4caf50'});">${updateAvailable ? '🚀' : '✅'}</span> 
+            System & Firmware Status
+          </h3>
+          <div style="margin-top: 8px; font-size: 14px; color: #aaa; display: flex; align-items: center; gap: 10px;">
+            <div>
+              Installiert: <span style="color: #fff; font-weight: bold;">v${currentVersion}</span>
+              ${updateAvailable ? html` | <span style="color: #00f3ff; font-weight: 500;">Neue Version v${latest} verfügbar!</span>` : html` | <span style="color: #4caf50; font-weight: 500;">System ist auf dem neuesten Stand.</span>`}
+            </div>
+            <button 
+              @click="${this.checkUpdate}" 
+              ?disabled="${this._checkingUpdate}"
+              style="background: rgba(255,255,255,0.05); color: #fff; border: 1px solid rgba(255,255,255,0.1); padding: 2px 8px; border-radius: 4px; font-size: 10px; cursor: pointer; transition: all 0.2s;"
+              onmouseover="this.style.background='rgba(255,255,255,0.1)'"
+              onmouseout="this.style.background='rgba(255,255,255,0.05)'"
+            >
+              ${this._checkingUpdate ? 'Suche...' : '🔍 Prüfen'}
+            </button>
+          </div>
+        </div>
+        <div>
+          ${updateAvailable ? html`
+            <button 
+              @click="${() => { this.activeTab = 'updates'; }}"
+              style="display: inline-flex; align-items: center; justify-content: center; background: linear-gradient(135deg, #00f3ff 0%, #0084ff 100%); color: #000; padding: 12px 25px; border-radius: 8px; border:none; font-size: 14px; font-weight: 900; box-shadow: 0 4px 15px rgba(0, 243, 255, 0.4); cursor: pointer; transition: transform 0.2s, box-shadow 0.2s; text-transform: uppercase; letter-spacing: 1px;"
+              onmouseover="this.style.transform='scale(1.05)'; this.style.boxShadow='0 6px 20px rgba(0, 243, 255, 0.6)';" 
+              onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 15px rgba(0, 243, 255, 0.4)';"
+            >
+              🚀 Zu den Updates
+            </button>
+          ` : html`
+            <div style="background: rgba(76, 175, 80, 0.1); color: #4caf50; padding: 8px 16px; border-radius: 6px; border: 1px solid rgba(76, 175, 80, 0.3); font-size: 13px; font-weight: 700; display: flex; align-items: center; gap: 8px;">
+               <div style="width: 8px; height: 8px; background: #4caf50; border-radius: 50%; box-shadow: 0 0 8px #4caf50;"></div>
+               Aktuell
+            </div>
+          `}
+        </div>
+      </div>
+    </div>
+
+    <div class="card" >
+      <h2>ℹ️ Informationen & Ersteinrichtung</h2>
+      <p>Willkommen beim <strong>CYD Solar Display</strong> Panel.</p>
+        
+        <div class="tech-box">
+          <h3 style="margin-top:0; color:#F7931A;">☀️ Was ist das CYD Solar Display?</h3>
+          <p style="color:#bbb; line-height:1.6; margin-top: 5px;">Dieses Projekt verbindet deinen Home Assistant mit einem <strong>ESP32 Cheap Yellow Display (CYD) 2432S028</strong>, um deine Solar-, Batterie- und Netzwerte hochauflösend und in Echtzeit in deinem Wohnraum zu visualisieren.</p>
+        </div>
+
+        <div class="tech-box" style="margin-top: 15px;">
+          <h3 style="margin-top:0; color:#4fc3f7;">🚀 Einrichtung</h3>
+          <ul style="color:#bbb; line-height:1.6; padding-left:20px;">
+            <li><strong style="color:#ddd;">1. Hardware:</strong> Du benötigst das fertig geflashte ESP32 CYD (Modell 2432S028).
+              <div style="margin: 12px 0 15px 0;">
+                <a href="https://solarmodule-gladbeck.de/produkt/ok_display/" target="_blank" style="display: inline-flex; align-items: center; justify-content: center; background: linear-gradient(135deg, #00f3ff 0%, #0084ff 100%); color: #000; padding: 12px 22px; border-radius: 8px; text-decoration: none; font-size: 15px; font-weight: 900; box-shadow: 0 4px 20px rgba(0, 243, 255, 0.4); transition: transform 0.2s, box-shadow 0.2s; text-transform: uppercase; letter-spacing: 0.5px;" onmouseover="this.style.transform='scale(1.03)'; this.style.boxShadow='0 6px 25px rgba(0, 243, 255, 0.6)';" onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 20px rgba(0, 243, 255, 0.4)';">
+                  <svg viewBox="0 0 24 24" width="22" height="22" style="margin-right: 10px; fill: #000;"><path d="M7 18c-1.1 0-1.99.9-1.99 2S5.9 22 7 22s2-.9 2-2-.9-2-2-2zM1 2v2h2l3.6 7.59-1.35 2.45c-.16.28-.25.61-.25.96 0 1.1.9 2 2 2h12v-2H7.42c-.14 0-.25-.11-.25-.25l.03-.12.9-1.63h7.45c.75 0 1.41-.41 1.75-1.03l3.58-6.49c.08-.14.12-.31.12-.48 0-.55-.45-1-1-1H5.21l-.94-2H1zm16 16c-1.1 0-1.99.9-1.99 2s.89 2 1.99 2 2-.9 2-2-.9-2-2-2z"/></svg>
+                  Hardware fertig geflasht kaufen (Plug & Play)
+                </a>
+              </div>
+            </li>
+            <li><strong style="color:#ddd;">2. WLAN & mDNS:</strong> Das Display verbindet sich mit deinem Netzwerk. Home Assistant sollte es automatisch über mDNS finden.</li>
+            <li><strong style="color:#ddd;">3. Konfiguration:</strong> Sobald der ESP32 in HA als Gerät "cyd_solar_display" registriert ist, verknüpfe unter "Einstellungen" (in diesem Panel) deine Sensoren.</li>
+            <li><strong style="color:#ddd;">4. Optionen:</strong> Aktiviere oder deaktiviere einzelne Seiten (z.B. Mining Sensoren) oder die kW-Anzeige ganz nach deinem Geschmack.</li>
+            <li><strong style="color:#ddd;">5. Automatisierung:</strong> Das System arbeitet passiv. Die ausgewählten Sensordaten werden nun vom Panel aus im Intervall (z.B. 5s) intelligent an das Display gepusht! Viel Spaß.</li>
+          </ul>
+        </div>
+
+        <div class="tech-box faq-box" style="margin-top: 15px; border-color: rgba(255, 152, 0, 0.3);">
+          <h3 style="margin-top:0; color:#ff9800;">❓ Häufige Fragen (FAQ)</h3>
+          
+          <details class="faq-item">
+            <summary>Mein Display wird nicht von Home Assistant (mDNS) gefunden, was tun?</summary>
+            <div class="faq-content">
+              Prüfe, ob du beim Setup im WLAN-Portal des Displays dein richtiges 2,4 GHz WLAN und Passwort eingegeben hast. Manchmal blockieren Router mDNS (Bonjour). In diesem Fall kannst du die IP-Adresse des Displays in deinem Router auslesen und manuell über "Integration hinzufügen -> ESPHome" in Home Assistant eintragen.
+            </div>
+          </details>
+          
+          <details class="faq-item" open>
+            <summary>Meine Sensoren auf dem Display zeigen nur 0 an</summary>
+            <div class="faq-content">
+              Stelle sicher, dass du unter "Einstellungen" (in diesem Panel) Sensoren ausgewählt und gespeichert hast. Es dauert nach dem Speichern bis zu 10 Sekunden (je nach eingestelltem Update Intervall), bis der ESP32 die ersten neuen Werte empfängt.
+            </div>
+          </details>
+
+          <details class="faq-item">
+            <summary>Was ist der Unterschied zwischen Watt (W) und Kilowatt (kW)?</summary>
+            <div class="faq-content">
+              Wähle als Sensoren nach Möglichkeit immer die <strong>Watt-Werte</strong> aus deinem System. Wenn dir die angezeigten Zahlen auf dem Display zu groß sind, setze den Haken bei "Leistung in Kilowatt (kW) anzeigen". Das Display konvertiert die originalen Watt-Werte dann für dich automatisch auf dem Bildschirm in kW (z.B. 2400W -> 2.4kW).
+            </div>
+          </details>
+
+          <details class="faq-item">
+            <summary>Wie funktioniert der Touch-Seitenwechsel?</summary>
+            <div class="faq-content">
+              Das CYD-Display hat einen eingebauten Touchscreen. Tippe <strong>irgendwo auf das Display</strong>, um zur nächsten Seite zu wechseln. Der Wechsel erfolgt sofort – du musst nicht auf eine bestimmte Stelle tippen. Im Footer des Displays erscheint kurz ein <strong style="color:#fdd835;">[&gt;</strong> Symbol in Gelb, das bestätigt, dass dein Touch erkannt wurde.
+            </div>
+          </details>
+
+          <details class="faq-item">
+            <summary>Was ist der Seitenwechsel-Modus "Beides" – und warum ist er empfohlen?</summary>
+            <div class="faq-content">
+              Im Modus <strong>"Beides"</strong> läuft der automatische Seitenwechsel wie gewohnt. Wenn du aber den Bildschirm antippst, übernimmt der ESP32 für ca. <strong>30 Sekunden</strong> die Kontrolle – HA pausiert in dieser Zeit die Rotation. Danach kehrt der automatische Wechsel zurück.<br><br>
+              Das ist ideal, wenn du zwischendurch schnell eine bestimmte Seite prüfen möchtest, ohne den Automodus dauerhaft zu deaktivieren.
+            </div>
+          </details>
+        </div>
+
+        <!-- SEITENWECHSEL-MODUS ERKLAERUNG -->
+        <div class="tech-box" style="margin-top: 15px; border-color: rgba(155, 89, 182, 0.4);">
+          <h3 style="margin-top:0; color:#9b59b6;">🔄👆 Seitenwechsel-Modi im Überblick</h3>
+          <p style="color:#bbb; font-size:14px; margin-bottom: 18px; line-height:1.6;">
+            Du kannst unter <strong>Einstellungen → Allgemeine Eigenschaften</strong> wählen, wie das Display zwischen den Seiten wechselt.
+          </p>
+
+          <!-- Modus-Karten -->
+          <div style="display: flex; gap: 12px; flex-wrap: wrap; margin-bottom: 20px;">
+            <div style="flex:1; min-width:160px; background:rgba(255,255,255,0.04); border:1px solid rgba(155,89,182,0.3); border-radius:10px; padding:16px;">
+              <div style="font-size:2em; text-align:center; margin-bottom:8px;">🔄</div>
+              <div style="font-weight:700; color:#b26ef7; text-align:center; margin-bottom:8px;">Automatisch</div>
+              <ul style="color:#bbb; font-size:0.82em; line-height:1.7; padding-left:16px; margin:0;">
+                <li>Home Assistant wechselt Seiten nach dem eingestellten Zeitintervall</li>
+                <li>Touch am Display hat <strong style="color:#fff;">keinen Effekt</strong></li>
+                <li>Ideal für reine Schau-Displays</li>
+              </ul>
+            </div>
+            <div style="flex:1; min-width:160px; background:rgba(255,255,255,0.04); border:1px solid rgba(155,89,182,0.3); border-radius:10px; padding:16px;">
+              <div style="font-size:2em; text-align:center; margin-bottom:8px;">👆</div>
+              <div style="font-weight:700; color:#b26ef7; text-align:center; margin-bottom:8px;">Nur Touch</div>
+              <ul style="color:#bbb; font-size:0.82em; line-height:1.7; padding-left:16px; margin:0;">
+                <li>Seiten wechseln <strong style="color:#fff;">nur</strong> durch Tippen auf das Display</li>
+                <li>Kein automatischer Wechsel</li>
+                <li>Das Intervall-Feld wird ignoriert</li>
+                <li>Ideal wenn du selbst bestimmst, was angezeigt wird</li>
+              </ul>
+            </div>
+            <div style="flex:1; min-width:160px; background:rgba(155,89,182,0.12); border:2px solid rgba(155,89,182,0.5); border-radius:10px; padding:16px; position:relative;">
+              <div style="position:absolute; top:-10px; right:12px; background:#9b59b6; color:#fff; font-size:0.65em; font-weight:700; padding:2px 8px; border-radius:10px; letter-spacing:1px;">EMPFOHLEN</div>
+              <div style="font-size:2em; text-align:center; margin-bottom:8px;">🔄👆</div>
+              <div style="font-weight:700; color:#b26ef7; text-align:center; margin-bottom:8px;">Beides</div>
+              <ul style="color:#bbb; font-size:0.82em; line-height:1.7; padding-left:16px; margin:0;">
+                <li>Auto-Rotation läuft wie normal</li>
+                <li>Tippen stoppt Auto für <strong style="color:#fff;">~30 Sek.</strong></li>
+                <li>Danach kehrt Auto automatisch zurück</li>
+                <li>Bestes aus beiden Welten ✨</li>
+              </ul>
+            </div>
+          </div>
+
+          <!-- Visueller Footer-Indikator -->
+          <div style="background:rgba(0,0,0,0.3); border-radius:8px; padding:14px 16px; border:1px solid rgba(255,255,255,0.08);">
+            <div style="font-size:0.85em; font-weight:600; color:#ccc; margin-bottom:10px;">📺 Anzeige auf dem Display (Footer)</div>
+            <div style="display:flex; gap:16px; flex-wrap:wrap;">
+              <div style="display:flex; align-items:center; gap:10px;">
+                <div style="background:#111; border:1px solid #333; border-radius:6px; padding:4px 10px; font-family:monospace; font-size:0.9em; color:#fdd835;">[&gt;</div>
+                <span style="color:#888; font-size:0.82em;">Gelb = Touch-Override aktiv (du hast gerade getippt)</span>
+              </div>
+              <div style="display:flex; align-items:center; gap:10px;">
+                <div style="background:#111; border:1px solid #333; border-radius:6px; padding:4px 10px; font-family:monospace; font-size:0.9em; color:#aaa;">[&gt;</div>
+                <span style="color:#888; font-size:0.82em;">Weiß/Grau = HA steuert automatisch</span>
+              </div>
+              <div style="display:flex; align-items:center; gap:10px;">
+                <div style="background:#111; border:1px solid #333; border-radius:6px; padding:4px 10px; font-family:monospace; font-size:0.9em; color:#fdd835;">&lt; &gt;</div>
+                <span style="color:#888; font-size:0.82em;">Blinkt kurz auf bei jedem Touch</span>
+              </div>
+            </div>
+          </div>
+        </div>
+
+        <div class="tech-box" style="margin-top: 15px; border-color: rgba(0, 168, 255, 0.3); background: rgba(0, 69, 124, 0.1);">
+          <div style="display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap; gap: 15px;">
+            <div style="flex: 1; min-width: 300px;">
+              <h3 style="margin-top:0; color:#00a8ff;">☕ Support & Spenden</h3>
+              <p style="color:#bbb; line-height:1.6; margin-top: 5px;">Dir gefällt das Projekt und du möchtest die Weiterentwicklung unterstützen? Ich freue mich riesig über jeden noch so kleinen Betrag für die nächste Tasse Kaffee!</p>
+              <p style="color:#888; font-size: 12px; margin-top: 5px;">📧 info@low-streaming.de</p>
+            </div>
+            <div>
+              <a href="https://www.paypal.com/cgi-bin/webscr?cmd=_donations&business=info@low-streaming.de&currency_code=EUR" target="_blank" style="display: inline-flex; align-items: center; justify-content: center; background: #00457C; color: white; padding: 12px 24px; border-radius: 8px; text-decoration: none; font-size: 16px; font-weight: bold; border: 1px solid #00569c; box-shadow: 0 4px 15px rgba(0, 69, 124, 0.4); transition: transform 0.2s, background 0.2s;">
+                <svg viewBox="0 0 24 24" width="22" height="22" style="margin-right: 10px; fill: white;"><path d="M7.076 21.337H2.47a.641.641 0 0 1-.633-.74L4.944.901C5.026.382 5.474 0 5.998 0h7.46c2.57 0 4.578.543 5.69 1.81 1.01 1.15 1.304 2.42 1.012 4.287-.023.143-.047.288-.077.437-.983 5.05-4.349 6.797-8.647 6.797h-2.19c-.524 0-.968.382-1.05.9l-1.12 7.106zm14.146-14.42a3.35 3.35 0 0 0-.607-.541c-.013.076-.026.175-.041.254-.93 4.778-4.005 7.201-9.138 7.201h-2.19a2.058 2.058 0 0 0-2.029 1.737l-1.36 8.617h3.336c.451 0 .835-.333.905-.78l.412-2.613a1.144 1.144 0 0 1 1.128-.964h.473c4.14 0 7.37-1.554 8.24-6.024.34-1.748.156-3.136-.5-4.102-.271-.4-.68-.847-1.164-1.298l.535-1.487z"/></svg>
+                Spenden via PayPal
+              </a>
+            </div>
+          </div>
+        </div>
+      </div>
+  `;
+  },
+};
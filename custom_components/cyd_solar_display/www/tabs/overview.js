@@ -0,0 +1,291 @@
+// Dashboard tab: live preview of the display pages.
+// Wird erst beim Öffnen des Tabs geladen, die Methoden landen auf CYDPreview.prototype.
+import { html } from "https://unpkg.com/lit-element@2.4.0/lit-element.js?module";
+
+export const methods = {
+  renderLiveState() {
+    if (!this.liveState) return '';
+    const displays = Object.entries(this.liveState.displays || {});
+    return html`
+      <p style="font-size: 13px; color: #aaa;">
+        Display zeigt Seite <b style="color: #00f3ff;">${this.liveState.current_page}</b>
+        ${this.liveState.push_mode ? ' · Push-Modus' : ''}
+        ${displays.filter(([, d]) => d.degraded).map(([service, d]) => html`
+          <br><span style="color: #ff003c;">⚠️ ${service}: gestört (${d.failures} Fehler${d.last_error ? `, ${d.last_error}` : ''})</span>
+        `)}
+      </p>
+    `;
+  },
+
+  getLiveValue(entityId, defaultVal) {
+    if (!this.hass || !entityId || !this.hass.states[entityId]) return defaultVal;
+    const state = this.hass.states[entityId].state;
+    if (state === 'unavailable' || state === 'unknown') return defaultVal;
+    const parsed = parseFloat(state);
+    if (isNaN(parsed)) return defaultVal;
+    return parseFloat(parsed.toFixed(2));
+  },
+
+  payloadValue(entityKey, payloadKey) {
+    // Nur solange die Entität gespeichert ist, zeigt der Payload dasselbe wie der Editor
+    const entityId = this.editConfig[entityKey];
+    const payload = this.livePayload;
+    if (!payload || !entityId || entityId !== this.savedConfig[entityKey]) return undefined;
+    return payload[payloadKey];
+  },
+
+  displayValue(entityKey, payloadKey, defaultVal) {
+    const val = this.payloadValue(entityKey, payloadKey);
+    return val !== undefined ? val : this.getLiveValue(this.editConfig[entityKey], defaultVal);
+  },
+
+  customValue(entityKey, payloadKey, defaultVal, unit) {
+    const val = this.payloadValue(entityKey, payloadKey);
+    return val !== undefined ? val : this.getLiveValue(this.editConfig[entityKey], defaultVal) + unit;
+  },
+
+  renderOverview() {
+    const solar_w = this.displayValue('solar_entity', 'solar', 4500);
+    const grid_w = this.displayValue('grid_entity', 'grid', -1200);
+    const house_w = this.displayValue('house_entity', 'house', 2800);
+    const battery_w = this.displayValue('battery_entity', 'bat_w', 500);
+    const battery_soc = this.displayValue('battery_soc_entity', 'bat_soc', 85);
+
+    const yield_today = this.displayValue('yield_today_entity', 'val_yield', 12.4);
+    const yield_month = this.displayValue('yield_month_entity', 'val_yield_month', 114.2);
+    const yield_year = Math.round(this.displayValue('yield_year_entity', 'val_yield_year', 1054.8));
+    const yield_total = Math.round(this.displayValue('yield_total_entity', 'val_yield_total', 3450.5));
+
+    const c1_n = this.editConfig.custom1_name || "Custom 1";
+    const c1_v = this.customValue('custom1_entity', 'c1_v', 21.5, " °C");
+    const c2_n = this.editConfig.custom2_name || "Custom 2";
+    const c2_v = this.customValue('custom2_entity', 'c2_v', 48.0, " %");
+    const c3_n = this.editConfig.custom3_name || "Custom 3";
+    const c3_v = this.customValue('custom3_entity', 'c3_v', 1120.0, " kWh");
+    const c4_n = this.editConfig.custom4_name || "Custom 4";
+    const c4_v = this.customValue('custom4_entity', 'c4_v', 1.0, " bar");
+
+    const c5_n = this.editConfig.custom5_name || "Custom 5";
+    const c5_v = this.customValue('custom5_entity', 'c5_v', 21.5, " °C");
+    const c6_n = this.editConfig.custom6_name || "Custom 6";
+    const c6_v = this.customValue('custom6_entity', 'c6_v', 48.0, " %");
+    const c7_n = this.editConfig.custom7_name || "Custom 7";
+    const c7_v = this.customValue('custom7_entity', 'c7_v', 1120.0, " kWh");
+    const c8_n = this.editConfig.custom8_name || "Custom 8";
+    const c8_v = this.customValue('custom8_entity', 'c8_v', 1.0, " bar");
+
+    const m1_n = this.editConfig.mining1_name || "Mining 1";
+    const m1_v = this.customValue('mining1_entity', 'c9_v', 120.0, " TH/s");
+    const m2_n = this.editConfig.mining2_name || "Mining 2";
+    const m2_v = this.customValue('mining2_entity', 'c10_v', 65.0, " °C");
+    const m3_n = this.editConfig.mining3_name || "Mining 3";
+    const m3_v = this.customValue('mining3_entity', 'c11_v', 3500.0, " W");
+    const m4_n = this.editConfig.mining4_name || "Mining 4";
+    const m4_v = this.customValue('mining4_entity', 'c12_v', 1.0, " BTC");
+
+    const hasPage1 = this.editConfig.enable_page1 !== false;
+    const hasPage2 = this.editConfig.enable_page2 !== false;
+    const hasPage3 = this.editConfig.enable_page3 !== false;
+    const hasPage4 = this.editConfig.enable_page4 !== false;
+    const hasPage5 = this.editConfig.enable_page5 !== false;
+    const hasPage6 = !!this.editConfig.enable_page6;
+    const hasPage7 = !!this.editConfig.enable_page7;
+    const hasPage8 = !!this.editConfig.enable_page8;
+    const hasPage9 = !!this.editConfig.enable_page9;
+
+    const isNegative = grid_w < 0;
+    const pVal = (w) => this.editConfig.show_kw ? (w / 1000).toFixed(2) : Math.round(w);
+    const pUnit = this.editConfig.show_kw ? "kW" : "W";
+
+    return html`
+      <div class="card">
+          <div class="cyd-info">
+            <h3>CYD Display Live Preview</h3>
+            <p>1:1 Simulation mit den Livedaten deines Home Assistants.</p>
+            ${this.renderLiveState()}
+          </div>
+          
+          <div class="cyd-container">
+            <div class="cyd-frame">
+              <div class="cyd-screen">
+                <div class="header">
+                  <span class="title">Solar Monitor</span>
+                  <span class="time">${new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}</span>
+                </div>
+                
+                ${this.page === 1 ? html`
+                  <div class="page page1">
+                    <div class="quad-grid">
+                      <div class="quad-box q-solar">
+                        <div class="q-label">SOLAR</div>
+                        <div class="q-value">${pVal(solar_w)}<span>${pUnit}</span></div>
+                      </div>
+                      <div class="quad-box q-house">
+                        <div class="q-label">HAUSVERBRAUCH</div>
+                        <div class="q-value">${pVal(house_w)}<span>${pUnit}</span></div>
+                      </div>
+                      <div class="quad-box q-batt">
+                        <div class="q-label">BATTERIE</div>
+                        <div class="q-batt-val">${battery_soc}%</div>
+                        <div class="q-batt-bar">
+                          <div style="width: ${battery_soc}%; background: ${battery_soc <= 20 ? '#ef5350' : (battery_soc <= 50 ? '#ff9800' : '#4caf50')}"></div>
+                        </div>
+                        <div class="q-batt-w">${pVal(battery_w)} ${pUnit}</div>
+                      </div>
+                      <div class="quad-box q-grid ${isNegative ? 'export' : 'import'}">
+                        <div class="q-label">${isNegative ? 'EINSPEISUNG' : 'NETZBEZUG'}</div>
+                        <div class="q-value">${pVal(Math.abs(grid_w))}<span>${pUnit}</span></div>
+                      </div>
+                    </div>
+                  </div>
+                ` : this.page === 2 ? html`
+                  <div class="page page2">
+                    <div class="stats-grid">
+                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
+                          <div class="label" style="color: #fdd835;">Ertrag Tag</div>
+                          <div class="value">${yield_today} <span>kWh</span></div>
+                      </div>
+                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
+                          <div class="label" style="color: #fdd835;">Ertrag Monat</div>
+                          <div class="value">${yield_month} <span>kWh</span></div>
+                      </div>
+                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
+                          <div class="label" style="color: #fdd835;">Ertrag Jahr</div>
+                          <div class="value">${yield_year} <span>kWh</span></div>
+                      </div>
+                      <div class="stat-item" style="border-left: 4px solid #fdd835;">
+                          <div class="label" style="color: #fdd835;">Gesamtertrag</div>
+                          <div class="value">${yield_total} <span>kWh</span></div>
+                      </div>
+                    </div>
+                  </div>
+                ` : this.page === 3 ? html`
+                  <div class="page page3">
+                    <div class="stats-grid">
+                      ${this.editConfig.custom1_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #00f3ff;">
+                          <div class="label" style="color: #00f3ff;">${c1_n}</div>
+                          <div class="value">${c1_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.custom2_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #00ff73;">
+                          <div class="label" style="color: #00ff73;">${c2_n}</div>
+                          <div class="value">${c2_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.custom3_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #b026ff;">
+                          <div class="label" style="color: #b026ff;">${c3_n}</div>
+                          <div class="value">${c3_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.custom4_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #ff003c;">
+                          <div class="label" style="color: #ff003c;">${c4_n}</div>
+                          <div class="value">${c4_v}</div>
+                      </div>` : ''}
+                    </div>
+                  </div>
+                ` : this.page === 4 ? html`
+                  <div class="page page4">
+                    <div class="stats-grid">
+                      ${this.editConfig.custom5_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #00f3ff;">
+                          <div class="label" style="color: #00f3ff;">${c5_n}</div>
+                          <div class="value">${c5_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.custom6_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #00ff73;">
+                          <div class="label" style="color: #00ff73;">${c6_n}</div>
+                          <div class="value">${c6_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.custom7_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #b026ff;">
+                          <div class="label" style="color: #b026ff;">${c7_n}</div>
+                          <div class="value">${c7_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.custom8_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #ff003c;">
+                          <div class="label" style="color: #ff003c;">${c8_n}</div>
+                          <div class="value">${c8_v}</div>
+                      </div>` : ''}
+                    </div>
+                  </div>
+                ` : this.page === 5 ? html`
+                  <div class="page page5">
+                    <div class="stats-grid">
+                      ${this.editConfig.mining1_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
+                          <div class="label" style="color: #ff9800;">${m1_n}</div>
+                          <div class="value">${m1_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.mining2_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
+                          <div class="label" style="color: #ff9800;">${m2_n}</div>
+                          <div class="value">${m2_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.mining3_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
+                          <div class="label" style="color: #ff9800;">${m3_n}</div>
+                          <div class="value">${m3_v}</div>
+                      </div>` : ''}
+                      ${this.editConfig.mining4_entity ? html`
+                      <div class="stat-item" style="border-left: 4px solid #ff9800;">
+                          <div class="label" style="color: #ff9800;">${m4_n}</div>
+                          <div class="value">${m4_v}</div>
+                      </div>` : ''}
+                    </div>
+                  </div>
+                ` : this.page >= 6 && this.page <= 9 ? html`
+                  <div class="page page-custom">
+                    <div class="stats-grid">
+                      ${[1, 2, 3, 4].map(n => {
+                        const baseIdx = (this.page - 6) * 4 + 8 + n;
+                        const nameKey = `custom${baseIdx}_name`;
+                        const entKey = `custom${baseIdx}_entity`;
+                        const name = this.editConfig[nameKey] || `Custom ${baseIdx}`;
+                        const val = this.displayValue(entKey, `c${baseIdx + 4}_v`, 0);
+                        const colorMap = ['#00f3ff', '#00ff73', '#b026ff', '#ff003c'];
+                        return this.editConfig[entKey] ? html`
+                          <div class="stat-item" style="border-left: 4px solid ${colorMap[n-1]};">
+                              <div class="label" style="color: ${colorMap[n-1]};">${name}</div>
+                              <div class="value">${val}</div>
+                          </div>` : '';
+                      })}
+                    </div>
+                  </div>
+                ` : html`
+                  <div class="page page-empty">
+                    <div style="text-align:center;color:#666;margin-top:40px;">Seite nicht aktiv</div>
+                  </div>
+                `}
+
+                <div class="footer">
+                  <div class="dots">
+                    ${hasPage1 ? html`<div class="dot ${this.page === 1 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage2 ? html`<div class="dot ${this.page === 2 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage3 ? html`<div class="dot ${this.page === 3 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage4 ? html`<div class="dot ${this.page === 4 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage5 ? html`<div class="dot ${this.page === 5 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage6 ? html`<div class="dot ${this.page === 6 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage7 ? html`<div class="dot ${this.page === 7 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage8 ? html`<div class="dot ${this.page === 8 ? 'active' : ''}"></div>` : ''}
+                    ${hasPage9 ? html`<div class="dot ${this.page === 9 ? 'active' : ''}"></div>` : ''}
+                  </div>
+                </div>
+              </div>
+              <div class="cyd-controls">
+                ${hasPage1 ? html`<button @click="${() => this.page = 1}">P1</button>` : ''}
+                ${hasPage2 ? html`<button @click="${() => this.page = 2}">P2</button>` : ''}
+                ${hasPage3 ? html`<button @click="${() => this.page = 3}">P3</button>` : ''}
+                ${hasPage4 ? html`<button @click="${() => this.page = 4}">P4</button>` : ''}
+                ${hasPage5 ? html`<button @click="${() => this.page = 5}">P5</button>` : ''}
+                ${hasPage6 ? html`<button @click="${() => this.page = 6}">P6</button>` : ''}
+                ${hasPage7 ? html`<button @click="${() => this.page = 7}">P7</button>` : ''}
+                ${hasPage8 ? html`<button @click="${() => this.page = 8}">P8</button>` : ''}
+                ${hasPage9 ? html`<button @click="${() => this.page = 9}">P9</button>` : ''}
+              </div>
+            </div>
+          </div>
+      </div>
+    `;
+  },
+};
@@ -0,0 +1,839 @@
+// Settings tab: option editor with the indexed entity picker.
+// Wird erst beim Öffnen des Tabs geladen, die Methoden landen auf CYDPreview.prototype.
+import { html } from "https://unpkg.com/lit-element@2.4.0/lit-element.js?module";
+
+// Slots mit Totband-Einstellung: Kernwerte mit festem Namen, der Rest über <prefix>_name
+const CORE_SLOT_LABELS = {
+  solar_entity: 'Solar', grid_entity: 'Netz', house_entity: 'Haus', battery_entity: 'Batterie', battery_soc_entity: 'Batterie SoC',
+  yield_today_entity: 'Ertrag heute', yield_month_entity: 'Ertrag Monat', yield_year_entity: 'Ertrag Jahr', yield_total_entity: 'Ertrag gesamt',
+  grid_import_entity: 'Netzbezug', grid_export_entity: 'Einspeisung',
+};
+const CUSTOM_SLOT_PREFIXES = [
+  ...[1, 2, 3, 4, 5, 6, 7, 8].map(i => `custom${i}`),
+  ...[1, 2, 3, 4].map(i => `mining${i}`),
+  ...Array.from({ length: 16 }, (_, i) => `custom${9 + i}`),
+];
+
+// Entity-Picker: feste Zeilenhöhe, damit nur die sichtbaren Zeilen gerendert werden müssen
+const PICKER_ROW_HEIGHT = 48;
+const PICKER_HEIGHT = 220;
+const PICKER_OVERSCAN = 4;
+
+// Domain-Buckets und Trigramm-Suche über hass.states.
+// Wird nur neu aufgebaut, wenn Entitäten hinzukommen/verschwinden oder die Registry sich ändert,
+// nicht bei jeder Zustandsänderung.
+class EntityIndex {
+  constructor(states, entities) {
+    this.count = Object.keys(states).length;
+    this.entities = entities;
+    this.byId = new Map();
+    this.byDomain = new Map();
+    this._buckets = new Map();
+    this._results = new Map();
+
+    Object.keys(states).sort().forEach((id) => {
+      const friendly = states[id].attributes.friendly_name;
+      const entry = {
+        id,
+        name: friendly ? `${friendly} (${id})` : id,
+        label: friendly || id,
+        haystack: `${id} ${friendly || ''}`.toLowerCase(),
+      };
+      this.byId.set(id, entry);
+      const domain = id.slice(0, id.indexOf('.'));
+      if (!this.byDomain.has(domain)) this.byDomain.set(domain, []);
+      this.byDomain.get(domain).push(entry);
+    });
+  }
+
+  isCurrent(states, entities) {
+    return entities === this.entities && Object.keys(states).length === this.count;
+  }
+
+  bucket(domains) {
+    // Mehrere Domains zusammengefasst, samt Trigramm-Index (lazy beim ersten Suchen)
+    const key = domains.join(',');
+    let bucket = this._buckets.get(key);
+    if (!bucket) {
+      const list = domains.length === 1
+        ? (this.byDomain.get(domains[0]) || [])
+        : domains.flatMap((d) => this.byDomain.get(d) || []).sort((a, b) => (a.id < b.id ? -1 : 1));
+      bucket = { key, list, trigrams: null };
+      this._buckets.set(key, bucket);
+    }
+    return bucket;
+  }
+
+  _trigrams(bucket) {
+    if (bucket.trigrams) return bucket.trigrams;
+    const trigrams = new Map();
+    bucket.list.forEach((entry, idx) => {
+      const text = entry.haystack;
+      for (let i = 0; i + 3 <= text.length; i++) {
+        const gram = text.slice(i, i + 3);
+        let posting = trigrams.get(gram);
+        if (!posting) trigrams.set(gram, posting = []);
+        if (posting[posting.length - 1] !== idx) posting.push(idx);
+      }
+    });
+    return bucket.trigrams = trigrams;
+  }
+
+  search(domains, query) {
+    const bucket = this.bucket(domains);
+    const q = (query || '').trim().toLowerCase();
+    if (!q) return bucket.list;
+    const cacheKey = `${bucket.key}|${q}`;
+    if (this._results.has(cacheKey)) return this._results.get(cacheKey);
+
+    let result;
+    if (q.length < 3) {
+      // Kurze Eingaben: Wortanfang in ID oder Name
+      result = bucket.list.filter((e) => e.haystack.startsWith(q) || e.haystack.includes(`.${q}`) || e.haystack.includes(` ${q}`) || e.haystack.includes(`_${q}`));
+    } else {
+      const trigrams = this._trigrams(bucket);
+      const postings = [];
+      for (let i = 0; i + 3 <= q.length; i++) {
+        const posting = trigrams.get(q.slice(i, i + 3));
+        if (!posting) { postings.length = 0; postings.push([]); break; }
+        postings.push(posting);
+      }
+      postings.sort((a, b) => a.length - b.length);
+      result = postings[0].map((idx) => bucket.list[idx]).filter((e) => e.haystack.includes(q));
+    }
+    if (this._results.size > 200) this._results.clear();
+    this._results.set(cacheKey, result);
+    return result;
+  }
+}
+
+export const methods = {
+  getEntityIndex() {
+    if (!this.hass) return null;
+    if (!this._entityIndex || !this._entityIndex.isCurrent(this.hass.states, this.hass.entities)) {
+      this._entityIndex = new EntityIndex(this.hass.states, this.hass.entities);
+    }
+    return this._entityIndex;
+  },
+
+  closePicker(configKey) {
+    const s = { ...this._pickerSearch }; delete s[configKey]; this._pickerSearch = s;
+    const scroll = { ...this._pickerScroll }; delete scroll[configKey]; this._pickerScroll = scroll;
+    this.requestUpdate();
+  },
+
+  handlePickerInput(e, name) {
+    this.editConfig = { ...this.editConfig, [name]: e.detail.value };
+    this.requestUpdate();
+  },
+
+  handleSelectChange(e, name) {
+    this.editConfig = { ...this.editConfig, [name]: e.target.value };
+    this.requestUpdate();
+  },
+
+  renderEntitySelect(configKey, domains) {
+    if (!this.hass) return html`<span style="color:#888;font-size:12px">Lade...</span>`;
+    const domainList = Array.isArray(domains) ? domains : [domains];
+    const index = this.getEntityIndex();
+    const currentVal = (this.editConfig && this.editConfig[configKey]) ? this.editConfig[configKey] : '';
+    const currentEnt = index.byId.get(currentVal);
+    const displayName = currentEnt ? currentEnt.name : currentVal;
+    const searchTerm = (this._pickerSearch[configKey] !== undefined) ? this._pickerSearch[configKey] : null;
+    const isOpen = searchTerm !== null;
+
+    // Gefiltert wird nur bei offenem Picker; gerendert werden nur die sichtbaren Zeilen
+    const filtered = isOpen ? index.search(domainList, searchTerm) : [];
+    const scrollTop = this._pickerScroll[configKey] || 0;
+    const first = Math.max(0, Math.floor(scrollTop / PICKER_ROW_HEIGHT) - PICKER_OVERSCAN);
+    const last = Math.min(filtered.length, Math.ceil((scrollTop + PICKER_HEIGHT) / PICKER_ROW_HEIGHT) + PICKER_OVERSCAN);
+    const visible = filtered.slice(first, last);
+
+    return html`
+      <div class="entity-picker" style="position:relative;">
+        <input
+          type="text"
+          class="picker-input"
+          placeholder="${displayName || '-- Sensor wählen --'}"
+          .value=${isOpen ? searchTerm : ''}
+          @focus=${() => { this._pickerSearch = { ...this._pickerSearch, [configKey]: '' }; this.requestUpdate(); }}
+          @input=${(e) => {
+        this._pickerSearch = { ...this._pickerSearch, [configKey]: e.target.value };
+        this._pickerScroll = { ...this._pickerScroll, [configKey]: 0 };
+        const dropdown = e.target.parentElement.querySelector('.picker-dropdown');
+        if (dropdown) dropdown.scrollTop = 0;
+        this.requestUpdate();
+      }}
+          @blur=${() => setTimeout(() => this.closePicker(configKey), 200)}
+          style="background:#111;color:#fff;border:1px solid ${currentVal ? '#fdd835' : '#444'};padding:10px;border-radius:6px;font-size:0.9em;width:100%;box-sizing:border-box;cursor:text;"
+        />
+        ${isOpen ? html`
+          <div class="picker-dropdown" style="position:absolute;z-index:100;background:#1a1a1a;border:1px solid #555;border-radius:6px;width:100%;max-height:${PICKER_HEIGHT}px;overflow-y:auto;box-shadow:0 4px 20px rgba(0,0,0,0.6);"
+            @scroll=${(e) => { this._pickerScroll = { ...this._pickerScroll, [configKey]: e.target.scrollTop }; this.requestUpdate(); }}>
+            ${filtered.length === 0 ? html`
+              <div style="padding:10px;color:#888;font-size:0.85em;">Kein Sensor gefunden</div>
+            ` : html`
+              <div style="position:relative;height:${filtered.length * PICKER_ROW_HEIGHT}px;">
+                ${visible.map((ent, i) => html`
+                  <div
+                    class="picker-item"
+                    style="position:absolute;top:${(first + i) * PICKER_ROW_HEIGHT}px;left:0;right:0;height:${PICKER_ROW_HEIGHT}px;box-sizing:border-box;padding:7px 12px;cursor:pointer;border-bottom:1px solid #333;font-size:0.85em;overflow:hidden;color:${ent.id === currentVal ? '#fdd835' : '#eee'};"
+                    @mousedown=${(e) => {
+        e.preventDefault();
+        this.editConfig = { ...this.editConfig, [configKey]: ent.id };
+        this.closePicker(configKey);
+      }}
+                  >
+                    <div style="font-weight:500;white-space:nowrap;overflow:hidden;text-overflow:ellipsis;">${ent.label}</div>
+                    <div style="color:#888;font-size:0.8em;white-space:nowrap;overflow:hidden;text-overflow:ellipsis;">${ent.id}</div>
+                  </div>
+                `)}
+              </div>
+            `}
+          </div>
+        ` : ''}
+        ${currentVal ? html`
+          <div style="margin-top:8px;background:linear-gradient(135deg,rgba(253,216,53,0.12) 0%,rgba(253,216,53,0.05) 100%);border:1px solid rgba(253,216,53,0.4);border-radius:8px;padding:8px 12px;display:flex;align-items:center;justify-content:space-between;gap:8px;">
+            <div style="display:flex;align-items:center;gap:10px;min-width:0;">
+              <div style="width:10px;height:10px;border-radius:50%;background:#4caf50;box-shadow:0 0 6px #4caf50;flex-shrink:0;"></div>
+              <div style="min-width:0;">
+                <div style="font-size:0.9em;font-weight:600;color:#fdd835;white-space:nowrap;overflow:hidden;text-overflow:ellipsis;">${currentEnt ? currentEnt.label : currentVal}</div>
+                <div style="font-size:0.72em;color:#888;white-space:nowrap;overflow:hidden;text-overflow:ellipsis;margin-top:1px;">${currentVal}</div>
+              </div>
+            </div>
+            <div title="Auswahl entfernen" style="cursor:pointer;color:#888;font-size:1.1em;flex-shrink:0;padding:2px 6px;border-radius:4px;" @click=${() => { this.editConfig = { ...this.editConfig, [configKey]: '' }; this.requestUpdate(); }}>✕</div>
+          </div>
+        ` : ''}
+      </div>
+    `;
+  },
+
+  handleFormInput(e) {
+    const { name, value, type, checked } = e.target;
+    this.editConfig = { ...this.editConfig, [name]: type === 'checkbox' ? checked : (type === 'number' ? Number(value) : value) };
+    this.requestUpdate();
+  },
+
+  setDisplayOverride(service, key, value) {
+    const overrides = { ...(this.editConfig.display_overrides || {}) };
+    overrides[service] = { ...(overrides[service] || {}), [key]: value === '' ? 0 : Number(value) };
+    this.editConfig = { ...this.editConfig, display_overrides: overrides };
+    this.requestUpdate();
+  },
+
+  setPageDwell(page, value) {
+    const dwell = { ...(this.editConfig.page_dwell || {}) };
+    if (value === '' || Number(value) <= 0) delete dwell[page];
+    else dwell[page] = Number(value);
+    this.editConfig = { ...this.editConfig, page_dwell: dwell };
+    this.requestUpdate();
+  },
+
+  renderPageDwell() {
+    // Eigene Anzeigedauer pro Seite (leer = Seitenwechsel Intervall)
+    const dwell = this.editConfig.page_dwell || {};
+    const defaults = { 1: true, 2: true, 3: true, 4: true, 5: true };
+    const pages = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10].filter(p => {
+      const enabled = this.editConfig[`enable_page${p}`];
+      return enabled === undefined ? !!defaults[p] : enabled !== false;
+    });
+    return html`
+      <div class="form-group" style="margin-top: 10px;">
+        <label>Anzeigedauer pro Seite (Sekunden)</label>
+        <div style="display: flex; flex-wrap: wrap; gap: 8px;">
+          ${pages.map(p => html`
+            <div style="width: 80px;">
+              <small>Seite ${p}</small>
+              <input type="number" min="1" placeholder="${this.editConfig.page_interval || 10}" .value="${dwell[p] || ''}" @input="${(e) => this.setPageDwell(p, e.target.value)}">
+            </div>
+          `)}
+        </div>
+        <small>Leer lassen für das allgemeine Intervall.</small>
+      </div>
+    `;
+  },
+
+  setDeadband(configKey, key, value) {
+    const deadbands = { ...(this.editConfig.deadbands || {}) };
+    const entry = { ...(deadbands[configKey] || {}), [key]: key === 'percent' ? value : (value === '' ? 0 : Number(value)) };
+    if (!entry.band && !entry.min_hold && !entry.max_hold && !entry.percent) delete deadbands[configKey];
+    else deadbands[configKey] = entry;
+    this.editConfig = { ...this.editConfig, deadbands };
+    this.requestUpdate();
+  },
+
+  renderDeadbands() {
+    // Nur Slots mit verknüpfter Entität anbieten
+    const slots = [
+      ...Object.entries(CORE_SLOT_LABELS).map(([key, label]) => [key, label]),
+      ...CUSTOM_SLOT_PREFIXES.map(prefix => [`${prefix}_entity`, this.editConfig[`${prefix}_name`] || prefix]),
+    ].filter(([key]) => this.editConfig[key]);
+    if (!slots.length) return '';
+    const deadbands = this.editConfig.deadbands || {};
+    return html`
+      <details style="margin-top: 15px;" ?open=${Object.keys(deadbands).length > 0}>
+        <summary style="cursor: pointer; color: #4caf50; font-weight: bold;">Totband pro Sensor (Rauschen unterdrücken)</summary>
+        <small style="display: block; margin: 8px 0;">
+          Änderungen innerhalb des Bandes werden nicht gesendet, spätestens nach "Max. halten" aber doch.
+          "Min. halten" begrenzt, wie oft sich ein Wert auf dem Display ändern darf.
+        </small>
+        ${slots.map(([key, label]) => {
+          const d = deadbands[key] || {};
+          return html`
+            <div class="form-row" style="margin-bottom: 6px; align-items: flex-end;">
+              <div class="form-group flex-1"><label>${label}</label></div>
+              <div class="form-group" style="width: 90px;">
+                <small>Band</small>
+                <input type="number" min="0" step="0.1" .value="${d.band || ''}" @input="${(e) => this.setDeadband(key, 'band', e.target.value)}">
+              </div>
+              <div class="form-group" style="width: 70px;">
+                <small>Einheit</small>
+                <select @change="${(e) => this.setDeadband(key, 'percent', e.target.value === 'pct')}">
+                  <option value="abs" ?selected=${!d.percent}>abs.</option>
+                  <option value="pct" ?selected=${!!d.percent}>%</option>
+                </select>
+              </div>
+              <div class="form-group" style="width: 90px;">
+                <small>Min. halten (s)</small>
+                <input type="number" min="0" .value="${d.min_hold || ''}" @input="${(e) => this.setDeadband(key, 'min_hold', e.target.value)}">
+              </div>
+              <div class="form-group" style="width: 90px;">
+                <small>Max. halten (s)</small>
+                <input type="number" min="0" .value="${d.max_hold || ''}" @input="${(e) => this.setDeadband(key, 'max_hold', e.target.value)}">
+              </div>
+            </div>
+          `;
+        })}
+      </details>
+    `;
+  },
+
+  renderDisplayOverrides() {
+    if (this.editConfig.broadcast_mode !== true || !this.displays.length) return '';
+    const overrides = this.editConfig.display_overrides || {};
+    return html`
+      <div style="margin-top: 15px; border-top: 1px solid rgba(0,243,255,0.2); padding-top: 15px;">
+        <div style="font-weight: bold; color: #00f3ff; font-size: 14px; margin-bottom: 10px;">Einstellungen pro Display</div>
+        ${this.displays.map(service => {
+          const o = overrides[service] || {};
+          const label = service.replace(/^cyd_solar_display_?/, '').replace(/_?update_display$/, '') || 'cyd_solar_display';
+          return html`
+            <div class="form-row" style="margin-bottom: 10px; align-items: flex-end;">
+              <div class="form-group flex-1">
+                <label>${label}</label>
+                <small>${service}</small>
+              </div>
+              <div class="form-group flex-1">
+                <label>Seitenwechsel (s)</label>
+                <input type="number" min="0" placeholder="Standard" .value="${o.page_interval || ''}" @input="${(e) => this.setDisplayOverride(service, 'page_interval', e.target.value)}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Feste Seite</label>
+                <select @change="${(e) => this.setDisplayOverride(service, 'fixed_page', e.target.value)}">
+                  <option value="" ?selected=${!o.fixed_page}>Rotieren</option>
+                  ${[1, 2, 3, 4, 5, 6, 7, 8, 9].map(p => html`<option value="${p}" ?selected=${o.fixed_page === p}>Seite ${p}</option>`)}
+                </select>
+              </div>
+              <div class="form-group flex-1">
+                <label>Min. Push-Abstand (s)</label>
+                <input type="number" min="0" placeholder="0" .value="${o.push_interval || ''}" @input="${(e) => this.setDisplayOverride(service, 'push_interval', e.target.value)}">
+              </div>
+            </div>
+          `;
+        })}
+        <small style="color:#888;">Leer = globale Einstellung. So kann z.B. ein Wand-Display schnell rotieren, während ein Schreibtisch-Display Seite 1 hält.</small>
+      </div>
+    `;
+  },
+
+  renderSaveState() {
+    const states = {
+      pending: ['#888', 'Änderungen werden gleich übernommen...'],
+      saving: ['#888', 'Speichere...'],
+      saved: ['#4caf50', '✓ Live übernommen'],
+      error: ['#ff003c', '⚠️ Automatisches Speichern fehlgeschlagen'],
+    };
+    const state = states[this._saveState];
+    return html`
+      <span style="font-size: 12px; margin-right: 15px; color: ${state ? state[0] : '#888'};">
+        ${state ? state[1] : ''}
+        ${this.reloadPending() ? html`<br><span style="color: #fdd835;">Broadcast-Modus wird erst beim Speichern übernommen (Integration wird neu geladen).</span>` : ''}
+      </span>
+    `;
+  },
+
+  renderSettings() {
+    return html`
+  <div class="card edit-card" >
+        <h2>🛠️ Sensoren & Konfiguration</h2>
+        <p style="color:#aaa; font-size:14px; margin-bottom: 25px;">Verknüpfe hier deine Home Assistant Sensoren, die auf dem ESP32 Display angezeigt werden sollen.</p>
+        
+        <div class="tech-box">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <h3 style="color: #fdd835; margin-top: 0;">⚡ Kern-Sensoren (Live) - Seite 1</h3>
+                <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
+                    <input type="checkbox" name="enable_page1" .checked="${this.editConfig.enable_page1 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #fdd835;">
+                    Aktivieren
+                </label>
+            </div>
+            
+            <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff; margin-bottom: 15px; background: rgba(255,255,255,0.05); padding: 5px 10px; border-radius: 4px; width: fit-content;">
+                <input type="checkbox" name="show_kw" .checked="${this.editConfig.show_kw === true}" @change="${this.handleFormInput}" style="width: 16px; height: 16px; accent-color: #fdd835;">
+                Leistung in Kilowatt (kW) anzeigen anstatt in Watt (W)
+            </label>
+
+            <div class="form-row">
+                <div class="form-group flex-1">
+                  <label style="display: flex; align-items: center;">
+                    Solar Leistung (W)
+                    <span class="tooltip" data-tooltip="Dein aktueller PV-Ertrag. Das sollte ein Sensor sein, der die momentane Leistung ausgibt (in Watt).">
+                      <svg viewBox="0 0 24 24" width="14" height="14" fill="currentColor"><path d="M11 18h2v-2h-2v2zm1-16C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8zm0-14c-2.21 0-4 1.79-4 4h2c0-1.1.9-2 2-2s2 .9 2 2c0 2-3 1.75-3 5h2c0-2.25 3-2.5 3-5 0-2.21-1.79-4-4-4z"/></svg>
+                    </span>
+                  </label>
+                  ${this.renderEntitySelect('solar_entity', ['sensor', 'input_number'])}
+                </div>
+                <div class="form-group flex-1">
+                  <label style="display: flex; align-items: center;">
+                    Netz Leistung (W)
+                    <span class="tooltip" data-tooltip="Dein Momentanverbrauch vom Stromzähler (meist in Watt). Achtung: Die Einspeisung ins Netz muss als negativer Wert vom Sensor kommen!">
+                      <svg viewBox="0 0 24 24" width="14" height="14" fill="currentColor"><path d="M11 18h2v-2h-2v2zm1-16C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8zm0-14c-2.21 0-4 1.79-4 4h2c0-1.1.9-2 2-2s2 .9 2 2c0 2-3 1.75-3 5h2c0-2.25 3-2.5 3-5 0-2.21-1.79-4-4-4z"/></svg>
+                    </span>
+                  </label>
+                  ${this.renderEntitySelect('grid_entity', ['sensor', 'input_number'])}
+                </div>
+            </div>
+
+  <div class="form-row">
+    <div class="form-group flex-1">
+      <label>Hausverbrauch (W)</label>
+      ${this.renderEntitySelect('house_entity', ['sensor', 'input_number'])}
+                </div>
+  <div class="form-group flex-1">
+    <label>Batterie Leistung (W)</label>
+    ${this.renderEntitySelect('battery_entity', ['sensor', 'input_number'])}
+                </div>
+            </div>
+
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Batterie Füllstand (%)</label>
+                ${this.renderEntitySelect('battery_soc_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+        </div>
+
+        <div class="tech-box" style="margin-top: 20px; border-color: rgba(52, 152, 219, 0.4);">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <h3 style="color: #3498db; margin-top: 0;">📊 Statistik-Sensoren (kWh) - Seite 2</h3>
+                <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
+                    <input type="checkbox" name="enable_page2" .checked="${this.editConfig.enable_page2 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #3498db;">
+                    Aktivieren
+                </label>
+            </div>
+            <div class="form-row">
+                <div class="form-group flex-1">
+                  <label>Ertrag Heute (kWh)</label>
+                  ${this.renderEntitySelect('yield_today_entity', ['sensor', 'input_number'])}
+                </div>
+                <div class="form-group flex-1">
+                  <label>Ertrag Laufender Monat (kWh)</label>
+                  ${this.renderEntitySelect('yield_month_entity', ['sensor', 'input_number'])}
+                </div>
+            </div>
+  <div class="form-row">
+    <div class="form-group flex-1">
+      <label>Ertrag Laufendes Jahr (kWh)</label>
+      ${this.renderEntitySelect('yield_year_entity', ['sensor', 'input_number'])}
+                </div>
+  <div class="form-group flex-1">
+    <label>Gesamtertrag (Lifelime) (kWh)</label>
+    ${this.renderEntitySelect('yield_total_entity', ['sensor', 'input_number'])}
+                </div>
+            </div>
+        </div>
+
+  <div class="tech-box" style="margin-top: 20px; border-color: #00f3ff;">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+      <h3 style="color: #00f3ff; margin-top: 0;">🔮 Eigene Sensoren (Seite 3)</h3>
+      <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
+          <input type="checkbox" name="enable_page3" .checked="${this.editConfig.enable_page3 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #00f3ff;">
+          Aktivieren
+      </label>
+    </div>
+    
+    ${this.editConfig.enable_page3 !== false ? html`
+    <p style="color:#aaa; font-size: 12px; margin-top:-10px; margin-bottom: 15px;">Füge bis zu 4 eigene Sensoren hinzu, welche auf der dritten Seite angezeigt werden.</p>
+
+    <div class="form-row">
+      <div class="form-group flex-1">
+        <label>Name 1 (z.B. Temperatur)</label>
+        <input type="text" name="custom1_name" .value="${this.editConfig.custom1_name || ''}" @input="${this.handleFormInput}">
+      </div>
+      <div class="form-group flex-1">
+        <label>Sensor 1</label>
+        ${this.renderEntitySelect('custom1_entity', ['sensor', 'input_number'])}
+  </div>
+            </div>
+
+  <div class="form-row">
+    <div class="form-group flex-1">
+      <label>Name 2 (z.B. Luftfeuchte)</label>
+      <input type="text" name="custom2_name" .value="${this.editConfig.custom2_name || ''}" @input="${this.handleFormInput}">
+    </div>
+    <div class="form-group flex-1">
+      <label>Sensor 2</label>
+      ${this.renderEntitySelect('custom2_entity', ['sensor', 'input_number'])}
+                </div>
+            </div>
+
+  <div class="form-row">
+    <div class="form-group flex-1">
+      <label>Name 3</label>
+      <input type="text" name="custom3_name" .value="${this.editConfig.custom3_name || ''}" @input="${this.handleFormInput}">
+    </div>
+    <div class="form-group flex-1">
+      <label>Sensor 3</label>
+      ${this.renderEntitySelect('custom3_entity', ['sensor', 'input_number'])}
+                </div>
+            </div>
+
+  <div class="form-row">
+    <div class="form-group flex-1">
+      <label>Name 4</label>
+      <input type="text" name="custom4_name" .value="${this.editConfig.custom4_name || ''}" @input="${this.handleFormInput}">
+    </div>
+    <div class="form-group flex-1">
+      <label>Sensor 4</label>
+      ${this.renderEntitySelect('custom4_entity', ['sensor', 'input_number'])}
+                </div>
+            </div>
+            ` : ''}
+        </div>
+
+        <div class="tech-box" style="margin-top: 20px; border-color: #fdd835;">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+              <h3 style="color: #fdd835; margin-top: 0;">🔮 Eigene Sensoren (Seite 4)</h3>
+              <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
+                  <input type="checkbox" name="enable_page4" .checked="${this.editConfig.enable_page4 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #fdd835;">
+                  Aktivieren
+              </label>
+            </div>
+            
+            ${this.editConfig.enable_page4 !== false ? html`
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 5</label>
+                <input type="text" name="custom5_name" .value="${this.editConfig.custom5_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 5</label>
+                ${this.renderEntitySelect('custom5_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 6</label>
+                <input type="text" name="custom6_name" .value="${this.editConfig.custom6_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 6</label>
+                ${this.renderEntitySelect('custom6_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 7</label>
+                <input type="text" name="custom7_name" .value="${this.editConfig.custom7_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 7</label>
+                ${this.renderEntitySelect('custom7_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 8</label>
+                <input type="text" name="custom8_name" .value="${this.editConfig.custom8_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 8</label>
+                ${this.renderEntitySelect('custom8_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+            ` : ''}
+        </div>
+
+        <div class="tech-box" style="margin-top: 20px; border-color: #ff9800;">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+              <h3 style="color: #ff9800; margin-top: 0;">⛏️ Mining Sensoren (Seite 5)</h3>
+              <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
+                  <input type="checkbox" name="enable_page5" .checked="${this.editConfig.enable_page5 !== false}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #ff9800;">
+                  Aktivieren
+              </label>
+            </div>
+            
+            ${this.editConfig.enable_page5 !== false ? html`
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 1</label>
+                <input type="text" name="mining1_name" .value="${this.editConfig.mining1_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 1</label>
+                ${this.renderEntitySelect('mining1_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 2</label>
+                <input type="text" name="mining2_name" .value="${this.editConfig.mining2_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 2</label>
+                ${this.renderEntitySelect('mining2_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 3</label>
+                <input type="text" name="mining3_name" .value="${this.editConfig.mining3_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 3</label>
+                ${this.renderEntitySelect('mining3_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+
+            <div class="form-row">
+              <div class="form-group flex-1">
+                <label>Name 4</label>
+                <input type="text" name="mining4_name" .value="${this.editConfig.mining4_name || ''}" @input="${this.handleFormInput}">
+              </div>
+              <div class="form-group flex-1">
+                <label>Sensor 4</label>
+                ${this.renderEntitySelect('mining4_entity', ['sensor', 'input_number'])}
+              </div>
+            </div>
+            ` : ''}
+        </div>
+
+        ${[6, 7, 8, 9].map(pageIdx => {
+          const baseIdx = (pageIdx - 6) * 4 + 9;
+          const colorMap = { 6: '#00f3ff', 7: '#00ff73', 8: '#b026ff', 9: '#ff003c' };
+          const color = colorMap[pageIdx];
+          const enableKey = `enable_page${pageIdx}`;
+          
+          return html`
+            <div class="tech-box" style="margin-top: 20px; border-color: ${color};">
+              <div style="display: flex; justify-content: space-between; align-items: center;">
+                <h3 style="color: ${color}; margin-top: 0;">🔮 Eigene Sensoren (Seite ${pageIdx})</h3>
+                <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
+                    <input type="checkbox" name="${enableKey}" .checked="${!!this.editConfig[enableKey]}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: ${color};">
+                    Aktivieren
+                </label>
+              </div>
+              
+              ${!!this.editConfig[enableKey] ? html`
+              <p style="color:#aaa; font-size: 12px; margin-top:-10px; margin-bottom: 15px;">Füge bis zu 4 eigene Sensoren hinzu, welche auf der Seite ${pageIdx} angezeigt werden.</p>
+              ${[0, 1, 2, 3].map(i => {
+                const sensorIdx = baseIdx + i;
+                const nameKey = `custom${sensorIdx}_name`;
+                const entKey = `custom${sensorIdx}_entity`;
+                return html`
+                  <div class="form-row">
+                    <div class="form-group flex-1">
+                      <label>Name ${sensorIdx}</label>
+                      <input type="text" name="${nameKey}" .value="${this.editConfig[nameKey] || ''}" @input="${this.handleFormInput}">
+                    </div>
+                    <div class="form-group flex-1">
+                      <label>Sensor ${sensorIdx}</label>
+                      ${this.renderEntitySelect(entKey, ['sensor', 'input_number'])}
+                    </div>
+                  </div>
+                `;
+              })}
+              ` : ''}
+            </div>
+          `;
+        })}
+
+        <div class="tech-box" style="margin-top: 20px; border-color: rgba(76, 175, 80, 0.4);">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <h3 style="color: #4caf50; margin-top: 0;">📈 Verlauf 24 h (Seite 10)</h3>
+                <label style="display: flex; align-items: center; gap: 10px; cursor: pointer; color: #fff;">
+                    <input type="checkbox" name="enable_page10" .checked="${!!this.editConfig.enable_page10}" @change="${this.handleFormInput}" style="width: 18px; height: 18px; accent-color: #4caf50;">
+                    Aktivieren
+                </label>
+            </div>
+            <p style="color:#aaa; font-size: 12px; margin: 0;">
+              Diagramm für Solar, Netz, Haus und Batterie (Min/Mittel/Max je 15 Minuten). HA sammelt die Werte selbst im Speicher,
+              das Display braucht keinen Zugriff auf den Recorder. Benötigt eine Firmware mit Diagramm-Seite.
+            </p>
+        </div>
+        
+        <div class="tech-box" style="margin-top: 20px; border-color: rgba(155, 89, 182, 0.4);">
+            <h3 style="color: #9b59b6; margin-top: 0;">⚙️ Allgemeine Eigenschaften</h3>
+            
+            <div class="form-row">
+                <div class="form-group flex-1">
+                  <label>Update Intervall (Sekunden)</label>
+                  <input type="number" name="update_interval" min="1" .value="${this.editConfig.update_interval || 5}" @input="${this.handleFormInput}">
+                  <small>Wie oft sollen Daten zum ESP32 gesendet werden?</small>
+                </div>
+                ${(this.editConfig.page_switch_mode || 'auto') !== 'touch' ? html`
+                <div class="form-group flex-1">
+                  <label>Seitenwechsel Intervall (Sekunden)</label>
+                  <input type="number" name="page_interval" min="5" .value="${this.editConfig.page_interval || 10}" @input="${this.handleFormInput}">
+                  <small>Wie lange eine Seite auf dem LCD angezeigt wird.</small>
+                </div>
+                ` : html`
+                <div class="form-group flex-1" style="opacity:0.4; pointer-events:none;">
+                  <label>Seitenwechsel Intervall (Sekunden)</label>
+                  <input type="number" value="${this.editConfig.page_interval || 10}" disabled>
+                  <small>⚠️ Nicht aktiv im Touch-Modus</small>
+                </div>
+                `}
+            </div>
+            ${(this.editConfig.page_switch_mode || 'auto') !== 'touch' && (this.editConfig.page_rotation_source || 'ha') === 'ha' ? this.renderPageDwell() : ''}
+
+            <div style="margin-top: 15px; margin-bottom: 20px; padding: 15px; background: rgba(76,175,80,0.05); border: 1px solid rgba(76,175,80,0.3); border-radius: 8px;">
+              <label style="display: flex; align-items: flex-start; gap: 10px; cursor: pointer; color: #fff; margin: 0;">
+                  <input type="checkbox" name="push_mode" .checked="${this.editConfig.push_mode !== false}" @change="${this.handleFormInput}" style="width: 20px; height: 20px; accent-color: #4caf50; margin-top: 3px; flex-shrink: 0;">
+                  <div>
+                    <div style="font-weight: bold; color: #4caf50; font-size: 15px;">Push-Modus (nur bei Änderungen senden)</div>
+                    <div style="color: #aaa; font-size: 13px; margin-top: 5px; line-height: 1.5;">
+                      Statt fest alle X Sekunden zu senden, reagiert HA sofort auf Sensor-Änderungen und bündelt schnelle Wechsel.
+                      Das Update Intervall gilt dann nur noch im klassischen Modus.
+                    </div>
+                  </div>
+              </label>
+              ${this.editConfig.push_mode !== false ? html`
+              <div class="form-row" style="margin-top: 15px; margin-bottom: 0;">
+                <div class="form-group flex-1">
+                  <label>Bündelungsfenster (Sekunden)</label>
+                  <input type="number" name="push_debounce" min="0" step="0.1" .value="${this.editConfig.push_debounce !== undefined ? this.editConfig.push_debounce : 0.5}" @input="${this.handleFormInput}">
+                  <small>Änderungen innerhalb dieses Fensters werden zusammengefasst.</small>
+                </div>
+                <div class="form-group flex-1">
+                  <label>Keep-Alive (Sekunden)</label>
+                  <input type="number" name="heartbeat_interval" min="5" .value="${this.editConfig.heartbeat_interval || 60}" @input="${this.handleFormInput}">
+                  <small>Sendet auch ohne Änderungen in diesem Abstand.</small>
+                </div>
+              </div>
+              ` : ''}
+              ${this.renderDeadbands()}
+            </div>
+
+            <div style="margin-top: 15px; margin-bottom: 20px; padding: 15px; background: rgba(0,243,255,0.05); border: 1px solid rgba(0,243,255,0.3); border-radius: 8px;">
+              <label style="display: flex; align-items: flex-start; gap: 10px; cursor: pointer; color: #fff; margin: 0;">
+                  <input type="checkbox" name="broadcast_mode" .checked="${this.editConfig.broadcast_mode === true}" @change="${this.handleFormInput}" style="width: 20px; height: 20px; accent-color: #00f3ff; margin-top: 3px; flex-shrink: 0;">
+                  <div>
+                    <div style="font-weight: bold; color: #00f3ff; font-size: 15px;">Synchron-Modus (Broadcast / Alle Displays) aktivieren</div>
+                    <div style="color: #aaa; font-size: 13px; margin-top: 5px; line-height: 1.5;">
+                      Wenn aktiv, versorgt diese Integration <b>alle</b> deine CYD Displays gleichzeitig mit den exakt gleichen Daten und Einstellungen. <br>
+                      <strong style="color: #4caf50;">Beide Displays bleiben dabei aber völlig unabhängig per Touch-Eingabe bedienbar!</strong>
+                      <br><strong style="color: #ff5252;">WICHTIG bei 2+ Displays:</strong> Aktiviere diesen Haken hier und lösche die zweite "Geräte/Dienste" Karte in Home Assistant! Diese eine reicht nun aus.
+                    </div>
+                  </div>
+              </label>
+              ${this.renderDisplayOverrides()}
+            </div>
+
+            <div style="margin-top: 15px; margin-bottom: 20px;">
+              <h4 style="color: #bbb; margin-bottom: 15px;">🌙 Nacht-Dimming Anzeige</h4>
+              <div class="form-row" style="margin-bottom: 0;">
+                <div class="form-group flex-1">
+                  <label>Start Stunde (0-23)</label>
+                  <input type="number" name="dim_start_time" min="0" max="23" .value="${this.editConfig.dim_start_time !== undefined ? this.editConfig.dim_start_time : 22}" @input="${this.handleFormInput}">
+                </div>
+                <div class="form-group flex-1">
+                  <label>Ende Stunde (0-23)</label>
+                  <input type="number" name="dim_end_time" min="0" max="23" .value="${this.editConfig.dim_end_time !== undefined ? this.editConfig.dim_end_time : 6}" @input="${this.handleFormInput}">
+                </div>
+                <div class="form-group flex-1">
+                  <label>Helligkeit (%)</label>
+                  <input type="number" name="dim_brightness" min="1" max="100" .value="${this.editConfig.dim_brightness !== undefined ? this.editConfig.dim_brightness : 20}" @input="${this.handleFormInput}">
+                </div>
+              </div>
+            </div>
+
+            <!-- Seitenwechsel-Modus -->
+            <div style="margin-top: 20px;">
+              <label style="display:block; margin-bottom: 10px; font-weight: 600; color: #ccc;">Seitenwechsel-Modus</label>
+              <div style="display: flex; gap: 10px; flex-wrap: wrap;">
+                ${['auto', 'touch', 'both'].map(mode => {
+      const labels = {
+        auto: { icon: '🔄', title: 'Automatisch', desc: 'HA wechselt Seiten nach Zeitintervall' },
+        touch: { icon: '👆', title: 'Nur Touch', desc: 'Manuell durch Tippen auf das Display' },
+        both: { icon: '🔄👆', title: 'Beides', desc: 'Auto + Touch-Override (empfohlen)' },
+      }[mode];
+      const isActive = (this.editConfig.page_switch_mode || 'auto') === mode;
+      return html`
+                    <div
+                      @click=${() => { this.editConfig = { ...this.editConfig, page_switch_mode: mode }; this.requestUpdate(); }}
+                      style="
+                        flex: 1; min-width: 130px; cursor: pointer; padding: 14px 12px;
+                        border-radius: 10px; border: 2px solid ${isActive ? '#9b59b6' : 'rgba(155,89,182,0.25)'};
+                        background: ${isActive ? 'rgba(155,89,182,0.18)' : 'rgba(255,255,255,0.03)'};
+                        transition: all 0.2s ease;
+                        box-shadow: ${isActive ? '0 0 15px rgba(155,89,182,0.35)' : 'none'};
+                        text-align: center;
+                      "
+                    >
+                      <div style="font-size: 1.8em; margin-bottom: 6px;">${labels.icon}</div>
+                      <div style="font-weight: 700; color: ${isActive ? '#b26ef7' : '#ddd'}; font-size: 0.95em;">${labels.title}</div>
+                      <div style="font-size: 0.72em; color: #888; margin-top: 4px; line-height: 1.4;">${labels.desc}</div>
+                    </div>
+                  `;
+    })}
+              </div>
+            </div>
+
+            <!-- Seitenwechsel-Steuerung (Rotation Source) -->
+            <div style="margin-top: 25px; background: rgba(0,0,0,0.2); padding: 15px; border-radius: 8px; border: 1px solid rgba(255,255,255,0.05);">
+              <label style="display:block; margin-bottom: 12px; font-weight: 600; color: #ccc;">Seitenwechsel-Steuerung durch</label>
+              <div style="display: flex; gap: 10px; flex-wrap: wrap;">
+                ${['ha', 'display'].map(source => {
+                  const labels = {
+                    ha: { icon: '🏠', title: 'Home Assistant', desc: 'Zentral gesteuert' },
+                    display: { icon: '📱', title: 'Display lokal', desc: 'Jedes Display rotiert selbst' },
+                  }[source];
+                  const isActive = (this.editConfig.page_rotation_source || 'ha') === source;
+                  return html`
+                    <div
+                      @click=${() => { this.editConfig = { ...this.editConfig, page_rotation_source: source }; this.requestUpdate(); }}
+                      style="
+                        flex: 1; min-width: 140px; cursor: pointer; padding: 12px 10px;
+                        border-radius: 8px; border: 2px solid ${isActive ? '#3498db' : 'rgba(52,152,219,0.1)'};
+                        background: ${isActive ? 'rgba(52,152,219,0.15)' : 'rgba(255,255,255,0.02)'};
+                        transition: all 0.2s ease;
+                        text-align: center;
+                      "
+                    >
+                      <div style="font-size: 1.4em; margin-bottom: 4px;">${labels.icon}</div>
+                      <div style="font-weight: 700; color: ${isActive ? '#3498db' : '#aaa'}; font-size: 0.9em;">${labels.title}</div>
+                      <div style="font-size: 0.65em; color: #777; margin-top: 2px;">${labels.desc}</div>
+                    </div>
+                  `;
+                })}
+              </div>
+              <p style="font-size: 0.7em; color: #666; margin-top: 10px; line-height: 1.3;">
+                💡 <b>Display lokal</b> empfohlen bei mehreren Displays mit unterschiedlichen Seiten-Speicherungen.
+              </p>
+            </div>
+        </div>
+        </div>
+
+        <div class="form-actions" style="margin-top: 30px; border-top: 1px solid rgba(255,255,255,0.1); padding-top: 20px; text-align: right;">
+            ${this.renderSaveState()}
+            <button class="btn-save" @click="${this.saveConfig}">💾 Konfiguration Speichern & Anwenden</button>
+        </div>
+      </div>
+  `;
+  },
+};
@@ -0,0 +1,118 @@
+// Display update tab: firmware cards and version check.
+// Wird erst beim Öffnen des Tabs geladen, die Methoden landen auf CYDPreview.prototype.
+import { html } from "https://unpkg.com/lit-element@2.4.0/lit-element.js?module";
+
+export const methods = {
+  async checkUpdate() {
+    if (!this.panel || !this.panel.config || !this.panel.config.entry_id) return;
+    const entryId = this.panel.config.entry_id;
+    this._checkingUpdate = true;
+    this.requestUpdate();
+
+    try {
+      const data = await this.hass.callApi('POST', `cyd_solar_display/check_update/${entryId}`);
+      this.latestVersion = data.latest_version || "0.0.0";
+      
+      if (data.updated) {
+        // Version changed
+      } else {
+        alert("ℹ️ Du bist bereits auf dem neuesten Stand!");
+      }
+    } catch (e) {
+      console.error("Manual update check failed", e);
+      alert("❌ Fehler beim Abrufen der Version.");
+    } finally {
+      this._checkingUpdate = false;
+      this.requestUpdate();
+    }
+  },
+
+  async triggerUpdate(entityId) {
+    if (!confirm("Firmware Update starten? Das Display wird danach neu gestartet.")) return;
+    try {
+      await this.hass.callService("update", "install", { entity_id: entityId });
+      alert("✅ Update-Befehl wurde gesendet!");
+    } catch (e) {
+      console.error(e);
+      alert("❌ Fehler beim Senden des Updates.");
+    }
+  },
+
+  renderUpdateCard(entity) {
+    const isUpdateAvailable = entity.state === 'on';
+    const inProgress = entity.attributes.in_progress === true || typeof entity.attributes.in_progress === 'number' || entity.attributes.update_action === 'installing';
+    const percent = entity.attributes.update_percentage ?? (typeof entity.attributes.in_progress === 'number' ? entity.attributes.in_progress : null);
+    let installed = entity.attributes.installed_version || 'Unbekannt';
+    let latest = entity.attributes.latest_version || 'Unbekannt';
+    const name = entity.attributes.friendly_name || entity.entity_id;
+    const ip = entity.attributes.display_ip || 'Unbekannt';
+
+    if (!installed.startsWith('v') && installed !== 'Unbekannt') installed = 'v' + installed;
+    if (!latest.startsWith('v') && latest !== 'Unbekannt') latest = 'v' + latest;
+
+    return html`
+      <div class="tech-box" style="margin-bottom: 15px; border-color: ${isUpdateAvailable ? '#00f3ff' : 'rgba(255,255,255,0.1)'}; background: ${isUpdateAvailable ? 'rgba(0, 243, 255, 0.05)' : 'rgba(0,0,0,0.2)'};">
+        <div style="display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap; gap: 20px;">
+          <div style="flex: 1; min-width: 250px;">
+            <h3 style="margin: 0; color: #fff; display: flex; align-items: center; gap: 12px;">
+              <span style="font-size: 1.4em; filter: drop-shadow(0 0 5px ${isUpdateAvailable ? '#00f3ff' : '#4caf50'});">${isUpdateAvailable ? '🆕' : '📱'}</span> 
+              ${name}
+              <span style="font-size: 14px; font-weight: 500; color: #aaa; background: rgba(255,255,255,0.08); padding: 2px 8px; border-radius: 4px; border: 1px solid rgba(255,255,255,0.1);">🌐 ${ip}</span>
+            </h3>
+            <div style="margin-top: 8px; font-size: 14px; color: #aaa;">
+              Installiert: <span style="color: #fff; font-weight: bold;">${installed}</span> | 
+              Aktuell verfügbar: <span style="${isUpdateAvailable ? 'color: #00f3ff; font-weight: bold;' : 'color: #aaa;'}">${latest}</span>
+            </div>
+          </div>
+          <div>
+            ${inProgress ? html`
+              <div style="color: #fdd835; font-weight: bold; background: rgba(253,216,53,0.1); padding: 10px 15px; border-radius: 6px; border: 1px solid rgba(253,216,53,0.3); display: flex; align-items: center; gap: 8px;">
+                ⏳ Update läuft...${percent != null ? html` ${Math.round(percent)} %` : ''}
+              </div>
+            ` : isUpdateAvailable ? html`
+              <button 
+                @click="${() => this.triggerUpdate(entity.entity_id)}"
+                style="display: inline-flex; align-items: center; justify-content: center; background: linear-gradient(135deg, #00f3ff 0%, #0084ff 100%); color: #000; padding: 12px 25px; border-radius: 8px; border:none; font-size: 14px; font-weight: 900; box-shadow: 0 4px 15px rgba(0, 243, 255, 0.4); cursor: pointer; transition: transform 0.2s, box-shadow 0.2s; text-transform: uppercase; letter-spacing: 1px;"
+                onmouseover="this.style.transform='scale(1.05)'; this.style.boxShadow='0 6px 20px rgba(0, 243, 255, 0.6)';" 
+                onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 15px rgba(0, 243, 255, 0.4)';"
+              >
+                🚀 Update Starten
+              </button>
+            ` : html`
+              <div style="background: rgba(76, 175, 80, 0.1); color: #4caf50; padding: 8px 16px; border-radius: 6px; border: 1px solid rgba(76, 175, 80, 0.3); font-size: 13px; font-weight: 700; display: flex; align-items: center; gap: 8px;">
+                 <div style="width: 8px; height: 8px; background: #4caf50; border-radius: 50%; box-shadow: 0 0 8px #4caf50;"></div>
+                 Auf dem neuesten Stand
+              </div>
+            `}
+          </div>
+        </div>
+      </div>
+    `;
+  },
+
+  renderUpdates() {
+    if (!this.hass) return html``;
+    
+    // Find all update entities that match CYD Solar Display
+    // ONLY display update entities that have a non-undefined display_ip attribute (thereby excluding ESPHome's internal updates)
+    const cydUpdates = Object.keys(this.hass.states)
+      .filter(eid => eid.startsWith('update.'))
+      .map(eid => this.hass.states[eid])
+      .filter(state => state.attributes.display_ip !== undefined);
+
+    return html`
+      <div class="card edit-card">
+        <h2>🚀 Display Firmware Updates</h2>
+        <p style="color:#aaa; font-size:14px; margin-bottom: 25px;">
+          Hier siehst du alle verbundenen CYD Solar Displays und kannst gezielt Updates anstoßen.
+        </p>
+
+        ${cydUpdates.length === 0 ? html`
+          <div style="background: rgba(255,255,255,0.05); padding: 20px; border-radius: 8px; text-align: center; color: #888;">
+            Keine Displays aus dem Custom Component gefunden (oder ein Neustart ist nach dem Integration-Update nötig).
+          </div>
+        ` : cydUpdates.map(entity => this.renderUpdateCard(entity))}
+      </div>
+    `;
+  },
+};
@@ -0,0 +1,231 @@
+"""Fake Home Assistant objects for benchmarking the coordinator offline.
+
+Only what the coordinator tick touches is simulated: the state machine,
+ESPHome config entries, the entity registry and the service registry. All
+timer and listener helpers are replaced by no-ops so a tick runs without a
+real Home Assistant instance.
+"""
+import asyncio
+import types
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+
+from custom_components.cyd_solar_display import coordinator as coordinator_mod  # noqa: E402
+from custom_components.cyd_solar_display import discovery as discovery_mod  # noqa: E402
+from custom_components.cyd_solar_display import version as version_mod  # noqa: E402
+from custom_components.cyd_solar_display.const import (  # noqa: E402
+    CONF_BROADCAST_MODE,
+    CONF_HOST,
+    CONF_PUSH_MODE,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CORE_SLOTS,
+    CUSTOM_SLOTS,
+    DOMAIN,
+    PAGE_DEFAULTS,
+)
+from custom_components.cyd_solar_display.discovery import (  # noqa: E402
+    DISPLAY_SERVICE_PREFIX,
+    DISPLAY_SERVICE_SUFFIX,
+    PARTIAL_SERVICE_SUFFIX,
+)
+
+HOST = "192.168.1.50"
+
+
+def _noop(*_args, **_kwargs):
+    """Return an unsubscribe callback that does nothing."""
+    return lambda: None
+
+
+class FakeState:
+    """Minimal stand-in for homeassistant.core.State."""
+
+    __slots__ = ("entity_id", "state", "attributes")
+
+    def __init__(self, entity_id, state, attributes=None):
+        self.entity_id = entity_id
+        self.state = state
+        self.attributes = attributes or {}
+
+
+class FakeStates:
+    """State machine backed by a plain dict."""
+
+    def __init__(self):
+        self._states = {}
+
+    def get(self, entity_id):
+        return self._states.get(entity_id)
+
+    def async_set(self, entity_id, state, attributes=None):
+        self._states[entity_id] = FakeState(entity_id, str(state), attributes)
+
+
+class FakeConfigEntry:
+    """Minimal stand-in for a ConfigEntry."""
+
+    def __init__(self, domain, title, data=None, options=None, entry_id=None):
+        self.domain = domain
+        self.title = title
+        self.data = data or {}
+        self.options = options or {}
+        self.entry_id = entry_id or f"{domain}_{title}"
+
+    def async_on_unload(self, func):
+        pass
+
+
+class FakeConfigEntries:
+    """Config entry registry grouped by domain."""
+
+    def __init__(self):
+        self._entries = {}
+
+    def async_add(self, entry):
+        self._entries.setdefault(entry.domain, []).append(entry)
+
+    def async_entries(self, domain=None):
+        return list(self._entries.get(domain, []))
+
+
+class FakeServices:
+    """Service registry that records every call."""
+
+    def __init__(self):
+        self._services = {}
+        self.calls = 0
+        self.payload_bytes = 0
+
+    def async_register(self, domain, service):
+        self._services.setdefault(domain, {})[service] = None
+
+    def async_services(self):
+        return self._services
+
+    async def async_call(self, domain, service, service_data=None, blocking=False):
+        self.calls += 1
+        self.payload_bytes += len(repr(service_data))
+
+
+class FakeRegistryEntry:
+    """Entity registry entry with only the fields discovery reads."""
+
+    __slots__ = ("entity_id", "domain")
+
+    def __init__(self, entity_id):
+        self.entity_id = entity_id
+        self.domain = entity_id.split(".", 1)[0]
+
+
+class FakeEntityRegistry:
+    """Entity registry indexed by config entry id."""
+
+    def __init__(self):
+        self.by_entry = {}
+
+    def async_add(self, config_entry_id, entity_id):
+        self.by_entry.setdefault(config_entry_id, []).append(FakeRegistryEntry(entity_id))
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for CYDSolarCoordinator."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.data = {}
+        self.states = FakeStates()
+        self.config_entries = FakeConfigEntries()
+        self.services = FakeServices()
+        self.entity_registry = FakeEntityRegistry()
+        self.bus = types.SimpleNamespace(async_listen=_noop, async_listen_once=_noop)
+        self.config = types.SimpleNamespace(path=lambda *parts: "/".join(("/tmp", *parts)))
+
+    def async_create_task(self, target, *_args, **_kwargs):
+        return self.loop.create_task(target)
+
+
+@pytest.fixture
+def loop():
+    """Dedicated event loop driving the benchmarked ticks."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def inert_helpers(monkeypatch):
+    """Replace timer, listener and registry helpers with fakes."""
+    monkeypatch.setattr(coordinator_mod, "async_track_state_change_event", _noop)
+    monkeypatch.setattr(coordinator_mod, "async_call_later", _noop)
+    monkeypatch.setattr(coordinator_mod, "async_track_time_interval", _noop)
+    monkeypatch.setattr(coordinator_mod, "async_dispatcher_connect", _noop)
+    monkeypatch.setattr(version_mod, "async_call_later", _noop)
+    monkeypatch.setattr(discovery_mod, "async_dispatcher_connect", _noop)
+    monkeypatch.setattr(
+        discovery_mod,
+        "er",
+        types.SimpleNamespace(
+            EVENT_ENTITY_REGISTRY_UPDATED="entity_registry_updated",
+            async_get=lambda hass: hass.entity_registry,
+            async_entries_for_config_entry=lambda reg, entry_id: reg.by_entry.get(entry_id, []),
+        ),
+    )
+
+
+def slot_options(slot_count):
+    """Return options with the first slot_count display slots bound to sensors."""
+    options = {f"enable_page{page}": True for page in PAGE_DEFAULTS}
+    conf_keys = [conf_key for _key, conf_key in CORE_SLOTS]
+    conf_keys += [f"{prefix}_entity" for _idx, prefix, _name, _page in CUSTOM_SLOTS]
+    for n, conf_key in enumerate(conf_keys[:slot_count]):
+        options[conf_key] = f"sensor.bench_{n}"
+    return options
+
+
+@pytest.fixture
+def make_hass(loop):
+    """Build a populated FakeHass.
+
+    slot_count sensors are bound to display slots, esphome_entries ESPHome
+    entries exist (the one matching the configured host is last, so the
+    discovery scan walks all of them) and displays CYD services are
+    registered, each with a partial update service.
+    """
+
+    def _make(slot_count, esphome_entries, displays, options=None):
+        hass = FakeHass(loop)
+
+        for n in range(esphome_entries):
+            host = HOST if n == esphome_entries - 1 else f"10.0.{n // 250}.{n % 250}"
+            esp_entry = FakeConfigEntry("esphome", f"cyd-node-{n}", {"host": host, "name": f"cyd-node-{n}"})
+            hass.config_entries.async_add(esp_entry)
+            for platform in ("sensor", "switch", "update"):
+                hass.entity_registry.async_add(esp_entry.entry_id, f"{platform}.cyd_node_{n}")
+
+        for n in range(displays):
+            name = f"cyd_node_{esphome_entries - 1 - n}"
+            hass.services.async_register("esphome", f"{DISPLAY_SERVICE_PREFIX}{name}{DISPLAY_SERVICE_SUFFIX}")
+            hass.services.async_register("esphome", f"{DISPLAY_SERVICE_PREFIX}{name}{PARTIAL_SERVICE_SUFFIX}")
+        # Dienste anderer ESPHome-Geräte, die die Discovery überspringen muss
+        for n in range(esphome_entries):
+            hass.services.async_register("esphome", f"cyd_node_{n}_restart")
+
+        for n in range(slot_count):
+            hass.states.async_set(f"sensor.bench_{n}", 1000 + n, {"unit_of_measurement": "W"})
+
+        entry_options = slot_options(slot_count)
+        entry_options[CONF_BROADCAST_MODE] = displays > 1
+        entry_options[CONF_PUSH_MODE] = True
+        # Rate-Limit praktisch aus, gemessen wird der Push-Pfad selbst
+        entry_options[CONF_RATE_LIMIT] = 1e9
+        entry_options[CONF_RATE_BURST] = 1_000_000
+        entry_options.update(options or {})
+        entry = FakeConfigEntry(DOMAIN, "CYD Bench", {CONF_HOST: HOST}, entry_options, "bench_entry")
+        hass.config_entries.async_add(entry)
+        return hass, entry
+
+    return _make
@@ -0,0 +1,107 @@
+"""Benchmarks for one CYDSolarCoordinator tick (_async_update_data).
+
+Run with:
+
+    pip install -r requirements_test.txt
+    pytest tests/benchmarks --benchmark-only --benchmark-save=coordinator
+
+and compare against a saved run with ``--benchmark-compare``. Besides the
+timings every benchmark stores service calls, payload bytes and tracemalloc
+figures per tick in ``extra_info``.
+"""
+import tracemalloc
+
+import pytest
+
+from custom_components.cyd_solar_display.coordinator import CYDSolarCoordinator
+
+ROUNDS = 200
+ALLOC_TICKS = 50
+
+
+def _alloc_per_tick(run_tick, ticks=ALLOC_TICKS):
+    """Return (peak bytes, allocated blocks) per tick measured with tracemalloc."""
+    run_tick()  # Caches und Display-Zustand vorwärmen
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        for _ in range(ticks):
+            run_tick()
+        _current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return peak, blocks / ticks
+
+
+def _bench_tick(benchmark, loop, hass, entry, *, changing, cold_discovery):
+    """Benchmark one tick and attach call and allocation figures."""
+    coordinator = CYDSolarCoordinator(hass, entry)
+    counter = {"n": 0, "ticks": 0}
+    entity_ids = sorted(coordinator.slots.entity_ids)
+
+    def prepare():
+        if changing:
+            # Jede Runde neue Werte, damit wirklich Deltas gesendet werden
+            counter["n"] += 1
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, 1000 + counter["n"], {"unit_of_measurement": "W"})
+        if cold_discovery:
+            coordinator.targets._async_invalidate()
+
+    def tick():
+        counter["ticks"] += 1
+        loop.run_until_complete(coordinator._async_update_data())
+
+    def run_tick():
+        prepare()
+        tick()
+
+    run_tick()  # erster, voller Push ist nicht Teil der Messung
+    calls_before = hass.services.calls
+    bytes_before = hass.services.payload_bytes
+    ticks_before = counter["ticks"]
+
+    benchmark.pedantic(tick, setup=prepare, rounds=ROUNDS, warmup_rounds=5, iterations=1)
+
+    ticks = counter["ticks"] - ticks_before
+    benchmark.extra_info["service_calls_per_tick"] = (hass.services.calls - calls_before) / ticks
+    benchmark.extra_info["payload_bytes_per_tick"] = (hass.services.payload_bytes - bytes_before) / ticks
+    peak, blocks = _alloc_per_tick(run_tick)
+    benchmark.extra_info["alloc_peak_bytes"] = peak
+    benchmark.extra_info["alloc_blocks_per_tick"] = blocks
+
+    coordinator.async_unload()
+    return coordinator
+
+
+@pytest.mark.parametrize("slot_count", [5, 20, 39])
+@pytest.mark.parametrize("changing", [False, True], ids=["steady", "changing"])
+def test_tick_slot_count(benchmark, loop, make_hass, slot_count, changing):
+    """Tick cost by number of configured display slots (one display)."""
+    hass, entry = make_hass(slot_count=slot_count, esphome_entries=1, displays=1)
+    coordinator = _bench_tick(benchmark, loop, hass, entry, changing=changing, cold_discovery=False)
+    if not changing:
+        # Unveränderte Werte dürfen keinen Dienstaufruf auslösen
+        assert benchmark.extra_info["service_calls_per_tick"] == 0
+    assert coordinator.displays
+
+
+@pytest.mark.parametrize("esphome_entries", [1, 50, 500])
+@pytest.mark.parametrize("cold_discovery", [False, True], ids=["cached", "cold"])
+def test_tick_esphome_entries(benchmark, loop, make_hass, esphome_entries, cold_discovery):
+    """Tick cost by number of ESPHome entries, with and without the discovery cache."""
+    hass, entry = make_hass(slot_count=39, esphome_entries=esphome_entries, displays=1)
+    _bench_tick(benchmark, loop, hass, entry, changing=True, cold_discovery=cold_discovery)
+    assert benchmark.extra_info["service_calls_per_tick"] == 1
+
+
+@pytest.mark.parametrize("displays", [1, 2, 6])
+def test_tick_broadcast_displays(benchmark, loop, make_hass, displays):
+    """Tick cost by number of displays reached in broadcast mode."""
+    hass, entry = make_hass(slot_count=39, esphome_entries=max(displays, 10), displays=displays)
+    coordinator = _bench_tick(benchmark, loop, hass, entry, changing=True, cold_discovery=False)
+    assert len(coordinator.displays) == displays
+    assert benchmark.extra_info["service_calls_per_tick"] == displays
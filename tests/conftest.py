@@ -0,0 +1,7 @@
+"""Make the custom component importable as custom_components.cyd_solar_display."""
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)